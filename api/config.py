@@ -20,6 +20,22 @@ class ScraperConfig:
     log_level: str = 'INFO'
     log_requests: bool = True
     
+    # 0 parses inline on the fetching thread; >0 uses a process pool of that size
+    parse_workers: int = 0
+    
+    # Per-process memo of unit/category results by product name; 0 disables it
+    name_memo_size: int = 10000
+    name_memo_dir: str = ''
+    
+    # Bounds of the in-process government wage cache (LRU eviction)
+    gov_wage_cache_max_entries: int = 256
+    gov_wage_cache_max_bytes: int = 64 * 1024 * 1024
+    
+    # Regions scraped at once by a full government wage refresh, and the
+    # minimum seconds between the page loads of all its workers together
+    gov_wage_scrape_workers: int = 2
+    gov_wage_request_interval: float = 5.0
+    
     gemilang_base_url: str = 'https://gemilang-store.com'
     gemilang_search_path: str = '/pusat/shop'
 
@@ -45,6 +61,13 @@ class ScraperConfig:
             cache_ttl=int(os.getenv('SCRAPER_CACHE_TTL', '300')),
             log_level=os.getenv('SCRAPER_LOG_LEVEL', 'INFO'),
             log_requests=os.getenv('SCRAPER_LOG_REQUESTS', 'true').lower() == 'true',
+            parse_workers=int(os.getenv('SCRAPER_PARSE_WORKERS', '0')),
+            name_memo_size=int(os.getenv('SCRAPER_NAME_MEMO_SIZE', '10000')),
+            name_memo_dir=os.getenv('SCRAPER_NAME_MEMO_DIR', ''),
+            gov_wage_cache_max_entries=int(os.getenv('GOV_WAGE_CACHE_MAX_ENTRIES', '256')),
+            gov_wage_cache_max_bytes=int(os.getenv('GOV_WAGE_CACHE_MAX_BYTES', str(64 * 1024 * 1024))),
+            gov_wage_scrape_workers=int(os.getenv('GOV_WAGE_SCRAPE_WORKERS', '2')),
+            gov_wage_request_interval=float(os.getenv('GOV_WAGE_REQUEST_INTERVAL', '5.0')),
             gemilang_base_url=os.getenv('GEMILANG_BASE_URL', 'https://gemilang-store.com'),
             gemilang_search_path=os.getenv('GEMILANG_SEARCH_PATH', '/pusat/shop'),
             mitra10_base_url=os.getenv('MITRA10_BASE_URL', 'https://www.mitra10.com'),
@@ -67,6 +90,13 @@ class ScraperConfig:
             'cache_ttl': self.cache_ttl,
             'log_level': self.log_level,
             'log_requests': self.log_requests,
+            'parse_workers': self.parse_workers,
+            'name_memo_size': self.name_memo_size,
+            'name_memo_dir': self.name_memo_dir,
+            'gov_wage_cache_max_entries': self.gov_wage_cache_max_entries,
+            'gov_wage_cache_max_bytes': self.gov_wage_cache_max_bytes,
+            'gov_wage_scrape_workers': self.gov_wage_scrape_workers,
+            'gov_wage_request_interval': self.gov_wage_request_interval,
             'gemilang_base_url': self.gemilang_base_url,
             'gemilang_search_path': self.gemilang_search_path,
             'mitra10_base_url': self.mitra10_base_url,
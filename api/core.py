@@ -2,15 +2,16 @@ import requests
 import logging
 import time
 import re
-from typing import List, Optional, Union, Any
+from typing import List, Optional, Tuple, Union, Any
 from urllib.parse import urlencode, urljoin
 
 from .interfaces import (
-    IHttpClient, IUrlBuilder, IHtmlParser, IPriceScraper,
+    IHttpClient, IUrlBuilder, IHtmlParser, IPriceScraper, IParseExecutor,
     Product, ScrapingResult,
     HttpClientError, UrlBuilderError, HtmlParserError, ScraperError
 )
 from .config import config
+from .parse_executor import get_parse_executor
 
 logger = logging.getLogger(__name__)
 
@@ -122,16 +123,28 @@ class BaseUrlBuilder(IUrlBuilder):
 
 class BasePriceScraper(IPriceScraper):
     
-    def __init__(self, http_client: IHttpClient, url_builder: IUrlBuilder, html_parser: IHtmlParser):
+    def __init__(self, http_client: IHttpClient, url_builder: IUrlBuilder, html_parser: IHtmlParser,
+                 parse_executor: IParseExecutor = None):
         self.http_client = http_client
         self.url_builder = url_builder
         self.html_parser = html_parser
+        self.parse_executor = parse_executor or get_parse_executor()
+    
+    def fetch_html(self, keyword: str, sort_by_price: bool = True, page: int = 0) -> Tuple[str, str]:
+        """Network half of scrape_products: returns (url, raw html) without parsing."""
+        url = self.url_builder.build_search_url(keyword, sort_by_price, page)
+        return url, self.http_client.get(url)
+    
+    def _parse_html(self, html_content: str) -> List[Product]:
+        executor = getattr(self, 'parse_executor', None)
+        if executor is None:
+            return self.html_parser.parse_products(html_content)
+        return executor.parse(self.html_parser, html_content)
     
     def scrape_products(self, keyword: str, sort_by_price: bool = True, page: int = 0) -> ScrapingResult:
         try:
-            url = self.url_builder.build_search_url(keyword, sort_by_price, page)
-            html_content = self.http_client.get(url)
-            products = self.html_parser.parse_products(html_content)
+            url, html_content = self.fetch_html(keyword, sort_by_price, page)
+            products = self._parse_html(html_content)
             
             return ScrapingResult(
                 products=products,
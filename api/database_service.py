@@ -0,0 +1,325 @@
+# api/database_service.py
+"""
+Shared write path for the vendor product tables.
+
+Every vendor stores scraped products in its own table with the same shape,
+so the save logic lives here once and each vendor service only declares its
+table, lookup key and any differences in validation or result format.
+
+``save_with_price_update`` works on the whole batch instead of row by row:
+existing products are matched with one ``UNION ALL`` lookup per chunk of keys, new
+products are inserted with one ``executemany`` and price changes are written
+with one ``UPDATE ... CASE`` per chunk. Detected anomalies go to
+``PriceAnomalyService.save_anomalies`` in bulk.
+
+Batches are validated column by column with ``BatchProductValidator``; rows
+that fail are dropped and reported instead of rejecting the whole batch.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from api.validation import BatchProductValidator, BatchValidationReport
+from db_pricing.anomaly_engine import PriceAnomalyEngine
+from db_pricing.anomaly_service import PriceAnomalyService
+from db_pricing.price_history import PriceHistoryService, item_value
+
+logger = logging.getLogger(__name__)
+
+
+class VendorDatabaseService:
+    """Table-parameterized product writer; subclasses set VENDOR and TABLE"""
+
+    VENDOR = ''
+    TABLE = ''
+
+    # Table and column names are interpolated into SQL, so both are whitelisted
+    ALLOWED_TABLES = {
+        'gemilang_products',
+        'mitra10_products',
+        'depobangunan_products',
+        'juragan_material_products',
+        'tokopedia_products',
+    }
+    ALLOWED_COLUMNS = {
+        'id', 'name', 'price', 'url', 'unit', 'location', 'category', 'created_at', 'updated_at'
+    }
+
+    # Columns identifying a product row
+    KEY_COLUMNS: Tuple[str, ...] = ('name', 'url', 'unit')
+    # Columns written on insert, besides the timestamps
+    INSERT_COLUMNS: Tuple[str, ...] = ('name', 'price', 'url', 'unit', 'location', 'category')
+    # Columns rewritten on every matched row, not only when the price changes
+    REFRESH_COLUMNS: Tuple[str, ...] = ()
+    # Item fields copied into anomaly records
+    ANOMALY_FIELDS: Tuple[str, ...] = ('name', 'url', 'unit')
+
+    # Keyword arguments for BatchProductValidator
+    VALIDATION_RULES: Dict[str, Any] = {}
+
+    # Distinct keys per existing-row lookup; each key is one SELECT of a UNION ALL,
+    # and SQLite allows at most 500 of those per statement
+    LOOKUP_CHUNK_SIZE = 500
+    # Rows per UPDATE statement
+    WRITE_CHUNK_SIZE = 500
+
+    def __init__(self):
+        self._validate_table_name()
+        self._validate_column_names(
+            set(self.KEY_COLUMNS) | set(self.INSERT_COLUMNS) | set(self.REFRESH_COLUMNS)
+        )
+        self.validator = BatchProductValidator(**self.VALIDATION_RULES)
+        self.last_validation: Optional[BatchValidationReport] = None
+
+    def _validate_table_name(self):
+        if self.TABLE not in self.ALLOWED_TABLES:
+            raise ValueError(f"Invalid table name: {self.TABLE}")
+
+    def _validate_column_names(self, columns):
+        for col in columns:
+            if col not in self.ALLOWED_COLUMNS:
+                raise ValueError(f"Invalid column name: {col}")
+
+    def _validate_data(self, data) -> bool:
+        """Whether every item in the batch is valid"""
+        if not data or not isinstance(data, list):
+            return False
+        return self.validator.validate(data).is_valid
+
+    def _screen(self, data) -> List[Any]:
+        """
+        Valid items of a batch; invalid rows are dropped and logged
+
+        The report is kept on ``last_validation`` for callers that surface it.
+        """
+        if not data or not isinstance(data, list):
+            self.last_validation = None
+            return []
+        report = self.validator.validate(data)
+        self.last_validation = report
+        if not report.is_valid:
+            logger.warning(
+                f"Dropped {len(report.rejected_indexes)} of {len(data)} {self.VENDOR} products "
+                f"failing validation: {report.summary()}"
+            )
+        return report.valid_items
+
+    def _clean(self, column: str, value: Any) -> Any:
+        """Normalise a value before it is written; vendors may sanitize further"""
+        return value
+
+    def _row(self, item: Any) -> Dict[str, Any]:
+        """Column values of one scraped item (dict or object)"""
+        return {
+            column: self._clean(column, item_value(item, column, ''))
+            for column in self.INSERT_COLUMNS
+        }
+
+    def _key(self, row: Dict[str, Any]) -> tuple:
+        return tuple(row[column] for column in self.KEY_COLUMNS)
+
+    # =========================
+    # Anomaly handling
+    # =========================
+    def _get_anomaly_engine(self):
+        """Statistical scorer used by the anomaly check; prepared once per save batch"""
+        if getattr(self, '_anomaly_engine', None) is None:
+            self._anomaly_engine = PriceAnomalyEngine(self.VENDOR)
+        return self._anomaly_engine
+
+    def _check_anomaly(self, item, existing_price, new_price) -> Optional[Dict[str, Any]]:
+        """Anomaly record when the price change should be held for review, else None"""
+        if existing_price == 0:
+            return None
+
+        price_diff_pct = ((new_price - existing_price) / existing_price) * 100
+
+        if self._get_anomaly_engine().is_anomaly(item, existing_price, new_price):
+            anomaly = {field: item_value(item, field) for field in self.ANOMALY_FIELDS}
+            anomaly.update({
+                "old_price": existing_price,
+                "new_price": new_price,
+                "change_percent": round(price_diff_pct, 2),
+            })
+            return anomaly
+        return None
+
+    def _save_detected_anomalies(self, anomalies: List[Dict[str, Any]]) -> None:
+        """Save detected anomalies to database for admin review"""
+        if not anomalies:
+            return
+
+        anomaly_result = PriceAnomalyService.save_anomalies(self.VENDOR, anomalies)
+        if not anomaly_result['success']:
+            logger.error(f"Failed to save some anomalies: {anomaly_result['errors']}")
+
+    # =========================
+    # SQL helpers
+    # =========================
+    def _insert_rows(self, cursor, rows: List[Dict[str, Any]], now) -> None:
+        columns = list(self.INSERT_COLUMNS) + ['created_at', 'updated_at']
+        sql = (
+            f"INSERT INTO {self.TABLE} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(['%s'] * len(columns))})"
+        )
+        params_list = [
+            tuple(row[column] for column in self.INSERT_COLUMNS) + (now, now)
+            for row in rows
+        ]
+        cursor.executemany(sql, params_list)
+
+    def _fetch_existing(self, cursor, rows: List[Dict[str, Any]]) -> Dict[tuple, List[Any]]:
+        """
+        Existing rows for the batch, keyed like ``_key``
+
+        Each key is looked up with ``=`` on every key column, one ``UNION ALL``
+        branch per key, so it matches exactly the rows a per-item
+        ``WHERE name = %s AND ...`` would, including the column collation's
+        case and trailing-space rules on MySQL. The lowest id wins when a key
+        is stored twice.
+        """
+        keys = list(dict.fromkeys(self._key(row) for row in rows))
+        match = ' AND '.join(f'{column} = %s' for column in self.KEY_COLUMNS)
+        branch = f"SELECT %s, id, price FROM {self.TABLE} WHERE {match}"
+        existing: Dict[tuple, List[Any]] = {}
+
+        for start in range(0, len(keys), self.LOOKUP_CHUNK_SIZE):
+            chunk = keys[start:start + self.LOOKUP_CHUNK_SIZE]
+            params = []
+            for index, key in enumerate(chunk):
+                params.append(index)
+                params.extend(key)
+            cursor.execute(' UNION ALL '.join([branch] * len(chunk)), params)
+            for index, row_id, price in cursor.fetchall():
+                key = chunk[index]
+                if key not in existing or row_id < existing[key][0]:
+                    existing[key] = [row_id, price]
+        return existing
+
+    def _update_rows(self, cursor, updates: Dict[int, Dict[str, Any]], now) -> None:
+        """Write ``{id: {column: value}}`` with one CASE statement per chunk"""
+        columns = ('price',) + tuple(self.REFRESH_COLUMNS)
+        ids = list(updates)
+
+        for start in range(0, len(ids), self.WRITE_CHUNK_SIZE):
+            chunk = ids[start:start + self.WRITE_CHUNK_SIZE]
+            assignments, params = [], []
+            for column in columns:
+                assignments.append(f"{column} = CASE id {' '.join(['WHEN %s THEN %s'] * len(chunk))} END")
+                for row_id in chunk:
+                    params.extend((row_id, updates[row_id][column]))
+            params.append(now)
+            params.extend(chunk)
+            cursor.execute(
+                f"UPDATE {self.TABLE} SET {', '.join(assignments)}, updated_at = %s "
+                f"WHERE id IN ({', '.join(['%s'] * len(chunk))})",
+                params,
+            )
+
+    # =========================
+    # Write paths
+    # =========================
+    def _bulk_insert(self, data) -> int:
+        now = timezone.now()
+        rows = [self._row(item) for item in data]
+        with transaction.atomic(), connection.cursor() as cursor:
+            self._insert_rows(cursor, rows, now)
+        PriceHistoryService.record_observations(self.VENDOR, data, now)
+        return len(rows)
+
+    def _bulk_upsert(self, data) -> Tuple[int, int, List[Dict[str, Any]]]:
+        """
+        Insert new products and update changed prices for a validated batch
+
+        Items repeating a key within the batch are applied in order, as if each
+        one had been written before the next was read.
+
+        Returns:
+            (updated, inserted, anomalies)
+        """
+        now = timezone.now()
+        self._get_anomaly_engine().prepare(data)
+        rows = [self._row(item) for item in data]
+        updated, anomalies = 0, []
+        inserts: Dict[tuple, Dict[str, Any]] = {}
+        updates: Dict[int, Dict[str, Any]] = {}
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            existing = self._fetch_existing(cursor, rows)
+
+            for item, row in zip(data, rows):
+                key = self._key(row)
+                if key in inserts:
+                    current_price, target = inserts[key]['price'], inserts[key]
+                elif key in existing:
+                    row_id, current_price = existing[key]
+                    target = None
+                else:
+                    inserts[key] = row
+                    continue
+
+                new_price = row['price']
+                if current_price != new_price:
+                    anomaly = self._check_anomaly(item, current_price, new_price)
+                    if anomaly:
+                        # Do NOT update price - wait for admin approval
+                        anomalies.append(anomaly)
+                        logger.warning(
+                            f"Price anomaly detected for {row['name']}: "
+                            f"{current_price} -> {new_price}. Pending admin approval."
+                        )
+                        continue
+                elif not self.REFRESH_COLUMNS:
+                    continue
+
+                changes = {column: row[column] for column in ('price',) + tuple(self.REFRESH_COLUMNS)}
+                if target is None:
+                    updates[row_id] = changes
+                    existing[key][1] = new_price
+                else:
+                    target.update(changes)
+                updated += 1
+
+            if inserts:
+                self._insert_rows(cursor, list(inserts.values()), now)
+            if updates:
+                self._update_rows(cursor, updates, now)
+
+        # Save anomalies to database for review
+        self._save_detected_anomalies(anomalies)
+        PriceHistoryService.record_observations(self.VENDOR, data, now)
+        return updated, len(inserts), anomalies
+
+    # =========================
+    # Public Methods
+    # =========================
+    def save(self, data):
+        """Insert the valid products of a batch; False when none are valid"""
+        valid = self._screen(data)
+        if not valid:
+            return False
+        self._bulk_insert(valid)
+        return True
+
+    def save_with_price_update(self, data):
+        """Insert or update the valid products of a batch, holding back anomalous price changes"""
+        valid = self._screen(data)
+        if not valid:
+            return self._price_update_result(False, 0, 0, [])
+        updated, inserted, anomalies = self._bulk_upsert(valid)
+        return self._price_update_result(True, updated, inserted, anomalies)
+
+    def _rejected(self) -> List[Dict[str, Any]]:
+        return self.last_validation.rejected() if self.last_validation else []
+
+    def _price_update_result(self, success, updated, inserted, anomalies) -> Dict[str, Any]:
+        return {
+            "success": success,
+            "updated": updated,
+            "inserted": inserted,
+            "anomalies": anomalies,
+            "rejected": self._rejected(),
+        }
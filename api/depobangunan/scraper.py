@@ -60,7 +60,7 @@ class DepoPriceScraper(BasePriceScraper):
             html_content = self.http_client.get(url, timeout=30)
             
             # Parse products
-            products = self.html_parser.parse_products(html_content)
+            products = self._parse_html(html_content)
             
             if not products:
                 return ScrapingResult(
@@ -291,7 +291,7 @@ class TestDepoPriceScraperIntegration(unittest.TestCase):
         from api.depobangunan.unit_parser import DepoBangunanUnitExtractor
         extractor = DepoBangunanUnitExtractor()
         
-        with patch('re.search', side_effect=Exception("Regex error")):
+        with patch('api.unit_matcher.UnitPatternMatcher.match', side_effect=Exception("Regex error")):
             with patch('api.depobangunan.unit_parser.logger') as mock_logger:
                 result = extractor._extract_by_priority_patterns("test text")
                 self.assertIsNone(result)
@@ -3,6 +3,9 @@ import logging
 from typing import Optional, Dict, List
 from bs4 import BeautifulSoup
 
+from api.unit_matcher import UnitPatternMatcher, get_unit_pattern_matcher
+from api.utils.name_memo import NameMemo, get_name_memo, normalize_name, rules_fingerprint
+
 logger = logging.getLogger(__name__)
 
 
@@ -11,6 +14,7 @@ class DepoBangunanUnitExtractor:
     def __init__(self):
         self.unit_patterns = self._initialize_unit_patterns()
         self.priority_order = self._initialize_priority_order()
+        self._matcher: Optional[UnitPatternMatcher] = None
     
     def _initialize_unit_patterns(self) -> Dict[str, List[str]]:
         return {
@@ -199,17 +203,16 @@ class DepoBangunanUnitExtractor:
     
     def _extract_by_priority_patterns(self, text_lower: str) -> Optional[str]:
         try:
-            for unit in self.priority_order:
-                patterns = self.unit_patterns.get(unit, [])
-                for pattern in patterns:
-                    pattern_with_boundaries = f'(?:^|\\s|[\\(\\[{{]|\\d)({pattern})(?:\\s|[\\)\\]}}]|$)'
-                    if re.search(pattern_with_boundaries, text_lower, re.IGNORECASE):
-                        return unit
-            return None
+            return self._get_matcher().match(text_lower)
         except Exception as e:
             logger.warning(f"Error in priority pattern extraction: {e}")
             return None
     
+    def _get_matcher(self) -> UnitPatternMatcher:
+        if self._matcher is None:
+            self._matcher = get_unit_pattern_matcher(self.unit_patterns, self.priority_order)
+        return self._matcher
+    
     def _should_default_to_pcs(self, text_lower: str) -> bool:
         pcs_indicators = [
             'sponge', 'brush', 'kuas', 'spons', 'sikat', 'angka', 'number',
@@ -226,9 +229,24 @@ class DepoBangunanUnitParser:
     def __init__(self):
         self.extractor = DepoBangunanUnitExtractor()
         self.spec_keywords = ['ukuran', 'size', 'dimensi', 'berat', 'weight', 'kapasitas', 'volume']
+        self._rules_version: Optional[str] = None
     
     def parse_unit_from_product_name(self, product_name: str) -> Optional[str]:
-        """Parse unit from product name."""
+        """Parse unit from product name, memoized per normalized name."""
+        if not product_name or not isinstance(product_name, str):
+            return self._parse_unit_from_product_name(product_name)
+        
+        return self._get_memo().resolve(
+            normalize_name(product_name),
+            lambda: self._parse_unit_from_product_name(product_name),
+        )
+    
+    def _get_memo(self) -> NameMemo:
+        if self._rules_version is None:
+            self._rules_version = rules_fingerprint(self.extractor.unit_patterns, self.extractor.priority_order)
+        return get_name_memo(f"unit.{type(self).__name__}", self._rules_version)
+    
+    def _parse_unit_from_product_name(self, product_name: str) -> Optional[str]:
         unit = self.extractor.extract_unit_from_name(product_name)
         
         # If unit is None or 'X', default to 'PCS'
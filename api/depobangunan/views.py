@@ -3,6 +3,7 @@ from django.views.decorators.http import require_http_methods
 from .factory import create_depo_scraper, create_depo_location_scraper
 from .database_service import DepoBangunanDatabaseService
 from db_pricing.auto_categorization_service import AutoCategorizationService
+from db_pricing.store_locations import StoreLocationRegistry
 import logging
 
 logger = logging.getLogger(__name__)
@@ -224,28 +225,24 @@ def _parse_top_n(top_n_param):
         return None, _create_error_response('top_n must be a valid integer')
 
 
+def _scrape_locations():
+    """Live Depo Bangunan location scrape; feeds the store location registry"""
+    location_scraper = create_depo_location_scraper()
+    loc_result = location_scraper.scrape_locations(timeout=30)
+    if loc_result.success and loc_result.locations:
+        return loc_result.locations
+    return []
+
+
 def _scrape_location_names():
-    """Scrape location names and return as comma-separated string.
+    """Store location names from the registry as a comma-separated string.
     
     Returns empty string on failure to avoid breaking the main scraping flow.
-    Handles MagicMock objects during testing by checking attributes and converting to string.
+    Handles MagicMock objects during testing since names are converted to strings.
     """
     try:
-        location_scraper = create_depo_location_scraper()
-        loc_result = location_scraper.scrape_locations(timeout=30)
-        
-        if loc_result.success and loc_result.locations:
-            # Handle both real Location objects and MagicMock test objects
-            location_names = []
-            for location in loc_result.locations:
-                if hasattr(location, 'name'):
-                    # Convert to string to handle MagicMock objects
-                    location_names.append(str(location.name))
-            
-            if location_names:
-                return ', '.join(location_names)
-        
-        return ''
+        location_names = StoreLocationRegistry.names('depobangunan', fetch=_scrape_locations)
+        return ', '.join(location_names)
     except Exception as e:
         logger.warning(f"Failed to scrape locations; continuing without locations: {e}")
         return ''
@@ -315,18 +312,8 @@ def scrape_products(request):
             page=page
         )
         
-        # Scrape locations and get location names
-        try:
-            location_scraper = create_depo_location_scraper()
-            loc_result = location_scraper.scrape_locations(timeout=30)
-            if loc_result.success and loc_result.locations:
-                # Join location names into a single string
-                run_location_value = ', '.join([location.name for location in loc_result.locations])
-            else:
-                run_location_value = ''
-        except Exception as e:
-            logger.warning(f"Failed to scrape locations; continuing without locations: {e}")
-            run_location_value = ''
+        # Store location names from the registry
+        run_location_value = _scrape_location_names()
         
         # Convert products to dict and add location
         products_data = [
@@ -113,7 +113,43 @@ class TestScrapeAndSaveEndpoint(TestCase):
         response_data = json.loads(response.content)
         self.assertTrue(response_data['success'])
         self.assertEqual(response_data['saved'], 0)
-    
+
+    def _mock_scraper_with_urls(self, mock_create_scraper, urls):
+        mock_result = MagicMock()
+        mock_result.success = True
+        mock_result.products = []
+        for idx, url in enumerate(urls):
+            mock_product = MagicMock()
+            mock_product.name = f"Product {idx}"
+            mock_product.price = 10000
+            mock_product.url = url
+            mock_product.unit = "PCS"
+            mock_result.products.append(mock_product)
+        mock_create_scraper.return_value.scrape_products.return_value = mock_result
+
+    @patch('api.gemilang.views.create_gemilang_scraper')
+    def test_scrape_and_save_drops_invalid_products(self, mock_create_scraper):
+        self._mock_scraper_with_urls(mock_create_scraper, ["https://test.com/ok", "https://localhost/admin"])
+
+        response = self._post_with_token({'keyword': 'test'})
+
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        self.assertEqual(response_data['saved'], 1)
+        self.assertEqual(response_data['rejected'], 1)
+        self.assertEqual(GemilangProduct.objects.count(), 1)
+
+    @patch('api.gemilang.views.create_gemilang_scraper')
+    def test_scrape_and_save_all_invalid_products(self, mock_create_scraper):
+        self._mock_scraper_with_urls(mock_create_scraper, ["http://test.com/a", "http://test.com/b"])
+
+        response = self._post_with_token({'keyword': 'test'})
+
+        self.assertEqual(response.status_code, 400)
+        response_data = json.loads(response.content)
+        self.assertIn("HTTPS", response_data['error'])
+        self.assertEqual(len(response_data['rejected']), 2)
+
     def test_scrape_and_save_missing_keyword(self):
         data = {}
         
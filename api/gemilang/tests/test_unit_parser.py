@@ -329,7 +329,7 @@ class TestUnitExtractorAdvanced(unittest.TestCase):
     
     def test_extract_by_priority_regex_error(self):
         extractor = UnitExtractor()
-        with patch('re.search', side_effect=re.error("bad regex")):
+        with patch('api.unit_matcher.UnitPatternMatcher.match', side_effect=re.error("bad regex")):
             result = extractor._extract_by_priority_patterns("test kg")
             self.assertIsNone(result)
     
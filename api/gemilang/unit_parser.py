@@ -4,6 +4,8 @@ from typing import Optional, Dict, List, Tuple, Protocol
 from abc import ABC, abstractmethod
 from bs4 import BeautifulSoup
 
+from api.unit_matcher import UnitPatternMatcher, matcher_from_repository
+
 logger = logging.getLogger(__name__)
 
 # Unit type constants
@@ -169,6 +171,8 @@ class UnitExtractor:
         self._pattern_repository = pattern_repository or UnitPatternRepository()
         self._area_pattern_strategy = AreaPatternStrategy()
         self._adjacent_pattern_strategy = AdjacentPatternStrategy()
+        self._matcher: Optional[UnitPatternMatcher] = None
+        self._matcher_repository = None
     
     def extract_unit(self, text: str) -> Optional[str]:
         if not text or not isinstance(text, str):
@@ -203,25 +207,19 @@ class UnitExtractor:
                 logger.warning("Text too long for pattern extraction, truncating to 5000 chars")
                 text_lower = text_lower[:5000]
             
-            priority_order = self._pattern_repository.get_priority_order()
-            
-            for unit in priority_order:
-                patterns = self._pattern_repository.get_patterns(unit)
-                for pattern in patterns:
-                    try:
-                        pattern_with_boundaries = f'(?:^|\\s|[\\(\\[{{]|\\d)({pattern})(?:\\s|[\\)\\]}}]|$)'
-                        if re.search(pattern_with_boundaries, text_lower, re.IGNORECASE):
-                            return unit
-                    except re.error as e:
-                        logger.warning(f"Invalid regex pattern '{pattern}' for unit '{unit}': {e}")
-                        continue
-            
-            return None
-            
+            return self._get_matcher().match(text_lower)
+
         except Exception as e:
             logger.error(f"Error in priority pattern extraction: {e}")
             return None
 
+    def _get_matcher(self) -> UnitPatternMatcher:
+        # Rebuilt only if the repository is swapped; compiled tables are shared
+        if self._matcher is None or self._matcher_repository is not self._pattern_repository:
+            self._matcher = matcher_from_repository(self._pattern_repository)
+            self._matcher_repository = self._pattern_repository
+        return self._matcher
+
     def _extract_area_units(self, text_lower: str) -> Optional[str]:
         return self._area_pattern_strategy.extract_unit(text_lower)
 
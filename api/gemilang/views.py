@@ -5,12 +5,12 @@ import logging
 
 from .factory import create_gemilang_scraper, create_gemilang_location_scraper
 from .database_service import GemilangDatabaseService
+from db_pricing.store_locations import StoreLocationRegistry
 from .security import (
     require_api_token,
     validate_input,
     enforce_resource_limits,
     InputValidator,
-    SecurityDesignPatterns,
 )
 
 logger = logging.getLogger(__name__)
@@ -44,20 +44,7 @@ def scrape_products(request):
         sort_by_price = validated_data.get('sort_by_price', True)
         page = validated_data.get('page', 0)
         
-        location_scraper = create_gemilang_location_scraper()
-        location_result = location_scraper.scrape_locations(timeout=30)
-        
-        logger.info(f"[scrape_products] Location scraping - Success: {location_result.success}, Count: {len(location_result.locations) if location_result.locations else 0}")
-        
-        store_locations = []
-        if location_result.success and location_result.locations:
-            store_locations = [_clean_location_name(loc.name) for loc in location_result.locations]
-            logger.info(f"[scrape_products] Found {len(store_locations)} locations")
-        else:
-            logger.warning(f"[scrape_products] No locations found - Success: {location_result.success}")
-        
-        all_stores_location = ", ".join(store_locations) if store_locations else ""
-        logger.info(f"[scrape_products] Location string length: {len(all_stores_location)}")
+        all_stores_location = _fetch_store_locations()
         
         scraper = create_gemilang_scraper()
         result = scraper.scrape_products(
@@ -185,12 +172,17 @@ def _validate_scrape_params(body):
     }, None
 
 
-def _validate_products_business_logic(products_data):
-    """Validate business logic for all products."""
-    for idx, product in enumerate(products_data):
-        is_valid, error_msg = SecurityDesignPatterns.validate_business_logic(product)
-        if not is_valid:
-            return JsonResponse({'error': f'Product {idx}: {error_msg}'}, status=400)
+def _rejected_count(db_service):
+    """Number of products the last save dropped during validation."""
+    report = db_service.last_validation
+    return len(report.rejected_indexes) if report is not None else 0
+
+
+def _validation_error_response(db_service, error_msg):
+    """400 response when validation left no product to save, else None."""
+    report = db_service.last_validation
+    if report is not None and not report.valid_items:
+        return JsonResponse({'error': error_msg, 'rejected': report.rejected()}, status=400)
     return None
 
 
@@ -199,6 +191,10 @@ def _handle_price_update_save(db_service, products_data):
     save_result = db_service.save_with_price_update(products_data)
     
     if not save_result.get('success', False):
+        error_response = _validation_error_response(db_service, save_result.get('error'))
+        if error_response:
+            return error_response
+
         return JsonResponse({
             'success': False,
             'error': save_result.get('error', 'Failed to save products'),
@@ -215,7 +211,8 @@ def _handle_price_update_save(db_service, products_data):
         'updated': save_result['updated'],
         'inserted': save_result['inserted'],
         'anomalies': save_result.get('anomalies', []),
-        'anomaly_count': len(save_result.get('anomalies', []))
+        'anomaly_count': len(save_result.get('anomalies', [])),
+        'rejected': len(save_result.get('rejected', []))
     })
 
 
@@ -230,15 +227,20 @@ def _handle_regular_save(db_service, products_data):
         error_msg = 'Failed to save products to database'
     
     if save_success:
+        saved = len(products_data) - _rejected_count(db_service)
         return JsonResponse({
             'success': True,
-            'message': f"Successfully saved {len(products_data)} products",
-            'saved': len(products_data),
+            'message': f"Successfully saved {saved} products",
+            'saved': saved,
             'updated': 0,
-            'inserted': len(products_data),
-            'anomalies': []
+            'inserted': saved,
+            'anomalies': [],
+            'rejected': len(products_data) - saved
         })
     else:
+        error_response = _validation_error_response(db_service, error_msg)
+        if error_response:
+            return error_response
         return JsonResponse({
             'success': False,
             'error': error_msg,
@@ -249,8 +251,8 @@ def _handle_regular_save(db_service, products_data):
         }, status=500)
 
 
-def _fetch_store_locations():
-    """Helper to fetch and process store locations"""
+def _scrape_store_locations():
+    """Live Gemilang location scrape; feeds the store location registry"""
     location_scraper = create_gemilang_location_scraper()
     location_result = location_scraper.scrape_locations(timeout=30)
     
@@ -258,13 +260,21 @@ def _fetch_store_locations():
     
     if not location_result.success:
         logger.error(f"Location scraping failed with error: {location_result.error_message}")
-        return ""
+        return []
     
-    if not location_result.locations:
+    return location_result.locations or []
+
+
+def _fetch_store_locations():
+    """Helper to read store locations from the registry as one location string"""
+    store_locations = [
+        _clean_location_name(name)
+        for name in StoreLocationRegistry.names('gemilang', fetch=_scrape_store_locations)
+    ]
+    if not store_locations:
         logger.warning("No locations found, will save without locations")
         return ""
     
-    store_locations = [_clean_location_name(loc.name) for loc in location_result.locations]
     logger.info(f"Found {len(store_locations)} Gemilang store locations: {store_locations[:3]}")
     
     all_stores_location = ", ".join(store_locations)
@@ -339,10 +349,7 @@ def scrape_and_save(request):
                 'anomalies': []
             })
         
-        error_response = _validate_products_business_logic(products_data)
-        if error_response:
-            return error_response
-        
+        # Invalid products are dropped and reported by the database service
         _categorize_products(products_data)
         
         db_service = GemilangDatabaseService()
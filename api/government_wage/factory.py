@@ -4,12 +4,14 @@ from .html_parser import GovernmentWageHtmlParser
 from .scraper import GovernmentWageScraper
 
 def create_government_wage_scraper(headless: bool = True, browser_type: str = "chromium") -> GovernmentWageScraper:
-    http_client = GovernmentWagePlaywrightClient(
-        headless=headless,
-        browser_type=browser_type,
-        region_label="Kab. Cilacap",        
-        auto_select_region=True,
-    )
+    def client_factory():
+        return GovernmentWagePlaywrightClient(
+            headless=headless,
+            browser_type=browser_type,
+            region_label="Kab. Cilacap",
+            auto_select_region=True,
+        )
+
     url_builder = GovernmentWageUrlBuilder()
     html_parser = GovernmentWageHtmlParser()
-    return GovernmentWageScraper(http_client, url_builder, html_parser)
\ No newline at end of file
+    return GovernmentWageScraper(client_factory(), url_builder, html_parser, client_factory=client_factory)
\ No newline at end of file
@@ -3,6 +3,7 @@ import logging
 from typing import Optional
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from api.interfaces import IHttpClient, HttpClientError
+from api.government_wage.parallel import RequestBudget
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +18,14 @@ class GovernmentWagePlaywrightClient(IHttpClient):
         browser_type: str = "chromium",
         region_label: Optional[str] = "Kab. Cilacap",
         auto_select_region: bool = True,
+        request_budget: Optional[RequestBudget] = None,
     ):
         self.headless = headless
         self.browser_type = browser_type
         self.region_label = region_label
         self.auto_select_region = auto_select_region
+        # Shared with the other clients of a concurrent refresh; spaces page loads and region selections
+        self.request_budget = request_budget
 
         self.playwright = None
         self.browser: Optional[Browser] = None
@@ -72,10 +76,17 @@ class GovernmentWagePlaywrightClient(IHttpClient):
             logger.error(f"Playwright request failed for {url}: {e}")
             raise HttpClientError(f"Request failed for {url}: {e}")
 
+    async def _wait_for_slot(self):
+        if self.request_budget is not None:
+            delay = self.request_budget.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
     async def _async_get(self, url: str) -> str:
         await self._ensure_browser()
         try:
             # 1) Load MasPetruk HSPK page
+            await self._wait_for_slot()
             response = await self.page.goto(url, wait_until="domcontentloaded")
             if not response or not response.ok:
                 raise HttpClientError(f"HTTP {response.status if response else 'Unknown'} for {url}")
@@ -84,6 +95,8 @@ class GovernmentWagePlaywrightClient(IHttpClient):
             if self.auto_select_region and self.region_label:
                 try:
                     await self.page.wait_for_selector(self.REGION_SELECT_SELECTOR, timeout=5000)
+                    # Selecting the region reloads the table from the site
+                    await self._wait_for_slot()
                     try:
                         await self.page.select_option(self.REGION_SELECT_SELECTOR, label=self.region_label)
                     except Exception:
@@ -0,0 +1,86 @@
+"""
+Concurrent multi-region government wage scraping
+
+A full refresh covers every Central Java region. ``scrape_regions`` runs the
+regions on a pool of workers, each with its own browser or HTTP session, and
+hands every region to ``on_region`` as soon as it completes so callers can
+cache it without waiting for the slowest one. A shared ``RequestBudget`` keeps
+the requests of all workers together at least ``min_interval`` seconds apart:
+every page load and region selection claims a slot from it, so adding
+workers overlaps page rendering and parsing but does not raise the request
+rate on the government site above one per ``min_interval``.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from api.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class RequestBudget:
+    """Spaces the requests of every worker sharing it at least ``min_interval`` seconds apart"""
+
+    def __init__(self, min_interval: Optional[float] = None):
+        self.min_interval = config.gov_wage_request_interval if min_interval is None else min_interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Claim the next request slot; returns the seconds until it"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        return slot - now
+
+    def wait(self) -> None:
+        """Block until this caller's request slot"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def scrape_regions(
+    regions: Iterable[str],
+    scrape_region: Callable[[str], Any],
+    max_workers: Optional[int] = None,
+    on_region: Optional[Callable[[str, Any], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Scrape ``regions`` concurrently with ``scrape_region``
+
+    ``scrape_region`` is called on worker threads, so it must not share a
+    browser or session with other calls. A failed region is logged and
+    left out; ``on_region`` errors are logged and do not stop the others.
+
+    Returns:
+        ``scrape_region`` result per successfully scraped region, in completion order
+    """
+    regions = list(regions)
+    workers = max(1, min(max_workers or config.gov_wage_scrape_workers, len(regions) or 1))
+    results: Dict[str, Any] = {}
+
+    logger.info(f"Scraping {len(regions)} regions with {workers} workers")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='gov-wage-region') as executor:
+        futures = {executor.submit(scrape_region, region): region for region in regions}
+        for future in as_completed(futures):
+            region = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Error scraping region {region}: {e}")
+                continue
+
+            results[region] = result
+            logger.info(f"Scraped region {region} ({len(results)}/{len(regions)} regions)")
+            if on_region is not None:
+                try:
+                    on_region(region, result)
+                except Exception as e:
+                    logger.error(f"Error handling scraped region {region}: {e}")
+
+    return results
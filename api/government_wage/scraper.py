@@ -1,6 +1,6 @@
 import time
 import logging
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 from dataclasses import dataclass
 
 from api.core import BaseUrlBuilder
@@ -10,6 +10,7 @@ from api.government_wage.gov_playwright_client import GovernmentWagePlaywrightCl
 
 from api.government_wage.url_builder import GovernmentWageUrlBuilder
 from api.government_wage.html_parser import GovernmentWageHtmlParser
+from api.government_wage.parallel import RequestBudget, scrape_regions
 
 logger = logging.getLogger(__name__)
 
@@ -31,30 +32,36 @@ class GovernmentWageScraper:
     # Default region constant
     DEFAULT_REGION = "Kab. Cilacap"
     
+    # Central Java regions from DHSP Analysis
+    CENTRAL_JAVA_REGIONS = [
+        DEFAULT_REGION, "Kab. Banyumas", "Kab. Purbalingga", "Kab. Banjarnegara",
+        "Kab. Kebumen", "Kab. Purworejo", "Kab. Wonosobo", "Kab. Magelang",
+        "Kab. Boyolali", "Kab. Klaten", "Kab. Sukoharjo", "Kab. Wonogiri",
+        "Kab. Karanganyar", "Kab. Sragen", "Kab. Grobogan", "Kab. Blora",
+        "Kab. Rembang", "Kab. Pati", "Kab. Kudus", "Kab. Jepara",
+        "Kab. Demak", "Kab. Semarang", "Kab. Temanggung", "Kab. Kendal",
+        "Kab. Batang", "Kab. Pekalongan", "Kab. Pemalang", "Kab. Tegal",
+        "Kab. Brebes", "Kota Magelang", "Kota Surakarta", "Kota Salatiga",
+        "Kota Semarang", "Kota Pekalongan", "Kota Tegal"
+    ]
+    
     def __init__(
         self,
         http_client: Optional[IHttpClient] = None,
         url_builder: Optional[IUrlBuilder] = None,
         html_parser: Optional[IHtmlParser] = None,
+        client_factory: Optional[Callable[[], IHttpClient]] = None,
     ):
         self.http_client = http_client or GovernmentWagePlaywrightClient()
         self.url_builder = url_builder or GovernmentWageUrlBuilder()
         self.html_parser = html_parser or GovernmentWageHtmlParser()
+        # Builds a separate client (browser context) per region for concurrent scraping
+        self.client_factory = client_factory
+
+        self.available_regions = list(self.CENTRAL_JAVA_REGIONS)
 
-        # Central Java regions from DHSP Analysis
-        self.available_regions = [
-            self.DEFAULT_REGION, "Kab. Banyumas", "Kab. Purbalingga", "Kab. Banjarnegara",
-            "Kab. Kebumen", "Kab. Purworejo", "Kab. Wonosobo", "Kab. Magelang",
-            "Kab. Boyolali", "Kab. Klaten", "Kab. Sukoharjo", "Kab. Wonogiri",
-            "Kab. Karanganyar", "Kab. Sragen", "Kab. Grobogan", "Kab. Blora",
-            "Kab. Rembang", "Kab. Pati", "Kab. Kudus", "Kab. Jepara",
-            "Kab. Demak", "Kab. Semarang", "Kab. Temanggung", "Kab. Kendal",
-            "Kab. Batang", "Kab. Pekalongan", "Kab. Pemalang", "Kab. Tegal",
-            "Kab. Brebes", "Kota Magelang", "Kota Surakarta", "Kota Salatiga",
-            "Kota Semarang", "Kota Pekalongan", "Kota Tegal"
-        ]
-
-    def scrape_region_data(self, region: str = None) -> List[GovernmentWageItem]:
+    def scrape_region_data(self, region: str = None, budget: Optional[RequestBudget] = None) -> List[GovernmentWageItem]:
+        """Items of one region; with a ``budget`` every request waits for its slot"""
         if region is None:
             region = self.DEFAULT_REGION
         try:
@@ -66,6 +73,11 @@ class GovernmentWageScraper:
                 self.http_client.region_label = region
             if hasattr(self.http_client, "auto_select_region"):
                 self.http_client.auto_select_region = True
+            if hasattr(self.http_client, "request_budget"):
+                # The client spaces each page load and region selection itself
+                self.http_client.request_budget = budget
+            elif budget is not None:
+                budget.wait()
 
             html_content = self.http_client.get(url)
 
@@ -83,10 +95,28 @@ class GovernmentWageScraper:
             return []
 
 
-    def scrape_all_regions(self, max_regions: Optional[int] = None) -> List[GovernmentWageItem]:
-        all_items = []
+    def scrape_all_regions(
+        self,
+        max_regions: Optional[int] = None,
+        max_workers: int = 1,
+        on_region: Optional[Callable[[str, List[GovernmentWageItem]], None]] = None,
+        budget: Optional[RequestBudget] = None,
+    ) -> List[GovernmentWageItem]:
+        """
+        Scrape every available region (the first ``max_regions`` when given)
+
+        With ``max_workers`` > 1 and a ``client_factory``, regions are scraped
+        concurrently, each in its own client, with requests spaced by ``budget``.
+        ``on_region`` receives each region's items as soon as it completes.
+        """
         regions_to_scrape = self.available_regions[:max_regions] if max_regions else self.available_regions
 
+        if max_workers > 1:
+            if self.client_factory is not None:
+                return self._scrape_regions_concurrently(regions_to_scrape, max_workers, on_region, budget)
+            logger.warning("No client factory for concurrent scraping, scraping regions one at a time")
+
+        all_items = []
         logger.info(f"Starting to scrape {len(regions_to_scrape)} regions")
 
         for i, region in enumerate(regions_to_scrape, 1):
@@ -94,6 +124,8 @@ class GovernmentWageScraper:
                 logger.info(f"Scraping region {i}/{len(regions_to_scrape)}: {region}")
                 items = self.scrape_region_data(region)
                 all_items.extend(items)
+                if on_region is not None:
+                    on_region(region, items)
 
                 if i < len(regions_to_scrape):
                     time.sleep(5.0)
@@ -105,6 +137,26 @@ class GovernmentWageScraper:
         logger.info(f"Completed scraping all regions. Total items: {len(all_items)}")
         return all_items
 
+    def _scrape_regions_concurrently(
+        self,
+        regions: List[str],
+        max_workers: int,
+        on_region: Optional[Callable[[str, List[GovernmentWageItem]], None]],
+        budget: Optional[RequestBudget],
+    ) -> List[GovernmentWageItem]:
+        budget = budget or RequestBudget()
+
+        def scrape_region(region: str) -> List[GovernmentWageItem]:
+            # Playwright clients are bound to the thread that opened them
+            with GovernmentWageScraper(self.client_factory(), self.url_builder, self.html_parser) as scraper:
+                return scraper.scrape_region_data(region, budget)
+
+        results = scrape_regions(regions, scrape_region, max_workers, on_region)
+        # Keep the region order of the sequential mode
+        all_items = [item for region in regions for item in results.get(region, [])]
+        logger.info(f"Completed scraping all regions. Total items: {len(all_items)}")
+        return all_items
+
     def search_by_work_code(self, work_code: str, region: Optional[str] = None) -> List[GovernmentWageItem]:
         try:
             logger.info(f"Searching for work code: {work_code}")
@@ -156,7 +208,9 @@ class GovernmentWageScraper:
 
 
 def create_government_wage_scraper(headless: bool = True, browser_type: str = "chromium") -> GovernmentWageScraper:
-    http_client = GovernmentWagePlaywrightClient(headless=headless, browser_type=browser_type)
+    def client_factory():
+        return GovernmentWagePlaywrightClient(headless=headless, browser_type=browser_type)
+
     url_builder = GovernmentWageUrlBuilder()
     html_parser = GovernmentWageHtmlParser()
-    return GovernmentWageScraper(http_client, url_builder, html_parser)
\ No newline at end of file
+    return GovernmentWageScraper(client_factory(), url_builder, html_parser, client_factory=client_factory)
\ No newline at end of file
@@ -1,83 +1,336 @@
 """
 Simple in-memory cache for government wage data
 Works without Django cache settings
+
+The cache is a bounded LRU: besides the per-entry timeout it holds at most
+``max_entries`` entries and roughly ``max_bytes`` of pickled values, evicting
+the least recently used entries first. Expired entries are swept every
+``sweep_interval`` seconds on the next read or write, so keys that are never
+read again do not live forever.
+
+Each gunicorn worker has its own ``SimpleCache``. When the Django cache alias
+named by ``GOV_WAGE_CACHE_ALIAS`` is configured, ``get_cache`` returns a
+``SharedCache`` instead: the worker's ``SimpleCache`` stays in front for
+``local_timeout`` seconds and the alias (file based by default) is shared by
+all workers, so a region scraped by one worker is served to every other.
+Cross-worker single-flight fills rely on the alias having an atomic ``add``
+(Redis, memcached); with the file based default two workers can occasionally
+fill the same key at once.
 """
 import time
 import hashlib
 import logging
+import pickle
+import sys
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Tuple
 import threading
+from abc import ABC, abstractmethod
+
+from api.config import config
 
 logger = logging.getLogger(__name__)
 
 
-class SimpleCache:
-    """Thread-safe in-memory cache"""
-    
-    def __init__(self, default_timeout: int = 900):
+def approximate_size(value: Any) -> int:
+    """Approximate memory cost of a cached value, in bytes"""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class CacheBackend(ABC):
+    """Interface of the government wage caches"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value, or None on a miss"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        """Cache a value for ``timeout`` seconds"""
+
+    @abstractmethod
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """Cache a value only if the key is absent; True when it was stored"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove one item"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every item"""
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+
+
+class SimpleCache(CacheBackend):
+    """Thread-safe in-memory LRU cache with entry and size limits"""
+
+    def __init__(self, default_timeout: int = 900, max_entries: int = 256,
+                 max_bytes: int = 64 * 1024 * 1024, sweep_interval: float = 60.0):
         self.default_timeout = default_timeout
-        self._cache: Dict[str, Tuple[Any, float]] = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        # key -> (value, expiry time, size in bytes), least recently used first
+        self._cache: 'OrderedDict[str, Tuple[Any, float, int]]' = OrderedDict()
+        self._size_bytes = 0
+        self._last_sweep = time.time()
         self._lock = threading.RLock()
-        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
     def get(self, key: str) -> Optional[Any]:
         """Get item from cache"""
         with self._lock:
+            now = time.time()
+            self._maybe_sweep(now)
             if key not in self._cache:
+                self.misses += 1
                 return None
-                
-            value, expiry_time = self._cache[key]
-            
+
+            value, expiry_time, _ = self._cache[key]
+
             # Check if expired
-            if time.time() > expiry_time:
-                del self._cache[key]
+            if now > expiry_time:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
                 return None
-                
+
+            self._cache.move_to_end(key)
+            self.hits += 1
             return value
-    
+
     def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
         """Set item in cache"""
         timeout = timeout or self.default_timeout
-        expiry_time = time.time() + timeout
-        
+        size = approximate_size(value)
+
+        with self._lock:
+            now = time.time()
+            self._maybe_sweep(now)
+            if key in self._cache:
+                self._remove(key)
+            if size > self.max_bytes:
+                logger.warning(f"Not caching {key}: {size} bytes exceeds the {self.max_bytes} byte limit")
+                return
+
+            self._cache[key] = (value, now + timeout, size)
+            self._size_bytes += size
+            self._evict()
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """Set item in cache unless a live one exists"""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.time() <= entry[1]:
+                return False
+            self.set(key, value, timeout)
+            return key in self._cache
+
+    def delete(self, key: str) -> None:
+        """Remove one item from cache"""
         with self._lock:
-            self._cache[key] = (value, expiry_time)
-    
+            if key in self._cache:
+                self._remove(key)
+
     def clear(self) -> None:
         """Clear all cache"""
         with self._lock:
             self._cache.clear()
-    
+            self._size_bytes = 0
+
+    def sweep(self) -> int:
+        """Remove every expired entry; returns how many were removed"""
+        with self._lock:
+            now = time.time()
+            self._last_sweep = now
+            expired = [key for key, (_, expiry, _) in self._cache.items() if expiry < now]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+            return len(expired)
+
+    def _maybe_sweep(self, now: float) -> None:
+        if now - self._last_sweep >= self.sweep_interval:
+            self.sweep()
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._cache.pop(key)
+        self._size_bytes -= size
+
+    def _evict(self) -> None:
+        # Least recently used entries go first
+        while self._cache and (len(self._cache) > self.max_entries or self._size_bytes > self.max_bytes):
+            key = next(iter(self._cache))
+            self._remove(key)
+            self.evictions += 1
+
     def get_stats(self) -> Dict[str, int]:
         """Get cache statistics"""
         with self._lock:
             current_time = time.time()
-            valid_keys = sum(1 for _, expiry in self._cache.values() if expiry > current_time)
+            valid_keys = sum(1 for _, expiry, _ in self._cache.values() if expiry > current_time)
             return {
                 'total_keys': len(self._cache),
                 'valid_keys': valid_keys,
-                'expired_keys': len(self._cache) - valid_keys
+                'expired_keys': len(self._cache) - valid_keys,
+                'size_bytes': self._size_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
             }
 
 
+class SharedCache(CacheBackend):
+    """Per-process SimpleCache in front of a Django cache shared by all workers"""
+
+    # Bumped by clear(); stored values are versioned with it
+    GENERATION_KEY = 'gov_wage_generation'
+
+    def __init__(self, shared, local: Optional[SimpleCache] = None, local_timeout: int = 60):
+        self.shared = shared
+        self.local = local if local is not None else SimpleCache()
+        self.local_timeout = local_timeout
+        self.default_timeout = self.local.default_timeout
+        self.shared_hits = 0
+        self.shared_misses = 0
+
+    def _generation(self) -> int:
+        return self.shared.get(self.GENERATION_KEY, 1)
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        try:
+            value = self.shared.get(key, version=self._generation())
+        except Exception as e:
+            logger.warning(f"Shared government wage cache unavailable: {e}")
+            return None
+        if value is None:
+            self.shared_misses += 1
+            return None
+
+        self.shared_hits += 1
+        self.local.set(key, value, self.local_timeout)
+        return value
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        timeout = timeout or self.default_timeout
+        self.local.set(key, value, min(timeout, self.local_timeout))
+        try:
+            self.shared.set(key, value, timeout, version=self._generation())
+        except Exception as e:
+            logger.warning(f"Could not write {key} to the shared government wage cache: {e}")
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        # Decided by the shared tier so only one worker wins; that needs an
+        # atomic add() (Redis, memcached), which FileBasedCache does not have
+        timeout = timeout or self.default_timeout
+        try:
+            added = self.shared.add(key, value, timeout, version=self._generation())
+        except Exception as e:
+            logger.warning(f"Shared government wage cache unavailable, deciding {key} locally: {e}")
+            return self.local.add(key, value, min(timeout, self.local_timeout))
+        if added:
+            self.local.set(key, value, min(timeout, self.local_timeout))
+        return added
+
+    def delete(self, key: str) -> None:
+        self.local.delete(key)
+        try:
+            self.shared.delete(key, version=self._generation())
+        except Exception as e:
+            logger.warning(f"Could not delete {key} from the shared government wage cache: {e}")
+
+    def clear(self) -> None:
+        """Drop local items and, for every worker, the shared ones"""
+        self.local.clear()
+        try:
+            try:
+                self.shared.incr(self.GENERATION_KEY)
+            except ValueError:
+                self.shared.set(self.GENERATION_KEY, 2, None)
+        except Exception as e:
+            logger.warning(f"Could not clear the shared government wage cache: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.local.get_stats()
+        stats.update({
+            'shared_hits': self.shared_hits,
+            'shared_misses': self.shared_misses,
+        })
+        return stats
+
+
 # Global cache instance
 _cache_instance = None
 _cache_lock = threading.Lock()
 
 
-def get_cache() -> SimpleCache:
+def get_cache() -> CacheBackend:
     """Get or create cache instance"""
     global _cache_instance
-    
+
     if _cache_instance is None:
         with _cache_lock:
             if _cache_instance is None:
-                _cache_instance = SimpleCache(default_timeout=900)  # 15 minutes
-                logger.info("Initialized simple cache for government wage API")
-    
+                _cache_instance = _create_cache()
+
     return _cache_instance
 
 
+def _create_cache() -> CacheBackend:
+    local = SimpleCache(
+        default_timeout=900,  # 15 minutes
+        max_entries=config.gov_wage_cache_max_entries,
+        max_bytes=config.gov_wage_cache_max_bytes,
+    )
+
+    shared = _shared_backend()
+    if shared is None:
+        logger.info("Initialized simple cache for government wage API")
+        return local
+
+    logger.info("Initialized shared cache for government wage API")
+    return SharedCache(shared, local=local)
+
+
+def _shared_backend():
+    """Django cache named by GOV_WAGE_CACHE_ALIAS, or None when not configured"""
+    try:
+        from django.conf import settings
+        from django.core.cache import caches
+
+        alias = getattr(settings, 'GOV_WAGE_CACHE_ALIAS', '')
+        if alias and alias in settings.CACHES:
+            return caches[alias]
+    except Exception as e:
+        logger.warning(f"Shared cache unavailable, using the in-process cache: {e}")
+    return None
+
+
+def reset_cache() -> None:
+    """Drop the process-wide instance so the next get_cache() builds a new one"""
+    global _cache_instance
+    with _cache_lock:
+        _cache_instance = None
+
+
 def make_cache_key(prefix: str, data: str) -> str:
     """Create a cache key"""
     hash_value = hashlib.sha256(data.encode()).hexdigest()
-    return f"gov_wage_{prefix}_{hash_value}"
\ No newline at end of file
+    return f"gov_wage_{prefix}_{hash_value}"
@@ -0,0 +1,143 @@
+"""
+Single-flight cache fills for expensive government wage scrapes
+
+A full HSPK region scrape walks every page of the government site and can
+take minutes. ``get_or_fill`` makes sure a key is filled once per expiry no
+matter how many requests miss it at the same time:
+
+- threads of one worker queue on a per-key lock; workers sharing a cache
+  (see ``SharedCache``) agree on a single filler through ``cache.add``, and
+  the others wait for its result. That takes a backend with an atomic
+  ``add`` such as Redis or memcached: ``FileBasedCache`` checks and writes
+  separately, so there it only narrows the window for duplicate fills;
+- before the entry expires it is refreshed early with probability growing
+  as expiry nears and with the time the fill took (the "XFetch" rule), in a
+  background thread, so readers keep getting the current value instead of
+  all missing at once when the timeout passes.
+"""
+import logging
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .simple_cache import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+# Seconds a fill may hold the lock before another request may take over
+FILL_LOCK_TIMEOUT = 600
+# Seconds a request waits for another worker's fill before filling itself
+FILL_WAIT = 300
+POLL_INTERVAL = 0.5
+# Higher values refresh earlier; 1.0 is the usual XFetch setting
+EARLY_REFRESH_BETA = 1.0
+
+_key_locks: Dict[str, threading.Lock] = {}
+_key_locks_guard = threading.Lock()
+
+
+@dataclass
+class CachedFill:
+    """Cached value with its expiry time and the seconds it took to compute"""
+    value: Any
+    expires_at: float
+    duration: float
+
+
+def _key_lock(key: str) -> threading.Lock:
+    with _key_locks_guard:
+        return _key_locks.setdefault(key, threading.Lock())
+
+
+def _unwrap(entry: Any) -> Any:
+    # Entries written before single-flight fills are plain values
+    return entry.value if isinstance(entry, CachedFill) else entry
+
+
+def should_refresh_early(entry: CachedFill, beta: float = EARLY_REFRESH_BETA, now: Optional[float] = None) -> bool:
+    """XFetch rule: refresh once now - duration * beta * ln(U) passes the expiry, U uniform in (0, 1]"""
+    now = time.time() if now is None else now
+    return now - entry.duration * beta * math.log(1.0 - random.random()) >= entry.expires_at
+
+
+def get_or_fill(cache: CacheBackend, key: str, fill: Callable[[], Any], timeout: int,
+                beta: float = EARLY_REFRESH_BETA) -> Tuple[Any, bool]:
+    """
+    Cached value of ``key``, computing it with ``fill`` at most once per expiry
+
+    Empty results are returned but not cached.
+
+    Returns:
+        (value, whether it came from the cache)
+    """
+    entry = cache.get(key)
+    if entry is not None:
+        if isinstance(entry, CachedFill) and should_refresh_early(entry, beta):
+            refresh_in_background(cache, key, fill, timeout)
+        return _unwrap(entry), True
+
+    with _key_lock(key):
+        # Another thread of this worker may have filled it meanwhile
+        entry = cache.get(key)
+        if entry is not None:
+            return _unwrap(entry), True
+
+        lock_key = f"{key}:filling"
+        if cache.add(lock_key, True, FILL_LOCK_TIMEOUT):
+            try:
+                return _fill(cache, key, fill, timeout), False
+            finally:
+                cache.delete(lock_key)
+
+        value = _wait_for_fill(cache, key, lock_key)
+        if value is not None:
+            return value, True
+        return _fill(cache, key, fill, timeout), False
+
+
+def _fill(cache: CacheBackend, key: str, fill: Callable[[], Any], timeout: int) -> Any:
+    started = time.time()
+    value = fill()
+    store(cache, key, value, timeout, time.time() - started)
+    return value
+
+
+def store(cache: CacheBackend, key: str, value: Any, timeout: int, duration: float = 0.0) -> None:
+    """Cache a value computed outside ``get_or_fill``, e.g. by a bulk refresh; empty values are skipped"""
+    if value:
+        cache.set(key, CachedFill(value, time.time() + timeout, duration), timeout)
+
+
+def _wait_for_fill(cache: CacheBackend, key: str, lock_key: str) -> Any:
+    """Value filled by another worker, or None if it gave up or took too long"""
+    deadline = time.time() + FILL_WAIT
+    while time.time() < deadline:
+        time.sleep(POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None:
+            return _unwrap(entry)
+        if cache.get(lock_key) is None:
+            return None
+    logger.warning(f"Gave up waiting for another worker to fill {key}")
+    return None
+
+
+def refresh_in_background(cache: CacheBackend, key: str, fill: Callable[[], Any], timeout: int) -> bool:
+    """Recompute ``key`` in a daemon thread unless a fill is already running"""
+    lock_key = f"{key}:filling"
+    if not cache.add(lock_key, True, FILL_LOCK_TIMEOUT):
+        return False
+
+    def run():
+        try:
+            _fill(cache, key, fill, timeout)
+        except Exception as e:
+            logger.error(f"Early refresh of {key} failed: {e}")
+        finally:
+            cache.delete(lock_key)
+
+    threading.Thread(target=run, name='gov-wage-refresh', daemon=True).start()
+    return True
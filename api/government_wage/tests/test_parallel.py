@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from api.government_wage.gov_playwright_client import GovernmentWagePlaywrightClient
+from api.government_wage.parallel import RequestBudget, scrape_regions
+from api.government_wage.scraper import GovernmentWageItem, GovernmentWageScraper
+
+
+def _item(region):
+    return GovernmentWageItem(
+        item_number="1", work_code="A.1", work_description=f"Work {region}",
+        unit="m2", unit_price_idr=1000, region=region,
+    )
+
+
+class RequestBudgetTest(TestCase):
+
+    @patch('api.government_wage.parallel.time.sleep')
+    @patch('api.government_wage.parallel.time.monotonic', return_value=100.0)
+    def test_requests_get_consecutive_slots(self, _monotonic, mock_sleep):
+        budget = RequestBudget(min_interval=2.0)
+
+        budget.wait()
+        budget.wait()
+        budget.wait()
+
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [2.0, 4.0])
+
+    def test_zero_interval_never_sleeps(self):
+        with patch('api.government_wage.parallel.time.sleep') as mock_sleep:
+            RequestBudget(min_interval=0).wait()
+            RequestBudget(min_interval=0).wait()
+        mock_sleep.assert_not_called()
+
+
+class ScrapeRegionsTest(TestCase):
+
+    def test_regions_run_concurrently_and_stream_as_they_complete(self):
+        started = threading.Barrier(3, timeout=5)
+        streamed = []
+
+        def scrape(region):
+            started.wait()  # fails unless all three regions run at once
+            if region == "Slow":
+                time.sleep(0.1)
+            return [region]
+
+        results = scrape_regions(["Slow", "A", "B"], scrape, max_workers=3,
+                                 on_region=lambda region, items: streamed.append(region))
+
+        self.assertEqual(results, {"Slow": ["Slow"], "A": ["A"], "B": ["B"]})
+        self.assertEqual(streamed[-1], "Slow")
+
+    def test_failed_regions_and_callbacks_do_not_stop_the_rest(self):
+        def scrape(region):
+            if region == "Down":
+                raise ConnectionError("blocked")
+            return [region]
+
+        on_region = Mock(side_effect=[ValueError("cache down"), None])
+        results = scrape_regions(["Down", "A", "B"], scrape, max_workers=2, on_region=on_region)
+
+        self.assertEqual(set(results), {"A", "B"})
+        self.assertEqual(on_region.call_count, 2)
+
+
+class ScraperConcurrentModeTest(TestCase):
+
+    def _client(self):
+        client = MagicMock()
+        client.get.side_effect = lambda url: url
+        return client
+
+    def _parser(self):
+        parser = Mock()
+        parser.parse_government_wage_data.side_effect = lambda html, region: [_item(region)]
+        return parser
+
+    def test_each_region_uses_its_own_client(self):
+        clients = []
+
+        def client_factory():
+            clients.append(self._client())
+            return clients[-1]
+
+        url_builder = Mock()
+        url_builder.build_search_url.side_effect = lambda region: region
+        scraper = GovernmentWageScraper(MagicMock(), url_builder, self._parser(), client_factory=client_factory)
+        streamed = []
+
+        items = scraper.scrape_all_regions(
+            max_regions=4, max_workers=3, budget=RequestBudget(min_interval=0),
+            on_region=lambda region, region_items: streamed.append(region),
+        )
+
+        regions = GovernmentWageScraper.CENTRAL_JAVA_REGIONS[:4]
+        self.assertEqual([item.region for item in items], regions)
+        self.assertEqual(sorted(streamed), sorted(regions))
+        self.assertEqual(len(clients), 4)
+        for client in clients:
+            client.close.assert_called_once()
+        scraper.http_client.get.assert_not_called()
+
+    @patch('api.government_wage.scraper.time.sleep')
+    def test_without_client_factory_falls_back_to_one_at_a_time(self, _sleep):
+        url_builder = Mock()
+        url_builder.build_search_url.side_effect = lambda region: region
+        scraper = GovernmentWageScraper(self._client(), url_builder, self._parser())
+
+        items = scraper.scrape_all_regions(max_regions=2, max_workers=4)
+
+        self.assertEqual(len(items), 2)
+        self.assertEqual(scraper.http_client.get.call_count, 2)
+
+    def test_budget_spaces_requests_of_plain_clients(self):
+        client = Mock(spec=['get', 'close'])
+        client.get.return_value = "html"
+        url_builder = Mock()
+        url_builder.build_search_url.side_effect = lambda region: region
+        budget = Mock(spec=RequestBudget)
+        scraper = GovernmentWageScraper(client, url_builder, self._parser())
+
+        scraper.scrape_region_data("Kab. Cilacap", budget)
+
+        budget.wait.assert_called_once()
+
+
+class PlaywrightClientBudgetTest(TestCase):
+
+    def test_page_load_and_region_selection_each_take_a_slot(self):
+        budget = Mock(spec=RequestBudget)
+        budget.reserve.return_value = 0.0
+        client = GovernmentWagePlaywrightClient(region_label="Kab. Kudus", request_budget=budget)
+        client.page = AsyncMock()
+        client.page.content.return_value = "<html></html>"
+
+        with patch.object(client, '_ensure_browser', AsyncMock()):
+            html = asyncio.run(client._async_get("https://example.com/hspk"))
+
+        self.assertEqual(html, "<html></html>")
+        self.assertEqual(budget.reserve.call_count, 2)
+        client.page.select_option.assert_awaited_once()
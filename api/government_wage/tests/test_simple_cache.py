@@ -0,0 +1,140 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import override_settings
+
+from api.government_wage.simple_cache import (
+    SharedCache, SimpleCache, approximate_size, get_cache, reset_cache,
+)
+
+
+class SimpleCacheTest(TestCase):
+
+    def test_get_set_and_counters(self):
+        cache = SimpleCache()
+        cache.set("a", [1, 2, 3])
+
+        self.assertEqual(cache.get("a"), [1, 2, 3])
+        self.assertIsNone(cache.get("missing"))
+
+        stats = cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['size_bytes'], approximate_size([1, 2, 3]))
+
+    def test_least_recently_used_entry_evicted_at_max_entries(self):
+        cache = SimpleCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+        self.assertEqual(cache.get_stats()['evictions'], 1)
+
+    def test_byte_limit_evicts_and_rejects_oversized_values(self):
+        value = "x" * 1000
+        cache = SimpleCache(max_bytes=approximate_size(value) * 2)
+        cache.set("a", value)
+        cache.set("b", value)
+        cache.set("c", value)
+        cache.set("huge", value * 10)
+
+        self.assertEqual(cache.get_stats()['total_keys'], 2)
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get("huge"))
+        self.assertLessEqual(cache.get_stats()['size_bytes'], cache.max_bytes)
+
+    def test_overwrite_replaces_size(self):
+        cache = SimpleCache()
+        cache.set("a", "x" * 1000)
+        cache.set("a", "y")
+
+        self.assertEqual(cache.get_stats()['size_bytes'], approximate_size("y"))
+
+    @patch('api.government_wage.simple_cache.time.time')
+    def test_expired_unread_keys_are_swept(self, mock_time):
+        mock_time.return_value = 1000.0
+        cache = SimpleCache(sweep_interval=60)
+        cache.set("old", 1, timeout=10)
+        cache.set("fresh", 2, timeout=600)
+
+        mock_time.return_value = 1100.0
+        cache.get("fresh")
+
+        stats = cache.get_stats()
+        self.assertEqual(stats['total_keys'], 1)
+        self.assertEqual(stats['expirations'], 1)
+        self.assertEqual(stats['size_bytes'], approximate_size(2))
+
+    @patch('api.government_wage.simple_cache.time.time')
+    def test_expired_key_is_a_miss(self, mock_time):
+        mock_time.return_value = 1000.0
+        cache = SimpleCache(sweep_interval=3600)
+        cache.set("a", 1, timeout=10)
+
+        mock_time.return_value = 1011.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get_stats()['misses'], 1)
+
+
+class SharedCacheTest(TestCase):
+
+    def setUp(self):
+        self.shared = caches['shared']
+        self.shared.clear()
+        self.addCleanup(self.shared.clear)
+        self.addCleanup(reset_cache)
+
+    def test_value_set_by_one_worker_is_read_by_another(self):
+        worker_a, worker_b = SharedCache(self.shared), SharedCache(self.shared)
+
+        worker_a.set("region", [{"item": "Tukang"}], 900)
+
+        self.assertEqual(worker_b.get("region"), [{"item": "Tukang"}])
+        self.assertEqual(worker_b.get_stats()['shared_hits'], 1)
+        # Served from the worker's own tier afterwards
+        self.assertEqual(worker_b.get("region"), [{"item": "Tukang"}])
+        self.assertEqual(worker_b.get_stats()['shared_hits'], 1)
+
+    def test_clear_applies_to_every_worker(self):
+        worker_a, worker_b = SharedCache(self.shared), SharedCache(self.shared)
+        worker_a.set("region", 1)
+
+        worker_a.clear()
+
+        self.assertIsNone(worker_b.get("region"))
+        worker_b.set("region", 2)
+        self.assertEqual(worker_a.get("region"), 2)
+
+    def test_shared_backend_errors_fall_back_to_miss(self):
+        broken = SharedCache(self.shared)
+        with patch.object(self.shared, 'get', side_effect=OSError("disk full")):
+            self.assertIsNone(broken.get("region"))
+
+    def test_shared_backend_errors_on_add_and_delete_fall_back_to_local(self):
+        broken = SharedCache(self.shared)
+        with patch.object(self.shared, 'add', side_effect=OSError("disk full")), \
+                patch.object(self.shared, 'delete', side_effect=OSError("disk full")):
+            self.assertTrue(broken.add("lock", True, 60))
+            self.assertFalse(broken.add("lock", True, 60))
+            broken.delete("lock")
+            self.assertTrue(broken.add("lock", True, 60))
+
+    def test_shared_backend_errors_on_clear_only_clear_local(self):
+        broken = SharedCache(self.shared)
+        broken.set("region", 1)
+        with patch.object(self.shared, 'incr', side_effect=OSError("disk full")), \
+                patch.object(self.shared, 'set', side_effect=OSError("disk full")):
+            broken.clear()
+        self.assertIsNone(broken.local.get("region"))
+
+    def test_get_cache_uses_configured_alias(self):
+        with override_settings(GOV_WAGE_CACHE_ALIAS='shared'):
+            reset_cache()
+            self.assertIsInstance(get_cache(), SharedCache)
+
+        with override_settings(GOV_WAGE_CACHE_ALIAS=''):
+            reset_cache()
+            self.assertIsInstance(get_cache(), SimpleCache)
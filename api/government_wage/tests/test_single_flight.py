@@ -0,0 +1,80 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from api.government_wage import single_flight
+from api.government_wage.simple_cache import SimpleCache
+from api.government_wage.single_flight import CachedFill, get_or_fill, should_refresh_early
+
+
+class GetOrFillTest(TestCase):
+
+    def setUp(self):
+        self.cache = SimpleCache()
+
+    def test_concurrent_misses_fill_once(self):
+        calls = []
+
+        def fill():
+            calls.append(1)
+            time.sleep(0.2)
+            return ["row"]
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_fill(self.cache, "region", fill, 900)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([value for value, _ in results], [["row"]] * 8)
+        self.assertEqual(sorted(cached for _, cached in results), [False] + [True] * 7)
+
+    @patch.object(single_flight, 'POLL_INTERVAL', 0.05)
+    def test_waits_for_fill_by_another_worker(self):
+        self.cache.add("region:filling", True, 60)
+        threading.Timer(0.2, lambda: self.cache.set("region", CachedFill(["theirs"], time.time() + 900, 1), 900)).start()
+        fill = Mock(return_value=["mine"])
+
+        self.assertEqual(get_or_fill(self.cache, "region", fill, 900), (["theirs"], True))
+        fill.assert_not_called()
+
+    @patch.object(single_flight, 'POLL_INTERVAL', 0.05)
+    def test_fills_itself_when_other_worker_gives_up(self):
+        self.cache.add("region:filling", True, 60)
+        threading.Timer(0.1, lambda: self.cache.delete("region:filling")).start()
+
+        self.assertEqual(get_or_fill(self.cache, "region", lambda: ["mine"], 900), (["mine"], False))
+
+    def test_empty_result_not_cached(self):
+        get_or_fill(self.cache, "region", lambda: [], 900)
+        self.assertIsNone(self.cache.get("region"))
+
+    def test_plain_cached_value_is_served(self):
+        self.cache.set("region", ["legacy"], 900)
+        self.assertEqual(get_or_fill(self.cache, "region", Mock(), 900), (["legacy"], True))
+
+    def test_early_refresh_runs_in_background_once(self):
+        self.cache.set("region", CachedFill(["old"], time.time() + 1, duration=60), 900)
+
+        with patch('api.government_wage.single_flight.threading.Thread') as mock_thread:
+            first = get_or_fill(self.cache, "region", Mock(), 900)
+            get_or_fill(self.cache, "region", Mock(), 900)
+
+        self.assertEqual(first, (["old"], True))
+        mock_thread.return_value.start.assert_called_once()
+
+
+class ShouldRefreshEarlyTest(TestCase):
+
+    @patch('api.government_wage.single_flight.random.random', return_value=0.5)
+    def test_probability_grows_near_expiry_and_with_fill_time(self, _random):
+        # ln(0.5) ~ -0.69, so the refresh window is 0.69 * duration before expiry
+        self.assertFalse(should_refresh_early(CachedFill([], expires_at=1000, duration=60), now=900))
+        self.assertTrue(should_refresh_early(CachedFill([], expires_at=1000, duration=60), now=960))
+        self.assertTrue(should_refresh_early(CachedFill([], expires_at=1000, duration=200), now=900))
@@ -3,6 +3,7 @@ from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from .factory import create_government_wage_scraper
 from .simple_cache import get_cache, make_cache_key
+from api.config import config
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,6 +17,27 @@ def _create_error_response(message, status=400):
     return JsonResponse({'error': message}, status=status)
 
 
+def _cache_region_items(region, items):
+    """Cache one region of a multi-region scrape as soon as it completes"""
+    if not items:
+        return
+    wage_data = [
+        {
+            'item_number': item.item_number,
+            'work_code': item.work_code,
+            'work_description': item.work_description,
+            'unit': item.unit,
+            'unit_price_idr': item.unit_price_idr,
+            'region': item.region,
+            'edition': item.edition,
+            'year': item.year,
+            'sector': item.sector
+        }
+        for item in items
+    ]
+    get_cache().set(make_cache_key("region", region), wage_data, 900)
+
+
 @require_http_methods(["GET"])
 def scrape_region_data(request):
     try:
@@ -190,7 +212,11 @@ def scrape_all_regions(request):
         scraper = create_government_wage_scraper()
         
         with scraper:
-            items = scraper.scrape_all_regions(max_regions)
+            items = scraper.scrape_all_regions(
+                max_regions,
+                max_workers=config.gov_wage_scrape_workers,
+                on_region=_cache_region_items,
+            )
         
         # Format wage data
         wage_data = [
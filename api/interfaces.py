@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from typing import List, Optional
 from dataclasses import dataclass
 
@@ -82,6 +83,22 @@ class IHtmlParser(ABC):
         pass
 
 
+class IParseExecutor(ABC):
+    @abstractmethod
+    def submit(self, html_parser: IHtmlParser, html_content: str) -> Future:
+        pass
+    
+    def parse(self, html_parser: IHtmlParser, html_content: str) -> List[Product]:
+        return self.submit(html_parser, html_content).result()
+    
+    @property
+    def is_concurrent(self) -> bool:
+        return False
+    
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
 class IPriceScraper(ABC):
     @abstractmethod
     def scrape_products(self, keyword: str, sort_by_price: bool = True, page: int = 0) -> ScrapingResult:
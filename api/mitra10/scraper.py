@@ -21,7 +21,7 @@ class Mitra10PriceScraper(BasePriceScraper):
             with BatchPlaywrightClient(headless=True) as batch_client:
                 # Increase timeout to 60 seconds for heavy JavaScript sites
                 html_content = batch_client.get(url, timeout=60)
-                products = self.html_parser.parse_products(html_content)
+                products = self._parse_html(html_content)
             
             logger.info(f"Successfully scraped {len(products)} products for keyword '{keyword}'")
             return ScrapingResult(
@@ -49,7 +49,7 @@ class Mitra10PriceScraper(BasePriceScraper):
                     url = self.url_builder.build_search_url(keyword)
                     # Increase timeout to 60 seconds for heavy JavaScript sites
                     html_content = batch_client.get(url, timeout=60)
-                    products = self.html_parser.parse_products(html_content)
+                    products = self._parse_html(html_content)
                     all_products.extend(products)
                     
                 except Exception as e:
@@ -66,7 +66,7 @@ class Mitra10PriceScraper(BasePriceScraper):
             
             with BatchPlaywrightClient(headless=True) as batch_client:
                 html_content = batch_client.get(url, timeout=60)
-                products = self.html_parser.parse_products(html_content)
+                products = self._parse_html(html_content)
             
             # Filter products that have sold_count and sort by sold_count descending
             products_with_sales = [p for p in products if p.sold_count is not None and p.sold_count > 0]
@@ -3,6 +3,8 @@ import logging
 from typing import Optional, Dict, List, Protocol
 from bs4 import BeautifulSoup
 
+from api.unit_matcher import UnitPatternMatcher, matcher_from_repository
+
 logger = logging.getLogger(__name__)
 
 # Unit type constants
@@ -320,6 +322,8 @@ class Mitra10UnitExtractor(ErrorHandlingMixin):
         self._pattern_repository = pattern_repository or Mitra10UnitPatternRepository()
         self._area_pattern_strategy = Mitra10AreaPatternStrategy()
         self._adjacent_pattern_strategy = Mitra10AdjacentPatternStrategy()
+        self._matcher: Optional[UnitPatternMatcher] = None
+        self._matcher_repository = None
     
     def extract_unit(self, text: str) -> Optional[str]:
         text_lower = TextProcessingHelper.validate_and_clean_text(text)
@@ -354,21 +358,13 @@ class Mitra10UnitExtractor(ErrorHandlingMixin):
         if not text_processed:
             return None
         
-        priority_order = self._pattern_repository.get_priority_order()
-        
-        for unit in priority_order:
-            patterns = self._pattern_repository.get_patterns(unit)
-            for pattern in patterns:
-                if self._match_pattern_with_boundaries(pattern, text_processed):
-                    return unit
-        
-        return None
+        return self._get_matcher().match(text_processed)
     
-    def _match_pattern_with_boundaries(self, pattern: str, text: str) -> bool:
-        # Use word boundaries for better matching
-        pattern_with_boundaries = f'(?:^|\\s|[\\(\\[{{]|\\d)({pattern})(?:\\s|[\\)\\]}}]|$)'
-        match = TextProcessingHelper.safe_regex_search(pattern_with_boundaries, text)
-        return match is not None
+    def _get_matcher(self) -> UnitPatternMatcher:
+        if self._matcher is None or self._matcher_repository is not self._pattern_repository:
+            self._matcher = matcher_from_repository(self._pattern_repository)
+            self._matcher_repository = self._pattern_repository
+        return self._matcher
 
 
 class Mitra10SpecificationFinder(ErrorHandlingMixin):
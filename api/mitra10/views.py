@@ -4,6 +4,7 @@ from .factory import create_mitra10_scraper, create_mitra10_location_scraper
 from .database_service import Mitra10DatabaseService
 from db_pricing.models import Mitra10Product
 from db_pricing.auto_categorization_service import AutoCategorizationService
+from db_pricing.store_locations import StoreLocationRegistry, scrape_result_locations
 import logging
 
 logger = logging.getLogger(__name__)
@@ -239,13 +240,16 @@ def _perform_scraping(query, params):
         )
 
 
+def _scrape_locations():
+    """Live Mitra10 location scrape (a browser session); feeds the store location registry"""
+    location_scraper = create_mitra10_location_scraper()
+    return scrape_result_locations(location_scraper.scrape_locations())
+
+
 def _scrape_location_data():
-    """Scrape and return location data as a string."""
+    """Store location names from the registry as a string."""
     try:
-        location_scraper = create_mitra10_location_scraper()
-        loc_result = location_scraper.scrape_locations()
-        if loc_result.get('success') and loc_result.get('locations'):
-            return ', '.join([str(l) for l in loc_result.get('locations', [])])
+        return ', '.join(StoreLocationRegistry.names('mitra10', fetch=_scrape_locations))
     except Exception as e:
         logger.warning(f"Failed to scrape locations; continuing without locations: {e}")
     return ''
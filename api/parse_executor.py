@@ -0,0 +1,111 @@
+"""
+Parse stage executors.
+
+Fetching is network-bound while BeautifulSoup parsing is CPU-bound and holds the
+GIL. Scrapers hand the raw HTML to an ``IParseExecutor`` so parsing can run in a
+separate process pool, overlapping with the next fetch and using more than one
+core during large scheduled runs.
+
+The executor is chosen by ``config.parse_workers`` (``SCRAPER_PARSE_WORKERS``):
+``0`` keeps the original behaviour of parsing inline on the calling thread.
+"""
+import logging
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+from .config import config
+from .interfaces import IHtmlParser, IParseExecutor, Product
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_in_worker(html_parser: IHtmlParser, html_content: str) -> List[Product]:
+    # Module-level so it can be pickled for the process pool
+    return html_parser.parse_products(html_content)
+
+
+class InlineParseExecutor(IParseExecutor):
+    """Parses on the calling thread; returns an already-completed future."""
+
+    def submit(self, html_parser: IHtmlParser, html_content: str) -> Future:
+        future = Future()
+        try:
+            future.set_result(html_parser.parse_products(html_content))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def parse(self, html_parser: IHtmlParser, html_content: str) -> List[Product]:
+        return html_parser.parse_products(html_content)
+
+
+class ProcessPoolParseExecutor(IParseExecutor):
+    """
+    Runs ``parse_products`` in a pool of worker processes.
+
+    The parser instance and HTML are pickled to the worker and the resulting
+    ``Product`` dataclasses are pickled back. If the pool breaks (e.g. a worker
+    was killed) it is recreated on the next submit.
+    """
+
+    def __init__(self, max_workers: int):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_concurrent(self) -> bool:
+        return True
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def submit(self, html_parser: IHtmlParser, html_content: str) -> Future:
+        try:
+            return self._get_pool().submit(_parse_in_worker, html_parser, html_content)
+        except BrokenProcessPool:
+            logger.warning("Parse process pool is broken, recreating it")
+            self.shutdown(wait=False)
+            return self._get_pool().submit(_parse_in_worker, html_parser, html_content)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+_parse_executor: Optional[IParseExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def create_parse_executor(workers: Optional[int] = None) -> IParseExecutor:
+    workers = config.parse_workers if workers is None else workers
+    if workers and workers > 0:
+        return ProcessPoolParseExecutor(workers)
+    return InlineParseExecutor()
+
+
+def get_parse_executor() -> IParseExecutor:
+    global _parse_executor
+    if _parse_executor is None:
+        with _executor_lock:
+            if _parse_executor is None:
+                _parse_executor = create_parse_executor()
+    return _parse_executor
+
+
+def set_parse_executor(executor: Optional[IParseExecutor]) -> None:
+    """Replace the shared executor (``None`` resets to the configured default)."""
+    global _parse_executor
+    with _executor_lock:
+        previous, _parse_executor = _parse_executor, executor
+    if previous is not None and previous is not executor:
+        previous.shutdown(wait=False)
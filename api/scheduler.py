@@ -14,6 +14,9 @@ def _now():
         return datetime.now()
 
 from .views import get_scraper_factory
+from .core import BasePriceScraper as CoreBasePriceScraper
+from .interfaces import ScrapingResult
+from .scrapers.base import BasePriceScraper as SharedBasePriceScraper
 
 logger = logging.getLogger(__name__)
 
@@ -209,8 +212,78 @@ class BaseScheduler:
         
         return products_found, saved_count
     
+    def _supports_pipelined_parse(self, scraper) -> bool:
+        """Only split fetch/parse for scrapers using the stock scrape_products flow."""
+        executor = getattr(scraper, 'parse_executor', None)
+        if not getattr(executor, 'is_concurrent', False) or not hasattr(scraper, 'fetch_html'):
+            return False
+        scrape_impl = getattr(type(scraper), 'scrape_products', None)
+        return scrape_impl in (CoreBasePriceScraper.scrape_products, SharedBasePriceScraper.scrape_products)
+    
+    def _record_scrape_exception(self, vendor, keyword, page, e, vendor_result):
+        vendor_result['scrape_failures'] += 1
+        error_msg = f'{vendor} exception during scrape keyword "{keyword}" page {page}: {type(e).__name__}: {str(e)}'
+        vendor_result['errors'].append(error_msg)
+        logger.exception(error_msg)
+    
+    def _drain_parsed_pages(self, pending, wait, scraper, vendor, vendor_result, db_service, use_price_update, max_products_per_keyword):
+        """Process finished parse futures; returns (found, saved, still_pending)."""
+        found_total = 0
+        saved_total = 0
+        still_pending = []
+        
+        for keyword, page, url, future in pending:
+            if not wait and not future.done():
+                still_pending.append((keyword, page, url, future))
+                continue
+            try:
+                result = ScrapingResult(products=future.result(), success=True, url=url)
+                found, saved = self._process_scrape_result(
+                    scraper, result, vendor, keyword, page, vendor_result,
+                    db_service, use_price_update, max_products_per_keyword
+                )
+                found_total += found
+                saved_total += saved
+            except Exception as e:
+                self._record_scrape_exception(vendor, keyword, page, e, vendor_result)
+        
+        return found_total, saved_total, still_pending
+    
+    def _scrape_vendor_keywords_pipelined(self, vendor, scraper, cats, pages_per_keyword, vendor_result, db_service, use_price_update, max_products_per_keyword):
+        """
+        Fetch pages on this thread and hand the raw HTML to the scraper's parse
+        executor, so the next fetch overlaps with parsing of the previous pages.
+        """
+        total_products = 0
+        total_saved = 0
+        pending = []
+        drain_args = (scraper, vendor, vendor_result, db_service, use_price_update, max_products_per_keyword)
+        
+        for keyword in cats:
+            for page in range(pages_per_keyword):
+                vendor_result['scrape_attempts'] += 1
+                try:
+                    url, html_content = scraper.fetch_html(keyword, sort_by_price=True, page=page)
+                    future = scraper.parse_executor.submit(scraper.html_parser, html_content)
+                    pending.append((keyword, page, url, future))
+                except Exception as e:
+                    self._record_scrape_exception(vendor, keyword, page, e, vendor_result)
+                
+                found, saved, pending = self._drain_parsed_pages(pending, False, *drain_args)
+                total_products += found
+                total_saved += saved
+        
+        found, saved, _ = self._drain_parsed_pages(pending, True, *drain_args)
+        return total_products + found, total_saved + saved
+    
     def _scrape_vendor_keywords(self, vendor, scraper, cats, pages_per_keyword, vendor_result, db_service, use_price_update, max_products_per_keyword):
         """Scrape all keywords for a vendor and return total products found and saved."""
+        if self._supports_pipelined_parse(scraper):
+            return self._scrape_vendor_keywords_pipelined(
+                vendor, scraper, cats, pages_per_keyword, vendor_result,
+                db_service, use_price_update, max_products_per_keyword
+            )
+        
         total_products = 0
         total_saved = 0
         
@@ -226,10 +299,7 @@ class BaseScheduler:
                     total_products += found
                     total_saved += saved
                 except Exception as e:
-                    vendor_result['scrape_failures'] += 1
-                    error_msg = f'{vendor} exception during scrape keyword "{keyword}" page {page}: {type(e).__name__}: {str(e)}'
-                    vendor_result['errors'].append(error_msg)
-                    logger.exception(error_msg)
+                    self._record_scrape_exception(vendor, keyword, page, e, vendor_result)
         
         return total_products, total_saved
     
@@ -192,7 +192,9 @@ class TestScraperConfig(unittest.TestCase):
         expected_keys = {
             'request_timeout', 'max_retries', 'retry_delay', 'user_agent',
             'requests_per_minute', 'min_request_interval', 'cache_enabled',
-            'cache_ttl', 'log_level', 'log_requests', 'gemilang_base_url',
+            'cache_ttl', 'log_level', 'log_requests', 'parse_workers', 'name_memo_size',
+            'name_memo_dir', 'gov_wage_cache_max_entries', 'gov_wage_cache_max_bytes', 'gov_wage_scrape_workers',
+            'gov_wage_request_interval', 'gemilang_base_url',
             'gemilang_search_path', 'mitra10_base_url', 'mitra10_search_path',
             'juragan_material_base_url', 'juragan_material_search_path',
             'depobangunan_base_url', 'depobangunan_search_path'
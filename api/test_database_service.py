@@ -0,0 +1,128 @@
+from unittest.mock import MagicMock
+
+from django.test import TestCase
+
+from api.database_service import VendorDatabaseService
+from api.gemilang.database_service import GemilangDatabaseService
+from api.mitra10.database_service import Mitra10DatabaseService
+from api.tokopedia.database_service import TokopediaDatabaseService
+from db_pricing.models import GemilangProduct, Mitra10Product, PriceAnomaly, TokopediaProduct
+
+
+def _items(count, price=10000, **extra):
+    return [
+        dict({"name": f"Item {i}", "price": price, "url": f"https://example.com/{i}", "unit": "pcs"}, **extra)
+        for i in range(count)
+    ]
+
+
+class VendorDatabaseServiceTest(TestCase):
+
+    def test_rejects_unknown_table(self):
+        class BadService(VendorDatabaseService):
+            VENDOR = 'bad'
+            TABLE = 'users; DROP TABLE users'
+
+        with self.assertRaises(ValueError):
+            BadService()
+
+    def test_rejects_unknown_column(self):
+        class BadService(VendorDatabaseService):
+            VENDOR = 'mitra10'
+            TABLE = 'mitra10_products'
+            REFRESH_COLUMNS = ('password',)
+
+        with self.assertRaises(ValueError):
+            BadService()
+
+    def test_upsert_query_count_does_not_grow_with_batch(self):
+        service = Mitra10DatabaseService()
+        service.save(_items(300))
+        batch = _items(300, price=10500) + _items(450)[300:]
+
+        # History read, one lookup, one executemany, one UPDATE, history write and savepoints
+        with self.assertNumQueries(10):
+            result = service.save_with_price_update(batch)
+
+        self.assertEqual((result["updated"], result["inserted"]), (300, 150))
+        self.assertEqual(Mitra10Product.objects.filter(price=10500).count(), 300)
+
+    def test_update_chunks(self):
+        service = Mitra10DatabaseService()
+        service.WRITE_CHUNK_SIZE = 2
+        service.save(_items(5))
+
+        result = service.save_with_price_update(_items(5, price=11000))
+
+        self.assertEqual(result["updated"], 5)
+        self.assertEqual(set(Mitra10Product.objects.values_list('price', flat=True)), {11000})
+
+    def test_repeated_key_in_batch_applies_in_order(self):
+        service = Mitra10DatabaseService()
+        item = _items(1)[0]
+
+        result = service.save_with_price_update([item, dict(item, price=10500), dict(item, price=20000)])
+
+        self.assertEqual((result["inserted"], result["updated"], len(result["anomalies"])), (1, 1, 1))
+        self.assertEqual(result["anomalies"][0]["old_price"], 10500)
+        self.assertEqual(list(Mitra10Product.objects.values_list('price', flat=True)), [10500])
+
+    def test_invalid_rows_dropped_not_whole_batch(self):
+        service = Mitra10DatabaseService()
+        batch = _items(3)
+        batch[1]["price"] = -5
+
+        result = service.save_with_price_update(batch)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["inserted"], 2)
+        self.assertEqual(result["rejected"], [{"index": 1, "errors": ["price must be non-negative"]}])
+        self.assertFalse(Mitra10Product.objects.filter(name="Item 1").exists())
+
+    def test_gemilang_save_reports_first_error_when_nothing_valid(self):
+        success, error_msg = GemilangDatabaseService().save(_items(2, url="http://example.com"))
+
+        self.assertFalse(success)
+        self.assertEqual(error_msg, "Item 0: url must use HTTPS protocol for security")
+
+    def test_anomalies_saved_and_price_held(self):
+        service = Mitra10DatabaseService()
+        service.save(_items(3))
+
+        result = service.save_with_price_update(_items(3, price=20000))
+
+        self.assertEqual(len(result["anomalies"]), 3)
+        self.assertEqual(PriceAnomaly.objects.filter(vendor='mitra10').count(), 3)
+        self.assertEqual(set(Mitra10Product.objects.values_list('price', flat=True)), {10000})
+
+    def test_refresh_columns_written_when_price_unchanged(self):
+        service = GemilangDatabaseService()
+        service.save(_items(1, location="Old"))
+
+        result = service.save_with_price_update(_items(1, location="New"))
+
+        self.assertEqual(result["updated"], 1)
+        self.assertEqual(GemilangProduct.objects.get().location, "New")
+
+    def test_location_is_part_of_tokopedia_key(self):
+        service = TokopediaDatabaseService()
+        service.save(_items(1, location="Jakarta"))
+
+        result = service.save_with_price_update(_items(1, location="Bandung"))
+
+        self.assertEqual(result["inserted"], 1)
+        self.assertEqual(TokopediaProduct.objects.count(), 2)
+
+    def test_existing_rows_matched_by_sql_equality(self):
+        service = Mitra10DatabaseService()
+        rows = [service._row(item) for item in _items(2)]
+        cursor = MagicMock()
+        # The database reports a match for the second key, e.g. a row stored as "ITEM 1 "
+        # under MySQL's case-insensitive, pad-space collation
+        cursor.fetchall.return_value = [(1, 7, 9000)]
+
+        existing = service._fetch_existing(cursor, rows)
+
+        self.assertEqual(existing, {service._key(rows[1]): [7, 9000]})
+        sql = cursor.execute.call_args.args[0]
+        self.assertIn("WHERE name = %s AND url = %s AND unit = %s", sql)
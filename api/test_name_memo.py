@@ -0,0 +1,151 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from api.depobangunan.unit_parser import DepoBangunanUnitParser
+from api.utils import name_memo
+from api.utils.name_memo import (
+    NameMemo, clear_name_memos, get_name_memo, name_memo_stats, normalize_name, rules_fingerprint,
+)
+from db_pricing.categorization import ProductCategorizer
+
+
+class TestNameMemo(TestCase):
+
+    def test_hit_and_miss_counters(self):
+        memo = NameMemo('t', 'v1', maxsize=10)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return 'KG'
+
+        self.assertEqual(memo.resolve('semen 50kg', compute), 'KG')
+        self.assertEqual(memo.resolve('semen 50kg', compute), 'KG')
+        self.assertEqual(len(calls), 1)
+        stats = memo.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']), (1, 1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_none_results_are_memoized(self):
+        memo = NameMemo('t', 'v1', maxsize=10)
+        calls = []
+        memo.resolve('x', lambda: calls.append(1))
+        memo.resolve('x', lambda: calls.append(1))
+        self.assertEqual(len(calls), 1)
+
+    def test_lru_eviction(self):
+        memo = NameMemo('t', 'v1', maxsize=2)
+        memo.resolve('a', lambda: 1)
+        memo.resolve('b', lambda: 2)
+        memo.resolve('a', lambda: 1)
+        memo.resolve('c', lambda: 3)
+        self.assertEqual(len(memo), 2)
+        self.assertEqual(memo.resolve('a', lambda: 'recomputed'), 1)
+        self.assertEqual(memo.resolve('b', lambda: 'recomputed'), 'recomputed')
+
+    def test_zero_size_disables_memo(self):
+        memo = NameMemo('t', 'v1', maxsize=0)
+        calls = []
+        memo.resolve('a', lambda: calls.append(1))
+        memo.resolve('a', lambda: calls.append(1))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(memo), 0)
+
+    def test_persistence_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'memo.json')
+            memo = NameMemo('t', 'v1', persist_path=path)
+            memo.resolve('semen', lambda: 'SAK')
+            memo.save()
+
+            restored = NameMemo('t', 'v1', persist_path=path)
+            self.assertEqual(restored.load(), 1)
+            self.assertEqual(restored.resolve('semen', lambda: 'other'), 'SAK')
+
+    def test_persisted_memo_from_other_version_is_discarded(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'memo.json')
+            with open(path, 'w') as f:
+                json.dump({'version': 'old', 'entries': [['semen', 'SAK']]}, f)
+
+            memo = NameMemo('t', 'new', persist_path=path)
+            self.assertEqual(memo.load(), 0)
+            self.assertEqual(len(memo), 0)
+
+    def test_corrupt_persisted_file_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'memo.json')
+            with open(path, 'w') as f:
+                f.write('{not json')
+            self.assertEqual(NameMemo('t', 'v1', persist_path=path).load(), 0)
+
+
+class TestSharedMemos(TestCase):
+
+    def test_version_change_replaces_memo(self):
+        first = get_name_memo('test.shared', 'v1')
+        first.resolve('a', lambda: 1)
+        self.assertIs(get_name_memo('test.shared', 'v1'), first)
+
+        second = get_name_memo('test.shared', 'v2')
+        self.assertIsNot(second, first)
+        self.assertEqual(len(second), 0)
+
+    def test_stats_and_clear(self):
+        memo = get_name_memo('test.stats', 'v1')
+        memo.resolve('a', lambda: 1)
+        self.assertEqual(name_memo_stats()['test.stats']['misses'], 1)
+        clear_name_memos()
+        self.assertEqual(name_memo_stats()['test.stats']['size'], 0)
+
+    def test_memo_dir_enables_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.object(name_memo.config, 'name_memo_dir', tmp), \
+                 patch('api.utils.name_memo.atexit.register'):
+                memo = get_name_memo('test.persisted', 'v1')
+            self.assertEqual(memo.persist_path, os.path.join(tmp, 'test.persisted.json'))
+
+    def test_fingerprint_tracks_rule_changes(self):
+        self.assertEqual(rules_fingerprint({'a', 'b'}), rules_fingerprint({'b', 'a'}))
+        self.assertNotEqual(rules_fingerprint({'KG': ['kg']}), rules_fingerprint({'KG': ['kg', 'kilo']}))
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name('  Semen GRESIK 50kg '), 'semen gresik 50kg')
+
+
+class TestResolverMemoization(TestCase):
+
+    def test_categorizer_skips_recomputation_for_seen_names(self):
+        categorizer = ProductCategorizer()
+        with patch.object(ProductCategorizer, '_categorize_normalized', return_value='Alat Berat') as mock_rules:
+            self.assertEqual(categorizer.categorize('Excavator Mini'), 'Alat Berat')
+            self.assertEqual(ProductCategorizer().categorize('  excavator mini '), 'Alat Berat')
+        mock_rules.assert_called_once_with('excavator mini')
+
+    def test_categorizer_results_unchanged(self):
+        categorizer = ProductCategorizer()
+        first = categorizer.categorize('Semen Gresik 50kg')
+        self.assertEqual(categorizer.categorize('Semen Gresik 50kg'), first)
+        self.assertEqual(first, ProductCategorizer.CATEGORY_TANAH_PASIR_BATU_SEMEN)
+
+    def test_categorizer_rules_version_is_stable(self):
+        self.assertEqual(ProductCategorizer.rules_version(), ProductCategorizer.rules_version())
+
+    def test_subclass_with_other_rules_gets_own_version(self):
+        class CustomCategorizer(ProductCategorizer):
+            STEEL_KEYWORDS = {'besi'}
+
+        self.assertNotEqual(CustomCategorizer.rules_version(), ProductCategorizer.rules_version())
+
+    def test_unit_parser_skips_recomputation_for_seen_names(self):
+        parser = DepoBangunanUnitParser()
+        with patch.object(parser.extractor, 'extract_unit_from_name', return_value='KG') as mock_extract:
+            self.assertEqual(parser.parse_unit_from_product_name('Cat Air 5KG'), 'KG')
+            self.assertEqual(parser.parse_unit_from_product_name('cat air 5kg'), 'KG')
+        mock_extract.assert_called_once_with('Cat Air 5KG')
+
+    def test_unit_parser_non_string_bypasses_memo(self):
+        self.assertEqual(DepoBangunanUnitParser().parse_unit_from_product_name(None), 'PCS')
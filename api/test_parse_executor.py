@@ -0,0 +1,230 @@
+import pickle
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from api.core import BasePriceScraper
+from api.gemilang.html_parser import GemilangHtmlParser
+from api.interfaces import HtmlParserError, IParseExecutor, Product
+from api.parse_executor import (
+    InlineParseExecutor, ProcessPoolParseExecutor,
+    create_parse_executor, get_parse_executor, set_parse_executor,
+)
+from api.scheduler import BaseScheduler
+
+
+FIXTURE = Path(__file__).parent / 'gemilang' / 'tests' / 'gemilang_mock_results.html'
+
+
+class FailingParser:
+    def parse_products(self, html_content):
+        raise HtmlParserError("bad html")
+
+
+class TestInlineParseExecutor(unittest.TestCase):
+
+    def test_parse_calls_parser_directly(self):
+        parser = Mock()
+        parser.parse_products.return_value = [Product(name='a', price=1, url='u')]
+
+        result = InlineParseExecutor().parse(parser, '<html></html>')
+
+        parser.parse_products.assert_called_once_with('<html></html>')
+        self.assertEqual(result[0].name, 'a')
+
+    def test_submit_returns_completed_future(self):
+        parser = Mock()
+        parser.parse_products.return_value = []
+        future = InlineParseExecutor().submit(parser, '<html></html>')
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), [])
+
+    def test_submit_captures_exception(self):
+        future = InlineParseExecutor().submit(FailingParser(), '<html></html>')
+        with self.assertRaises(HtmlParserError):
+            future.result()
+
+    def test_is_not_concurrent(self):
+        self.assertFalse(InlineParseExecutor().is_concurrent)
+
+
+class TestProcessPoolParseExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ProcessPoolParseExecutor(max_workers=1)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_rejects_invalid_worker_count(self):
+        with self.assertRaises(ValueError):
+            ProcessPoolParseExecutor(max_workers=0)
+
+    def test_parses_in_worker_process(self):
+        html = FIXTURE.read_text(encoding='utf-8')
+        expected = GemilangHtmlParser().parse_products(html)
+
+        result = self.executor.parse(GemilangHtmlParser(), html)
+
+        self.assertEqual(result, expected)
+        self.assertTrue(all(isinstance(p, Product) for p in result))
+
+    def test_worker_exception_propagates(self):
+        with self.assertRaises(HtmlParserError):
+            self.executor.parse(FailingParser(), '<html></html>')
+
+    def test_is_concurrent(self):
+        self.assertTrue(self.executor.is_concurrent)
+
+    def test_shutdown_is_idempotent(self):
+        self.executor.shutdown()
+        self.executor.shutdown()
+
+
+class TestParseExecutorFactory(unittest.TestCase):
+
+    def tearDown(self):
+        set_parse_executor(None)
+
+    def test_zero_workers_is_inline(self):
+        self.assertIsInstance(create_parse_executor(0), InlineParseExecutor)
+
+    def test_positive_workers_is_process_pool(self):
+        executor = create_parse_executor(2)
+        self.assertIsInstance(executor, ProcessPoolParseExecutor)
+        self.assertEqual(executor.max_workers, 2)
+
+    def test_get_parse_executor_is_singleton(self):
+        set_parse_executor(None)
+        self.assertIs(get_parse_executor(), get_parse_executor())
+
+    def test_set_parse_executor_shuts_down_previous(self):
+        previous = Mock(spec=IParseExecutor)
+        set_parse_executor(previous)
+        set_parse_executor(InlineParseExecutor())
+        previous.shutdown.assert_called_once_with(wait=False)
+
+
+class TestProductPickling(unittest.TestCase):
+
+    def test_product_round_trips(self):
+        product = Product(name='Semen', price=60000, url='/semen', unit='SAK', location='Jakarta', sold_count=3)
+        self.assertEqual(pickle.loads(pickle.dumps(product)), product)
+
+
+class TestScraperUsesParseExecutor(unittest.TestCase):
+
+    def _scraper(self, executor):
+        http_client = Mock()
+        http_client.get.return_value = '<html></html>'
+        url_builder = Mock()
+        url_builder.build_search_url.return_value = 'https://example.com/?q=semen'
+        parser = Mock()
+        return BasePriceScraper(http_client, url_builder, parser, parse_executor=executor)
+
+    def test_scrape_products_delegates_parsing(self):
+        executor = Mock(spec=IParseExecutor)
+        executor.parse.return_value = [Product(name='a', price=1000, url='u')]
+        scraper = self._scraper(executor)
+
+        result = scraper.scrape_products('semen')
+
+        self.assertTrue(result.success)
+        executor.parse.assert_called_once_with(scraper.html_parser, '<html></html>')
+
+    def test_fetch_html_does_not_parse(self):
+        executor = Mock(spec=IParseExecutor)
+        scraper = self._scraper(executor)
+
+        url, html = scraper.fetch_html('semen', True, 0)
+
+        self.assertEqual(url, 'https://example.com/?q=semen')
+        self.assertEqual(html, '<html></html>')
+        executor.parse.assert_not_called()
+
+    def test_defaults_to_shared_executor(self):
+        shared = InlineParseExecutor()
+        with patch('api.core.get_parse_executor', return_value=shared):
+            scraper = BasePriceScraper(Mock(), Mock(), Mock())
+        self.assertIs(scraper.parse_executor, shared)
+
+
+class FakeDBService:
+    def __init__(self):
+        self.saved_data = []
+
+    def save(self, data):
+        self.saved_data.append(data)
+        return True
+
+
+class TestSchedulerPipelinedParse(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ProcessPoolParseExecutor(max_workers=2)
+        self.html = FIXTURE.read_text(encoding='utf-8')
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def _scraper(self):
+        http_client = Mock()
+        http_client.get.return_value = self.html
+        url_builder = Mock()
+        url_builder.build_search_url.side_effect = lambda k, s, p: f'https://example.com/?q={k}&p={p}'
+        return BasePriceScraper(http_client, url_builder, GemilangHtmlParser(), parse_executor=self.executor)
+
+    def _scheduler(self, scraper, db):
+        class S(BaseScheduler):
+            def get_categories(self, vendor, server_time):
+                return ['semen', 'pasir']
+
+            def create_scraper(self, vendor):
+                return scraper
+
+            def load_db_service(self, vendor):
+                return db
+
+        return S()
+
+    def test_pipelined_run_saves_every_page(self):
+        scraper = self._scraper()
+        db = FakeDBService()
+        expected_per_page = len(GemilangHtmlParser().parse_products(self.html))
+
+        summary = self._scheduler(scraper, db).run(vendors=['gemilang'], pages_per_keyword=2)
+
+        vendor = summary['vendors']['gemilang']
+        self.assertEqual(vendor['status'], 'success')
+        self.assertEqual(vendor['scrape_attempts'], 4)
+        self.assertEqual(vendor['products_found'], expected_per_page * 4)
+        self.assertEqual(len(db.saved_data), 4)
+
+    def test_pipelined_fetch_failure_is_recorded(self):
+        scraper = self._scraper()
+        scraper.http_client.get.side_effect = [Exception('timeout'), self.html, self.html, self.html]
+        db = FakeDBService()
+
+        summary = self._scheduler(scraper, db).run(vendors=['gemilang'], pages_per_keyword=2)
+
+        vendor = summary['vendors']['gemilang']
+        self.assertEqual(vendor['status'], 'partial_success')
+        self.assertEqual(vendor['scrape_failures'], 1)
+        self.assertEqual(len(db.saved_data), 3)
+
+    def test_inline_executor_uses_sequential_path(self):
+        scraper = self._scraper()
+        scraper.parse_executor = InlineParseExecutor()
+        self.assertFalse(BaseScheduler()._supports_pipelined_parse(scraper))
+
+    def test_overridden_scrape_products_is_not_pipelined(self):
+        class CustomScraper(BasePriceScraper):
+            def scrape_products(self, keyword, sort_by_price=True, page=0):
+                return super().scrape_products(keyword, sort_by_price, page)
+
+        scraper = CustomScraper(Mock(), Mock(), GemilangHtmlParser(), parse_executor=self.executor)
+        self.assertFalse(BaseScheduler()._supports_pipelined_parse(scraper))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from api.utils.parser_benchmark import (
+    ParserBenchmark, ParserBenchmarkResult, BenchmarkReport,
+    PARSER_FACTORIES, load_corpus, percentile, compare_results, main,
+)
+
+
+class TestPercentile(TestCase):
+
+    def test_empty_samples(self):
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_nearest_rank(self):
+        samples = [float(i) for i in range(1, 101)]
+        self.assertEqual(percentile(samples, 50), 50.0)
+        self.assertEqual(percentile(samples, 95), 95.0)
+        self.assertEqual(percentile(samples, 100), 100.0)
+
+    def test_single_sample(self):
+        self.assertEqual(percentile([3.0], 50), 3.0)
+        self.assertEqual(percentile([3.0], 95), 3.0)
+
+
+class TestLoadCorpus(TestCase):
+
+    def test_default_corpus_exists_for_every_vendor(self):
+        for vendor in PARSER_FACTORIES:
+            pages = load_corpus(vendor)
+            self.assertGreater(len(pages), 0, vendor)
+
+    def test_corpus_dir_layout(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            vendor_dir = Path(tmp) / 'gemilang'
+            vendor_dir.mkdir()
+            (vendor_dir / 'a.html').write_text('<html>a</html>', encoding='utf-8')
+            (vendor_dir / 'b.html').write_text('<html>b</html>', encoding='utf-8')
+            (vendor_dir / 'notes.txt').write_text('ignored', encoding='utf-8')
+
+            pages = load_corpus('gemilang', Path(tmp))
+            self.assertEqual(pages, ['<html>a</html>', '<html>b</html>'])
+
+    def test_missing_vendor_dir_returns_empty(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(load_corpus('mitra10', Path(tmp)), [])
+
+
+class TestParserBenchmark(TestCase):
+
+    def test_benchmark_vendor_reports_metrics(self):
+        benchmark = ParserBenchmark(iterations=2, vendors=['gemilang'])
+        result = benchmark.benchmark_vendor('gemilang')
+
+        self.assertEqual(result.vendor, 'gemilang')
+        self.assertEqual(result.pages, 1)
+        self.assertEqual(result.iterations, 2)
+        self.assertGreater(result.products, 0)
+        self.assertGreater(result.pages_per_sec, 0)
+        self.assertGreater(result.products_per_sec, 0)
+        self.assertGreaterEqual(result.p95_ms, result.p50_ms)
+        self.assertGreater(result.peak_memory_kb, 0)
+        self.assertEqual(result.errors, 0)
+
+    def test_juragan_benchmark_does_not_touch_network(self):
+        benchmark = ParserBenchmark(iterations=1)
+        with patch('api.juragan_material.html_parser.requests.get') as mock_get:
+            result = benchmark.benchmark_vendor('juraganmaterial')
+        mock_get.assert_not_called()
+        self.assertGreater(result.products, 0)
+
+    def test_government_wage_parser_is_benchmarked(self):
+        benchmark = ParserBenchmark(iterations=1)
+        result = benchmark.benchmark_vendor('government_wage')
+        self.assertEqual(result.products, 8)
+
+    def test_parser_errors_are_counted(self):
+        benchmark = ParserBenchmark(iterations=3)
+        with patch('api.gemilang.html_parser.GemilangHtmlParser.parse_products', side_effect=Exception('boom')):
+            result = benchmark.benchmark_vendor('gemilang', pages=['<html></html>'])
+        self.assertEqual(result.errors, 3)
+        self.assertEqual(result.products, 0)
+
+    def test_unknown_vendor_raises(self):
+        with self.assertRaises(ValueError):
+            ParserBenchmark(iterations=1).benchmark_vendor('unknown')
+
+    def test_run_and_write_report(self):
+        benchmark = ParserBenchmark(iterations=1, vendors=['gemilang', 'depobangunan'])
+        report = benchmark.run()
+        self.assertEqual([r.vendor for r in report.results], ['gemilang', 'depobangunan'])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = benchmark.write_report(report, str(Path(tmp) / 'out.json'))
+            with open(path) as f:
+                data = json.load(f)
+        self.assertIn('gemilang', data['results'])
+        self.assertIn('pages_per_sec', data['results']['gemilang'])
+        self.assertIn('peak_memory_kb', data['results']['depobangunan'])
+
+
+class TestCompareResults(TestCase):
+
+    def _report(self, pages_per_sec, p95_ms):
+        result = ParserBenchmarkResult(
+            vendor='gemilang', pages=1, iterations=1, products=10, total_time=1.0,
+            pages_per_sec=pages_per_sec, products_per_sec=10.0,
+            p50_ms=1.0, p95_ms=p95_ms, peak_memory_kb=10.0,
+        )
+        return BenchmarkReport(timestamp='t', python_version='3', results=[result]).to_dict()
+
+    def test_no_regression_within_tolerance(self):
+        comparison = compare_results(self._report(100.0, 10.0), self._report(95.0, 10.5))
+        self.assertFalse(comparison['gemilang']['regression'])
+
+    def test_throughput_regression(self):
+        comparison = compare_results(self._report(100.0, 10.0), self._report(50.0, 10.0))
+        self.assertTrue(comparison['gemilang']['regression'])
+        self.assertEqual(comparison['gemilang']['pages_per_sec_change'], -0.5)
+
+    def test_latency_regression(self):
+        comparison = compare_results(self._report(100.0, 10.0), self._report(100.0, 20.0))
+        self.assertTrue(comparison['gemilang']['regression'])
+
+    def test_vendor_missing_from_baseline_is_skipped(self):
+        baseline = {'results': {}}
+        self.assertEqual(compare_results(baseline, self._report(1.0, 1.0)), {})
+
+    def test_main_returns_nonzero_on_regression(self):
+        baseline = self._report(1e12, 1e-6)
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline_file = Path(tmp) / 'baseline.json'
+            baseline_file.write_text(json.dumps(baseline))
+            with patch.object(ParserBenchmark, 'write_report', return_value='report.json'), \
+                 patch('api.utils.parser_benchmark.ParserBenchmark.__init__', return_value=None) as mock_init:
+                def fake_run(self):
+                    return BenchmarkReport(timestamp='t', python_version='3',
+                                           results=[ParserBenchmarkResult(
+                                               vendor='gemilang', pages=1, iterations=1, products=1,
+                                               total_time=1.0, pages_per_sec=1.0, products_per_sec=1.0,
+                                               p50_ms=1.0, p95_ms=1.0, peak_memory_kb=1.0)])
+                with patch.object(ParserBenchmark, 'run', fake_run):
+                    self.assertEqual(main([str(baseline_file)]), 1)
+                mock_init.assert_called_once()
@@ -0,0 +1,121 @@
+import random
+import re
+import unittest
+
+from api.depobangunan.unit_parser import DepoBangunanUnitExtractor
+from api.gemilang.unit_parser import UnitExtractor, UnitPatternRepository
+from api.mitra10.unit_parser import Mitra10UnitExtractor, Mitra10UnitPatternRepository
+from api.unit_matcher import UnitPatternMatcher, get_unit_pattern_matcher, matcher_from_repository
+
+
+def _search_each_pattern(unit_patterns, priority_order, text):
+    # Reference implementation: the per-pattern loop the vendors used before
+    for unit in priority_order:
+        for pattern in unit_patterns.get(unit, []):
+            try:
+                boundaries = f'(?:^|\\s|[\\(\\[{{]|\\d)({pattern})(?:\\s|[\\)\\]}}]|$)'
+                if re.search(boundaries, text, re.IGNORECASE):
+                    return unit
+            except re.error:
+                continue
+    return None
+
+
+def _vendor_tables():
+    gemilang = UnitPatternRepository()
+    mitra10 = Mitra10UnitPatternRepository()
+    depo = DepoBangunanUnitExtractor()
+    tables = {}
+    for name, repo in (('gemilang', gemilang), ('mitra10', mitra10)):
+        order = repo.get_priority_order()
+        tables[name] = ({unit: repo.get_patterns(unit) for unit in order}, order)
+    tables['depobangunan'] = (depo.unit_patterns, depo.priority_order)
+    return tables
+
+
+class TestUnitPatternMatcher(unittest.TestCase):
+
+    def test_priority_wins_over_position(self):
+        matcher = UnitPatternMatcher({'KG': ['kg'], 'M': ['meter']}, ['KG', 'M'])
+        self.assertEqual(matcher.match('pipa 4 meter 2 kg'), 'KG')
+
+    def test_boundaries_are_respected(self):
+        matcher = UnitPatternMatcher({'KG': ['kg']}, ['KG'])
+        self.assertEqual(matcher.match('5kg'), 'KG')
+        self.assertEqual(matcher.match('(kg)'), 'KG')
+        self.assertIsNone(matcher.match('kgs'))
+        self.assertIsNone(matcher.match('akg'))
+
+    def test_tokens_sharing_a_separator_are_all_seen(self):
+        matcher = UnitPatternMatcher({'M': ['m'], 'KG': ['kg']}, ['M', 'KG'])
+        self.assertEqual(matcher.match('kg m'), 'M')
+
+    def test_invalid_pattern_is_skipped(self):
+        matcher = UnitPatternMatcher({'BAD': ['('], 'KG': ['kg']}, ['BAD', 'KG'])
+        self.assertEqual(matcher.units, ['KG'])
+        self.assertEqual(matcher.match('5 kg'), 'KG')
+
+    def test_empty_table_and_text(self):
+        self.assertIsNone(UnitPatternMatcher({}, []).match('5 kg'))
+        self.assertIsNone(UnitPatternMatcher({'KG': ['kg']}, ['KG']).match(''))
+
+    def test_matchers_are_shared_per_table(self):
+        patterns = {'KG': ['kg'], 'M': ['meter']}
+        first = get_unit_pattern_matcher(patterns, ['KG', 'M'])
+        self.assertIs(first, get_unit_pattern_matcher(dict(patterns), ['KG', 'M']))
+        self.assertIsNot(first, get_unit_pattern_matcher(patterns, ['M', 'KG']))
+
+    def test_matcher_from_repository(self):
+        matcher = matcher_from_repository(UnitPatternRepository())
+        self.assertEqual(matcher.match('semen 50 kg'), 'KG')
+
+
+class TestVendorEquivalence(unittest.TestCase):
+    """The compiled matcher must pick the same unit as the old per-pattern loop."""
+
+    NAMES = [
+        'Semen Tiga Roda 50 kg', 'Pipa PVC 1/2 inch 4 meter', 'Cat Tembok 5 liter putih',
+        'Besi beton 10mm x 12m', 'Keramik 40x40 cm dus', 'Triplek 9 mm lembar',
+        'Kabel NYM 3x2.5 mm2 roll', 'Paku 2" (1 kg)', 'Pasir m3', 'Bata ringan [pcs]',
+    ]
+
+    def _random_texts(self, unit_patterns, count=300):
+        words = [p for patterns in unit_patterns.values() for p in patterns if re.fullmatch(r'[a-z0-9 ²³]+', p)]
+        words += ['semen', 'pasir', '10', '5', '(', ')', 'x']
+        rng = random.Random(7)
+        return [
+            ''.join(rng.choice(words) + rng.choice(['', ' ', ' ', '(', ')']) for _ in range(rng.randint(1, 6)))
+            for _ in range(count)
+        ]
+
+    def test_vendor_tables_match_reference(self):
+        for vendor, (unit_patterns, order) in _vendor_tables().items():
+            matcher = UnitPatternMatcher(unit_patterns, order)
+            texts = [n.lower() for n in self.NAMES] + self._random_texts(unit_patterns)
+            for text in texts:
+                with self.subTest(vendor=vendor, text=text):
+                    self.assertEqual(matcher.match(text), _search_each_pattern(unit_patterns, order, text))
+
+    def test_extractors_use_shared_matcher(self):
+        gemilang = UnitExtractor()
+        mitra10 = Mitra10UnitExtractor()
+        depo = DepoBangunanUnitExtractor()
+        self.assertEqual(gemilang._extract_by_priority_patterns('semen 50 kg'), 'KG')
+        self.assertEqual(mitra10._priority_pattern_search('semen 50 kg'), 'KG')
+        self.assertEqual(depo._extract_by_priority_patterns('semen 50 kg'), 'KG')
+        self.assertIs(gemilang._get_matcher(), UnitExtractor()._get_matcher())
+        self.assertIs(depo._get_matcher(), DepoBangunanUnitExtractor()._get_matcher())
+
+    def test_swapping_repository_rebuilds_matcher(self):
+        class MeterOnly(UnitPatternRepository):
+            def get_priority_order(self):
+                return ['M']
+
+        extractor = UnitExtractor()
+        self.assertEqual(extractor._extract_by_priority_patterns('4 meter 2 kg'), 'KG')
+        extractor._pattern_repository = MeterOnly()
+        self.assertEqual(extractor._extract_by_priority_patterns('4 meter 2 kg'), 'M')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from django.test import TestCase
 from api.validation import (
+    BatchProductValidator,
     InputValidator, 
     ValidationResult, 
     ValidationError,
@@ -207,5 +208,63 @@ class ConvenienceFunctionsTestCase(TestCase):
         self.assertGreater(len(result.errors), 2)
 
 
+class BatchProductValidatorTestCase(TestCase):
+    """Test cases for the columnar product batch validator"""
+
+    def setUp(self):
+        self.validator = BatchProductValidator(
+            string_fields=('name', 'url', 'unit'),
+            integer_price=False,
+            max_price=1000000000,
+            name_length=(2, 500),
+            require_https=True,
+            blocked_hosts=BatchProductValidator.BLOCKED_HOSTS,
+            max_unit_length=50,
+        )
+
+    def _item(self, **overrides):
+        item = {"name": "Semen", "price": 50000, "url": "https://example.com/semen", "unit": "sak"}
+        item.update(overrides)
+        return item
+
+    def test_mask_flags_every_failing_check(self):
+        items = [
+            self._item(),
+            self._item(price=-1),
+            self._item(name="A", url="http://example.com"),
+            self._item(url="https://127.0.0.1/admin", unit="x" * 51),
+            {"name": "Semen"},
+            "not a dict",
+        ]
+        report = self.validator.validate(items)
+
+        self.assertEqual(report.mask[0], 0)
+        self.assertEqual(report.mask[1], BatchProductValidator.PRICE_NEGATIVE)
+        self.assertEqual(report.mask[2], BatchProductValidator.NAME_LENGTH | BatchProductValidator.URL_SCHEME)
+        self.assertEqual(report.mask[3], BatchProductValidator.URL_HOST | BatchProductValidator.UNIT_TOO_LONG)
+        self.assertEqual(report.mask[4], BatchProductValidator.MISSING_FIELD)
+        self.assertEqual(report.mask[5], BatchProductValidator.NOT_A_RECORD)
+
+    def test_invalid_rows_are_dropped_with_report(self):
+        items = [self._item(), self._item(price="mahal"), self._item(name="Bata")]
+        report = self.validator.validate(items)
+
+        self.assertFalse(report.is_valid)
+        self.assertEqual(report.valid_items, [items[0], items[2]])
+        self.assertEqual(report.rejected(), [{'index': 1, 'errors': ['price must be a number']}])
+        self.assertEqual(report.first_error(), "Item 1: price must be a number")
+        self.assertEqual(report.summary(), {'price must be a number': 1})
+
+    def test_integer_price_and_objects(self):
+        class Item:
+            name, price, url, unit = "Semen", 5.5, "https://example.com", "sak"
+
+        validator = BatchProductValidator(allow_objects=True)
+        report = validator.validate([Item(), self._item()])
+
+        self.assertEqual(list(report.mask), [BatchProductValidator.PRICE_NOT_NUMBER, 0])
+        self.assertIn('integer', report.errors_for(0)[0])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -132,7 +132,7 @@ class TokopediaPriceScraper(BasePriceScraper):
             
             # Use http_client directly with increased timeout for heavy JavaScript sites
             html_content = self.http_client.get(url, timeout=60)
-            products = self.html_parser.parse_products(html_content)
+            products = self._parse_html(html_content)
             
             return ScrapingResult(
                 products=products,
@@ -193,7 +193,7 @@ class TokopediaPriceScraper(BasePriceScraper):
                 
                 # Increase timeout to 60 seconds for heavy JavaScript sites
                 html_content = self.http_client.get(url, timeout=60)
-                products = self.html_parser.parse_products(html_content)
+                products = self._parse_html(html_content)
                 
                 # If no products found on this page, stop
                 if not products:
@@ -254,7 +254,7 @@ class TokopediaPriceScraper(BasePriceScraper):
                     )
                     
                     html_content = batch_client.get(url)
-                    products = self.html_parser.parse_products(html_content)
+                    products = self._parse_html(html_content)
                     all_products.extend(products)
                     
                 except Exception as e:
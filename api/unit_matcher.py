@@ -0,0 +1,101 @@
+"""
+Shared unit-recognition engine for the vendor unit parsers.
+
+Every vendor keeps its own ``unit -> [pattern, ...]`` table and priority order.
+Previously each extractor walked that table calling ``re.search`` once per
+pattern. ``UnitPatternMatcher`` compiles a table once into a single
+alternation with one named group per unit (in priority order) and resolves the
+winning unit in one ``finditer`` pass over the text.
+
+The matcher keeps the original boundary rule: a unit token must start at the
+beginning of the text or right after whitespace, an opening bracket or a digit,
+and must end at whitespace, a closing bracket or the end of the text. Both
+boundaries are zero-width and the whole expression is a lookahead, so every
+start position is tried exactly once and tokens that share a separator or
+overlap are still seen, just as with the per-pattern searches.
+"""
+import logging
+import re
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_PREFIX = r'(?:\A|(?<=[\s(\[{\d]))'
+_SUFFIX = r'(?=\s|[)\]}]|$)'
+
+
+class UnitPatternMatcher:
+    """Compiled, priority-aware matcher for one vendor's unit pattern table."""
+
+    def __init__(self, unit_patterns: Dict[str, Sequence[str]], priority_order: Sequence[str]):
+        self._units: List[str] = []
+        alternatives = []
+        for unit in priority_order:
+            patterns = [p for p in unit_patterns.get(unit, []) if self._is_valid(unit, p)]
+            if not patterns:
+                continue
+            group = f'u{len(self._units)}'
+            alternatives.append(f"(?P<{group}>{'|'.join(f'(?:{p})' for p in patterns)})")
+            self._units.append(unit)
+
+        self._ranks = {f'u{i}': i for i in range(len(self._units))}
+        self._regex = None
+        if alternatives:
+            self._regex = re.compile(
+                f"(?={_PREFIX}(?:{'|'.join(alternatives)}){_SUFFIX})", re.IGNORECASE
+            )
+
+    @staticmethod
+    def _is_valid(unit: str, pattern: str) -> bool:
+        try:
+            re.compile(f'{_PREFIX}(?:{pattern}){_SUFFIX}', re.IGNORECASE)
+            return True
+        except re.error as e:
+            logger.warning(f"Invalid regex pattern '{pattern}' for unit '{unit}': {e}")
+            return False
+
+    @property
+    def units(self) -> List[str]:
+        return self._units.copy()
+
+    def match(self, text: str) -> Optional[str]:
+        """Return the highest-priority unit found anywhere in ``text``."""
+        if self._regex is None or not text:
+            return None
+
+        best = None
+        for found in self._regex.finditer(text):
+            rank = self._ranks[found.lastgroup]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
+        return self._units[best] if best is not None else None
+
+
+_MatcherKey = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+_matchers: Dict[_MatcherKey, UnitPatternMatcher] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_unit_pattern_matcher(unit_patterns: Dict[str, Sequence[str]],
+                             priority_order: Sequence[str]) -> UnitPatternMatcher:
+    """Return the shared matcher for a pattern table, compiling it on first use."""
+    key = tuple((unit, tuple(unit_patterns.get(unit, []))) for unit in priority_order)
+    matcher = _matchers.get(key)
+    if matcher is None:
+        with _matchers_lock:
+            matcher = _matchers.get(key)
+            if matcher is None:
+                matcher = UnitPatternMatcher(unit_patterns, priority_order)
+                _matchers[key] = matcher
+    return matcher
+
+
+def matcher_from_repository(pattern_repository) -> UnitPatternMatcher:
+    """Build (or reuse) a matcher from a ``get_priority_order``/``get_patterns`` repository."""
+    priority_order = pattern_repository.get_priority_order()
+    unit_patterns = {unit: pattern_repository.get_patterns(unit) for unit in priority_order}
+    return get_unit_pattern_matcher(unit_patterns, priority_order)
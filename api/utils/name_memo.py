@@ -0,0 +1,170 @@
+"""
+Bounded memo for resolvers keyed by product name.
+
+Product names repeat heavily across result pages, keywords and scheduled runs,
+so unit parsing and categorization keep an LRU of results keyed on the name as
+each resolver already normalizes it (``name.lower().strip()``). Every memo
+carries a version stamp derived from the resolver's rule tables; a memo whose
+stamp no longer matches is dropped, both in-process and when loading a
+persisted file.
+
+Settings come from ``api.config``:
+
+- ``name_memo_size`` (``SCRAPER_NAME_MEMO_SIZE``): max entries per memo, ``0``
+  disables memoization.
+- ``name_memo_dir`` (``SCRAPER_NAME_MEMO_DIR``): when set, memos are loaded from
+  and saved to ``<dir>/<memo name>.json`` so a new process starts warm.
+"""
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from api.config import config
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_name(name: str) -> str:
+    return name.lower().strip()
+
+
+def rules_fingerprint(*tables: Any) -> str:
+    """Short stable hash of rule tables (dicts, lists, sets of strings)."""
+    def _default(value):
+        if isinstance(value, (set, frozenset)):
+            return sorted(value)
+        return str(value)
+
+    payload = json.dumps(tables, sort_keys=True, default=_default, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+
+
+class NameMemo:
+    """Thread-safe LRU of name -> resolved value with hit/miss counters."""
+
+    def __init__(self, name: str, version: str, maxsize: int = 10000, persist_path: Optional[str] = None):
+        self.name = name
+        self.version = version
+        self.maxsize = maxsize
+        self.persist_path = persist_path
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return the memoized value for ``key``, computing and storing it on a miss."""
+        if self.maxsize <= 0:
+            return compute()
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+        self._store(key, value)
+        return value
+
+    def _store(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'version': self.version,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def load(self) -> int:
+        """Load persisted entries; ignored if missing, unreadable or from another version."""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return 0
+        try:
+            with open(self.persist_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load name memo '{self.name}': {e}")
+            return 0
+
+        if data.get('version') != self.version:
+            logger.info(f"Discarding name memo '{self.name}': rules changed")
+            return 0
+
+        for key, value in data.get('entries', []):
+            self._store(key, value)
+        return len(self._entries)
+
+    def save(self) -> None:
+        if not self.persist_path:
+            return
+        with self._lock:
+            entries = list(self._entries.items())
+        try:
+            os.makedirs(os.path.dirname(self.persist_path) or '.', exist_ok=True)
+            tmp_path = f"{self.persist_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.version, 'entries': entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.persist_path)
+        except OSError as e:
+            logger.warning(f"Could not save name memo '{self.name}': {e}")
+
+
+_memos: Dict[str, NameMemo] = {}
+_memos_lock = threading.Lock()
+
+
+def get_name_memo(name: str, version: str) -> NameMemo:
+    """
+    Return the shared memo ``name``.
+
+    A memo built for a different rules version is replaced by an empty one.
+    """
+    memo = _memos.get(name)
+    if memo is not None and memo.version == version:
+        return memo
+
+    with _memos_lock:
+        memo = _memos.get(name)
+        if memo is None or memo.version != version:
+            persist_path = os.path.join(config.name_memo_dir, f"{name}.json") if config.name_memo_dir else None
+            memo = NameMemo(name, version, maxsize=config.name_memo_size, persist_path=persist_path)
+            if persist_path:
+                memo.load()
+                atexit.register(memo.save)
+            _memos[name] = memo
+    return memo
+
+
+def name_memo_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: memo.get_stats() for name, memo in list(_memos.items())}
+
+
+def clear_name_memos() -> None:
+    for memo in list(_memos.values()):
+        memo.clear()
@@ -0,0 +1,290 @@
+"""
+Offline benchmark suite for vendor ``parse_products`` implementations.
+
+Unlike the per-vendor profilers, this never touches the network: every parser
+is run over a corpus of stored HTML pages so numbers are repeatable between
+commits. Results are written as JSON so two runs can be diffed with
+``compare_results``.
+
+Corpus layout (``BENCHMARK_CORPUS_DIR``)::
+
+    <corpus_dir>/<vendor>/*.html
+
+When no corpus directory is configured, the mock result pages shipped with each
+vendor's tests are used.
+"""
+import gc
+import json
+import math
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from api.utils.base_profiler import load_env
+
+
+def _gemilang_parser():
+    from api.gemilang.html_parser import GemilangHtmlParser
+    return GemilangHtmlParser()
+
+
+def _depobangunan_parser():
+    from api.depobangunan.html_parser import DepoHtmlParser
+    return DepoHtmlParser()
+
+
+def _juraganmaterial_parser():
+    from api.juragan_material.html_parser import JuraganMaterialHtmlParser
+    parser = JuraganMaterialHtmlParser()
+    # Unit and location come from per-product detail page requests; stub them
+    # out so the benchmark measures listing parsing only and stays offline.
+    parser._extract_product_unit = lambda url: ''
+    parser._extract_product_location_xpath = lambda url: ''
+    return parser
+
+
+def _mitra10_parser():
+    from api.mitra10.html_parser import Mitra10HtmlParser
+    return Mitra10HtmlParser()
+
+
+def _tokopedia_parser():
+    from api.tokopedia.html_parser import TokopediaHtmlParser
+    return TokopediaHtmlParser()
+
+
+def _government_wage_parser():
+    from api.government_wage.html_parser import GovernmentWageHtmlParser
+    return GovernmentWageHtmlParser()
+
+
+PARSER_FACTORIES: Dict[str, Callable[[], Any]] = {
+    'gemilang': _gemilang_parser,
+    'depobangunan': _depobangunan_parser,
+    'juraganmaterial': _juraganmaterial_parser,
+    'mitra10': _mitra10_parser,
+    'tokopedia': _tokopedia_parser,
+    'government_wage': _government_wage_parser,
+}
+
+DEFAULT_CORPUS: Dict[str, List[str]] = {
+    'gemilang': ['api/gemilang/tests/gemilang_mock_results.html'],
+    'depobangunan': ['api/depobangunan/tests/depo_mock_results.html'],
+    'juraganmaterial': ['api/juragan_material/tests/juraganmaterial_mock_results.html'],
+    'mitra10': ['api/mitra10/tests/mitra10_mock_results.html'],
+    'tokopedia': ['api/tokopedia/tests/tokopedia_mock_results.html'],
+    'government_wage': ['api/government_wage/tests/government_wage_mock_results.html'],
+}
+
+
+@dataclass
+class ParserBenchmarkResult:
+    vendor: str
+    pages: int
+    iterations: int
+    products: int
+    total_time: float
+    pages_per_sec: float
+    products_per_sec: float
+    p50_ms: float
+    p95_ms: float
+    peak_memory_kb: float
+    errors: int = 0
+
+
+@dataclass
+class BenchmarkReport:
+    timestamp: str
+    python_version: str
+    results: List[ParserBenchmarkResult] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'timestamp': self.timestamp,
+            'python_version': self.python_version,
+            'results': {r.vendor: asdict(r) for r in self.results},
+        }
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile; returns 0.0 for an empty sample list."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = math.ceil(pct / 100.0 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+def load_corpus(vendor: str, corpus_dir: Optional[Path] = None) -> List[str]:
+    if corpus_dir is not None:
+        vendor_dir = Path(corpus_dir) / vendor
+        paths = sorted(vendor_dir.glob('*.html')) if vendor_dir.is_dir() else []
+    else:
+        paths = [project_root / p for p in DEFAULT_CORPUS.get(vendor, [])]
+
+    return [p.read_text(encoding='utf-8') for p in paths if p.exists()]
+
+
+class ParserBenchmark:
+
+    def __init__(self, corpus_dir: Optional[str] = None, iterations: Optional[int] = None,
+                 vendors: Optional[List[str]] = None):
+        self.ENV = load_env()
+        corpus_dir = corpus_dir or self.ENV.get('BENCHMARK_CORPUS_DIR')
+        self.corpus_dir = Path(corpus_dir) if corpus_dir else None
+        self.iterations = iterations or int(self.ENV.get('BENCHMARK_ITERATIONS', '20'))
+        self.vendors = vendors or list(PARSER_FACTORIES.keys())
+
+    def benchmark_vendor(self, vendor: str, pages: Optional[List[str]] = None) -> ParserBenchmarkResult:
+        if vendor not in PARSER_FACTORIES:
+            raise ValueError(f"Unknown vendor: {vendor}")
+
+        parser = PARSER_FACTORIES[vendor]()
+        pages = pages if pages is not None else load_corpus(vendor, self.corpus_dir)
+
+        # Warm-up pass so lazy imports and regex compilation are not measured
+        for html in pages:
+            self._parse_quietly(parser, html)
+
+        latencies: List[float] = []
+        products = 0
+        errors = 0
+
+        gc.collect()
+        started = time.perf_counter()
+        for _ in range(self.iterations):
+            for html in pages:
+                t0 = time.perf_counter()
+                parsed = self._parse_quietly(parser, html)
+                latencies.append(time.perf_counter() - t0)
+                if parsed is None:
+                    errors += 1
+                else:
+                    products += len(parsed)
+        total_time = time.perf_counter() - started
+
+        peak = self._measure_peak_memory(parser, pages)
+
+        page_count = len(latencies)
+        return ParserBenchmarkResult(
+            vendor=vendor,
+            pages=len(pages),
+            iterations=self.iterations,
+            products=products,
+            total_time=round(total_time, 6),
+            pages_per_sec=round(page_count / total_time, 2) if total_time > 0 else 0.0,
+            products_per_sec=round(products / total_time, 2) if total_time > 0 else 0.0,
+            p50_ms=round(percentile(latencies, 50) * 1000, 4),
+            p95_ms=round(percentile(latencies, 95) * 1000, 4),
+            peak_memory_kb=round(peak / 1024, 2),
+            errors=errors,
+        )
+
+    def run(self) -> BenchmarkReport:
+        report = BenchmarkReport(
+            timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
+            python_version=sys.version.split()[0],
+        )
+        for vendor in self.vendors:
+            report.results.append(self.benchmark_vendor(vendor))
+        return report
+
+    def write_report(self, report: BenchmarkReport, output_file: Optional[str] = None) -> str:
+        if output_file:
+            path = Path(output_file)
+        else:
+            output_dir = project_root / self.ENV.get('BENCHMARK_OUTPUT_DIR', 'parser_benchmarks')
+            output_dir.mkdir(exist_ok=True)
+            path = output_dir / f"parser_benchmark_{int(time.time())}.json"
+
+        with open(path, 'w') as f:
+            json.dump(report.to_dict(), f, indent=2)
+        return str(path)
+
+    def _measure_peak_memory(self, parser, pages: List[str]) -> int:
+        # Separate pass: tracemalloc slows allocation too much to share with timing
+        gc.collect()
+        tracemalloc.start()
+        try:
+            for html in pages:
+                self._parse_quietly(parser, html)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+    @staticmethod
+    def _parse_quietly(parser, html: str):
+        try:
+            return parser.parse_products(html)
+        except Exception:
+            return None
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    tolerance: float = 0.10) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare two report dicts (as written by ``write_report``).
+
+    A vendor is flagged as a regression when its pages/sec dropped or its p95
+    latency grew by more than ``tolerance`` (fraction) relative to baseline.
+    """
+    comparison = {}
+    base_results = baseline.get('results', {})
+    for vendor, cur in current.get('results', {}).items():
+        base = base_results.get(vendor)
+        if not base:
+            continue
+
+        throughput_change = _relative_change(base['pages_per_sec'], cur['pages_per_sec'])
+        p95_change = _relative_change(base['p95_ms'], cur['p95_ms'])
+        comparison[vendor] = {
+            'pages_per_sec_change': throughput_change,
+            'p95_ms_change': p95_change,
+            'regression': throughput_change < -tolerance or p95_change > tolerance,
+        }
+    return comparison
+
+
+def _relative_change(before: float, after: float) -> float:
+    if not before:
+        return 0.0
+    return round((after - before) / before, 4)
+
+
+def print_summary(report: BenchmarkReport):
+    print("\nParser Benchmark Summary:")
+    for r in report.results:
+        print(f"  {r.vendor}: {r.pages_per_sec:.1f} pages/sec, {r.products_per_sec:.1f} products/sec, "
+              f"p50 {r.p50_ms:.2f}ms, p95 {r.p95_ms:.2f}ms, peak {r.peak_memory_kb:.0f}KB")
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = argv if argv is not None else sys.argv[1:]
+    baseline_file = argv[0] if argv else None
+
+    benchmark = ParserBenchmark()
+    report = benchmark.run()
+    report_file = benchmark.write_report(report)
+    print_summary(report)
+    print(f"Report saved to: {report_file}")
+
+    if baseline_file:
+        with open(baseline_file) as f:
+            baseline = json.load(f)
+        regressions = [v for v, c in compare_results(baseline, report.to_dict()).items() if c['regression']]
+        if regressions:
+            print(f"Regressions detected: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
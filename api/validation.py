@@ -1,7 +1,12 @@
+import logging
 import re
 import urllib.parse
-from typing import Dict, List, Optional, Any, Type
-from dataclasses import dataclass
+from array import array
+from itertools import compress
+from typing import Dict, List, Optional, Any, Type, Sequence, Tuple
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -221,4 +226,156 @@ def get_validation_errors_dict(validation_result: ValidationResult) -> Dict[str,
             errors_dict[error.field] = []
         errors_dict[error.field].append(error.message)
     
-    return errors_dict
\ No newline at end of file
+    return errors_dict
+
+
+_MISSING = object()
+
+
+@dataclass
+class BatchValidationReport:
+    """Outcome of validating a product batch; ``mask`` holds one error bitmask per row"""
+    items: Sequence[Any]
+    mask: array
+    messages: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def is_valid(self) -> bool:
+        return not any(self.mask)
+
+    @property
+    def valid_items(self) -> List[Any]:
+        return list(compress(self.items, (not flags for flags in self.mask)))
+
+    @property
+    def rejected_indexes(self) -> List[int]:
+        return [idx for idx, flags in enumerate(self.mask) if flags]
+
+    def errors_for(self, idx: int) -> List[str]:
+        flags = self.mask[idx]
+        return [message for flag, message in self.messages.items() if flags & flag]
+
+    def first_error(self) -> str:
+        for idx in self.rejected_indexes[:1]:
+            return f"Item {idx}: {self.errors_for(idx)[0]}"
+        return ""
+
+    def rejected(self) -> List[Dict[str, Any]]:
+        return [{'index': idx, 'errors': self.errors_for(idx)} for idx in self.rejected_indexes]
+
+    def summary(self) -> Dict[str, int]:
+        counts = {}
+        for flag, message in self.messages.items():
+            hits = sum(1 for flags in self.mask if flags & flag)
+            if hits:
+                counts[message] = hits
+        return counts
+
+
+class BatchProductValidator:
+    """
+    Validates scraped product rows column by column.
+
+    Each check runs once over a whole column and sets its bit in the row's
+    error mask, so a bad row never stops the rest of the batch from being checked.
+    """
+    NOT_A_RECORD = 1 << 0
+    MISSING_FIELD = 1 << 1
+    WRONG_TYPE = 1 << 2
+    PRICE_NOT_NUMBER = 1 << 3
+    PRICE_NEGATIVE = 1 << 4
+    PRICE_TOO_HIGH = 1 << 5
+    NAME_LENGTH = 1 << 6
+    URL_SCHEME = 1 << 7
+    URL_HOST = 1 << 8
+    UNIT_TOO_LONG = 1 << 9
+
+    BLOCKED_HOSTS = ('localhost', '127.0.0.1', '0.0.0.0')
+
+    def __init__(self, required_fields: Tuple[str, ...] = ('name', 'price', 'url', 'unit'),
+                 string_fields: Tuple[str, ...] = (), integer_price: bool = True,
+                 max_price: Optional[int] = None, name_length: Optional[Tuple[int, int]] = None,
+                 require_https: bool = False, blocked_hosts: Tuple[str, ...] = (),
+                 max_unit_length: Optional[int] = None, allow_objects: bool = False):
+        self.required_fields = required_fields
+        self.string_fields = string_fields
+        self.integer_price = integer_price
+        self.max_price = max_price
+        self.name_length = name_length
+        self.require_https = require_https
+        self.blocked_hosts = re.compile('|'.join(map(re.escape, blocked_hosts))) if blocked_hosts else None
+        self.max_unit_length = max_unit_length
+        self.allow_objects = allow_objects
+        self.messages = {
+            self.NOT_A_RECORD: 'must be a dictionary',
+            self.MISSING_FIELD: 'missing required fields',
+            self.WRONG_TYPE: 'text fields must be strings',
+            self.PRICE_NOT_NUMBER: 'price must be an integer' if integer_price else 'price must be a number',
+            self.PRICE_NEGATIVE: 'price must be non-negative',
+            self.PRICE_TOO_HIGH: 'price exceeds reasonable limit',
+            self.NAME_LENGTH: 'name length must be between {} and {}'.format(*(name_length or (0, 0))),
+            self.URL_SCHEME: 'url must use HTTPS protocol for security',
+            self.URL_HOST: 'invalid URL',
+            self.UNIT_TOO_LONG: 'unit too long',
+        }
+
+    def _column(self, items: Sequence[Any], name: str) -> List[Any]:
+        if self.allow_objects:
+            return [item.get(name, _MISSING) if isinstance(item, dict) else getattr(item, name, _MISSING)
+                    for item in items]
+        return [item.get(name, _MISSING) if isinstance(item, dict) else _MISSING for item in items]
+
+    @staticmethod
+    def _flag(mask: array, flag: int, hits) -> None:
+        for idx in compress(range(len(mask)), hits):
+            mask[idx] |= flag
+
+    def validate(self, items: Sequence[Any]) -> BatchValidationReport:
+        mask = array('H', [0]) * len(items)
+        if not self.allow_objects:
+            records = [isinstance(item, dict) for item in items]
+            self._flag(mask, self.NOT_A_RECORD, (not ok for ok in records))
+        else:
+            records = [True] * len(items)
+
+        columns = {name: self._column(items, name) for name in
+                   set(self.required_fields) | set(self.string_fields) | {'name', 'price', 'url', 'unit'}}
+        missing = [False] * len(items)
+        for name in self.required_fields:
+            missing = [gone or value is _MISSING for gone, value in zip(missing, columns[name])]
+        self._flag(mask, self.MISSING_FIELD, (gone and ok for gone, ok in zip(missing, records)))
+
+        for name in self.string_fields:
+            self._flag(mask, self.WRONG_TYPE,
+                       (value is not _MISSING and not isinstance(value, str) for value in columns[name]))
+
+        self._check_prices(mask, columns['price'])
+        self._check_text(mask, columns['name'], columns['url'], columns['unit'])
+        return BatchValidationReport(items=items, mask=mask, messages=self.messages)
+
+    def _check_prices(self, mask: array, prices: List[Any]) -> None:
+        number_types = int if self.integer_price else (int, float)
+        numeric = [isinstance(price, number_types) for price in prices]
+        self._flag(mask, self.PRICE_NOT_NUMBER,
+                   (not ok and price is not _MISSING for ok, price in zip(numeric, prices)))
+        self._flag(mask, self.PRICE_NEGATIVE, (ok and price < 0 for ok, price in zip(numeric, prices)))
+        if self.max_price is not None:
+            self._flag(mask, self.PRICE_TOO_HIGH,
+                       (ok and price > self.max_price for ok, price in zip(numeric, prices)))
+
+    def _check_text(self, mask: array, names: List[Any], urls: List[Any], units: List[Any]) -> None:
+        if self.name_length:
+            low, high = self.name_length
+            self._flag(mask, self.NAME_LENGTH,
+                       (isinstance(name, str) and not low <= len(name) <= high for name in names))
+        if self.require_https:
+            self._flag(mask, self.URL_SCHEME,
+                       (isinstance(url, str) and not url.startswith('https://') for url in urls))
+        if self.blocked_hosts:
+            blocked = [isinstance(url, str) and self.blocked_hosts.search(url.lower()) is not None for url in urls]
+            for idx in compress(range(len(urls)), blocked):
+                logger.critical(f"SSRF attempt detected: {urls[idx]}")
+            self._flag(mask, self.URL_HOST, blocked)
+        if self.max_unit_length is not None:
+            self._flag(mask, self.UNIT_TOO_LONG,
+                       (isinstance(unit, str) and len(unit) > self.max_unit_length for unit in units))
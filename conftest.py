@@ -6,6 +6,8 @@ import pytest
 
 # Configure Django settings before any tests run
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'price_scraper_rencanakan_api.settings')
+# Keep the cross-worker cache in memory so test runs leave nothing on disk
+os.environ.setdefault('SHARED_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
 django.setup()
 
 
@@ -48,3 +50,27 @@ def enable_db_access_for_all_tests(db):
         except Exception:
             pass
     yield
+
+
+@pytest.fixture(autouse=True)
+def clear_name_memos():
+    """Start every test with empty unit/category memos so patched resolvers are always called."""
+    from api.utils.name_memo import clear_name_memos as _clear
+    _clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_anomaly_statistics():
+    """Drop the cached anomaly statistics so each test counts its own rows."""
+    from db_pricing.anomaly_service import PriceAnomalyService
+    PriceAnomalyService._statistics_cache().delete(PriceAnomalyService.STATISTICS_CACHE_KEY)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_dashboard_search_cache():
+    """Start every test without cached dashboard search results."""
+    from dashboard.views import invalidate_search_cache
+    invalidate_search_cache()
+    yield
@@ -0,0 +1,131 @@
+"""
+Precomputed lookups over a region's HSPK wage rows
+
+``WageIndex`` is built once when a region dataset is cached and travels with
+it, so a filtered, sorted page is a handful of index lookups plus a slice
+instead of a scan and a full sort of every row:
+
+- an inverted index of the ``work_description``/``work_code`` tokens narrows
+  a search to the rows that can contain it before the substring check;
+- rows are bucketed by category;
+- rows are pre-sorted by price for range lookups and by every sortable
+  column in both directions.
+
+Results match a linear filter followed by a stable sort of the full list.
+"""
+import re
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+SORT_KEYS = {
+    'item_number': lambda x: int(x.get('item_number', 0)) if str(x.get('item_number', '')).isdigit() else 0,
+    'work_code': lambda x: x.get('work_code', ''),
+    'work_description': lambda x: x.get('work_description', ''),
+    'unit': lambda x: x.get('unit', ''),
+    'unit_price_idr': lambda x: x.get('unit_price_idr', 0),
+}
+DEFAULT_SORT = 'item_number'
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _search_text(row: Dict[str, Any]) -> Tuple[str, str]:
+    return row.get('work_description', '').lower(), row.get('work_code', '').lower()
+
+
+class WageIndex:
+    """Wage rows of one region with search, category, price and sort indexes"""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self._postings: Dict[str, List[int]] = {}
+        self._categories: Dict[str, List[int]] = {}
+        for position, row in enumerate(rows):
+            for token in set(tokenize(' '.join(_search_text(row)))):
+                self._postings.setdefault(token, []).append(position)
+            self._categories.setdefault(row.get('category', ''), []).append(position)
+
+        # (column, descending) -> row positions in that order, or None if the column cannot be sorted
+        self._orderings: Dict[Tuple[str, bool], Optional[List[int]]] = {}
+        self._ranks: Dict[Tuple[str, bool], List[int]] = {}
+        for column, key in SORT_KEYS.items():
+            for descending in (False, True):
+                order = self._sorted_positions(key, descending)
+                self._orderings[(column, descending)] = order
+                if order is not None:
+                    rank = [0] * len(rows)
+                    for position_rank, position in enumerate(order):
+                        rank[position] = position_rank
+                    self._ranks[(column, descending)] = rank
+
+        self._price_order = self._orderings[('unit_price_idr', False)]
+        self._prices = None
+        if self._price_order is not None:
+            self._prices = [SORT_KEYS['unit_price_idr'](rows[position]) for position in self._price_order]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _sorted_positions(self, key, descending: bool) -> Optional[List[int]]:
+        try:
+            return sorted(range(len(self.rows)), key=lambda position: key(self.rows[position]), reverse=descending)
+        except (TypeError, ValueError):
+            return None
+
+    def search(self, query: str) -> Set[int]:
+        """Positions of rows whose description or code contains ``query``, case-insensitively"""
+        query_lower = query.lower()
+        query_tokens = set(tokenize(query_lower))
+        if query_tokens:
+            candidates = None
+            for query_token in query_tokens:
+                # A substring match puts every query token inside some token of the row
+                matching = set()
+                for token, positions in self._postings.items():
+                    if query_token in token:
+                        matching.update(positions)
+                candidates = matching if candidates is None else candidates & matching
+                if not candidates:
+                    return set()
+        else:
+            candidates = range(len(self.rows))
+
+        return {
+            position for position in candidates
+            if any(query_lower in text for text in _search_text(self.rows[position]))
+        }
+
+    def category(self, category: str) -> Set[int]:
+        return set(self._categories.get(category, ()))
+
+    def price_between(self, min_price, max_price) -> Set[int]:
+        """Positions of rows priced within [min_price, max_price]"""
+        if self._prices is None:
+            return {
+                position for position, row in enumerate(self.rows)
+                if min_price <= row.get('unit_price_idr', 0) <= max_price
+            }
+        start = bisect_left(self._prices, min_price)
+        end = bisect_right(self._prices, max_price)
+        return set(self._price_order[start:end])
+
+    def ordered(self, positions: Optional[Iterable[int]], sort_by: str, sort_order: str) -> List[Dict[str, Any]]:
+        """
+        Rows at ``positions`` (every row when None) sorted by ``sort_by``
+
+        Columns that cannot be sorted keep the scraped order.
+        """
+        descending = sort_order.lower() == 'desc'
+        column = sort_by if sort_by in SORT_KEYS else DEFAULT_SORT
+        order = self._orderings[(column, descending)]
+
+        if positions is None:
+            return [self.rows[position] for position in order] if order is not None else list(self.rows)
+        if order is None:
+            return [self.rows[position] for position in sorted(positions)]
+        rank = self._ranks[(column, descending)]
+        return [self.rows[position] for position in sorted(positions, key=rank.__getitem__)]
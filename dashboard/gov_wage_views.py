@@ -7,10 +7,16 @@ from django.db.models import Q
 import json
 import logging
 import re
+import time
 
 # Import the existing government wage API
 from api.government_wage.factory import create_government_wage_scraper
 from api.government_wage.simple_cache import get_cache, make_cache_key
+from api.government_wage.parallel import RequestBudget, scrape_regions
+from api.government_wage.scraper import GovernmentWageScraper
+from api.government_wage.single_flight import get_or_fill, store
+
+from .gov_wage_index import SORT_KEYS, DEFAULT_SORT, WageIndex
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +25,9 @@ DEFAULT_REGION = 'Kab. Cilacap'
 DEFAULT_PROVINCE = 'Jawa Tengah'
 HTML_PARSER = 'html.parser'
 DEFAULT_TOTAL_ITEMS = 387
-CACHE_TIMEOUT_SHORT = 900  # 15 minutes
 CACHE_TIMEOUT_LONG = 1800  # 30 minutes
+# Full-region scrapes are expensive, so the shared dataset is kept longer
+REGION_DATASET_TIMEOUT = CACHE_TIMEOUT_LONG
 
 
 @require_GET
@@ -152,15 +159,7 @@ def get_wage_data(request):
 
 def get_page_data_smart(region, page, per_page):
     try:
-        # Check cache for this specific page
-        cache = get_cache()
-        cache_key = make_cache_key("page", f"{region}_{page}_{per_page}")
-        cached_data = cache.get(cache_key)
-        
-        if cached_data:
-            return JsonResponse(cached_data)
-        
-        # Scrape specific page using custom page scraper
+        # Page slice of the region dataset
         wage_data, total_items = scrape_government_page(region, page, per_page)
         
         if total_items == 0:
@@ -189,10 +188,7 @@ def get_page_data_smart(region, page, per_page):
             'scraping_method': 'smart_pagination'
         }
         
-        # Cache this page for 15 minutes
-        cache.set(cache_key, response_data, 900)
-        
-        logger.info(f"Smart pagination: scraped page {page} for {region}, got {len(wage_data)} items")
+        logger.info(f"Smart pagination: page {page} for {region}, got {len(wage_data)} items")
         return JsonResponse(response_data)
         
     except Exception as e:
@@ -202,111 +198,155 @@ def get_page_data_smart(region, page, per_page):
         return get_page_data_filtered(region, '', '', '', page, per_page, 'item_number', 'asc')
 
 
+def get_region_dataset(region):
+    """
+    Canonical HSPK rows of a region, scraped once per expiry
+    
+    Every dashboard view (pages, filters, sorts) is derived from this one
+    cached dataset instead of caching its own copy. The rows are cached with
+    their filter and sort indexes, built once per fill. Only real scrapes are
+    cached: when the fill fails or finds nothing, mock rows are served
+    uncached, and a failed early refresh keeps the previous entry.
+    Returns: (WageIndex, whether it came from the cache)
+    """
+    try:
+        dataset, cached = get_or_fill(
+            get_cache(),
+            _region_dataset_key(region),
+            lambda: WageIndex(_scrape_region_wage_data(region)),
+            REGION_DATASET_TIMEOUT,
+        )
+    except Exception as e:
+        logger.error(f"HSPK scrape for {region} failed: {str(e)}", exc_info=True)
+        dataset, cached = None, False
+    
+    if not dataset:
+        logger.warning(f"No HSPK data scraped for {region}, serving uncached mock data")
+        return WageIndex(_wage_rows(generate_mock_hspk_data(region))), False
+    if not isinstance(dataset, WageIndex):
+        # Entries cached before the indexes were added hold the plain row list
+        for item in dataset:
+            if 'category' not in item:
+                item['category'] = categorize_work_item(item.get('work_description', ''))
+        dataset = WageIndex(dataset)
+    return dataset, cached
+
+
+def _region_dataset_key(region):
+    return make_cache_key("region_dataset", region)
+
+
+def refresh_region_datasets(regions=None, max_workers=None, budget=None):
+    """
+    Re-scrape the datasets of several regions concurrently
+    
+    Each region gets its own HTTP session; all of them share one request
+    budget. A region's dataset is cached as soon as it completes, so
+    finished regions are served while slower ones are still scraping. A
+    region whose scrape fails or finds nothing keeps its cached dataset.
+    Returns: {region: number of items cached}
+    """
+    regions = list(regions or GovernmentWageScraper.CENTRAL_JAVA_REGIONS)
+    budget = budget or RequestBudget()
+    cache = get_cache()
+    
+    def scrape_region(region):
+        started = time.time()
+        items = fetch_government_pages(region, budget=budget)
+        if not items:
+            raise RuntimeError(f"No HSPK items scraped for {region}")
+        return WageIndex(_wage_rows(items)), time.time() - started
+    
+    def cache_region(region, result):
+        dataset, duration = result
+        store(cache, _region_dataset_key(region), dataset, REGION_DATASET_TIMEOUT, duration)
+    
+    results = scrape_regions(regions, scrape_region, max_workers, on_region=cache_region)
+    return {region: len(dataset) for region, (dataset, _) in results.items()}
+
+
+def _scrape_region_wage_data(region):
+    """Scrape every HSPK page of a region into categorized wage dicts"""
+    logger.info(f"Scraping ALL pages for region {region} (this may take a few minutes)")
+    wage_data = _wage_rows(fetch_government_pages(region))
+    logger.info(f"Successfully scraped {len(wage_data)} total items for {region}")
+    return wage_data
+
+
+def _wage_rows(items):
+    """Categorized wage dicts of scraped HSPK items"""
+    return [
+        {
+            'item_number': item.item_number,
+            'work_code': item.work_code,
+            'work_description': item.work_description,
+            'unit': item.unit,
+            'unit_price_idr': item.unit_price_idr,
+            'region': item.region,
+            'edition': item.edition,
+            'year': item.year,
+            'sector': item.sector,
+            'category': categorize_work_item(item.work_description)
+        }
+        for item in items or []
+    ]
+
+
 def scrape_government_page(region, page, per_page):
     """
     Scrape government data with full pagination support
     Returns: (wage_data_list, total_items_count)
     """
     try:
-        # Check if we have cached ALL data for this region
-        cache = get_cache()
-        all_data_key = make_cache_key("region_all_pages", region)
-        cached_all_data = cache.get(all_data_key)
-        
-        if cached_all_data:
-            # We have all data cached, just slice for the requested page
-            start_idx = (page - 1) * per_page
-            end_idx = start_idx + per_page
-            page_items = cached_all_data[start_idx:end_idx]
-            return page_items, len(cached_all_data)
-        
-        # Need to scrape all pages from government website
-        logger.info(f"Scraping ALL pages for region {region} (this may take a few minutes)")
+        dataset, _ = get_region_dataset(region)
         
-        all_items = scrape_all_government_pages(region)
-        
-        if not all_items:
+        if not dataset:
             return [], 0
         
-        # Format all data
-        all_wage_data = [
-            {
-                'item_number': item.item_number,
-                'work_code': item.work_code,
-                'work_description': item.work_description,
-                'unit': item.unit,
-                'unit_price_idr': item.unit_price_idr,
-                'region': item.region,
-                'edition': item.edition,
-                'year': item.year,
-                'sector': item.sector,
-                'category': categorize_work_item(item.work_description)
-            }
-            for item in all_items
-        ]
-        
-        # Cache ALL data for 30 minutes (longer cache since it's expensive to scrape)
-        cache.set(all_data_key, all_wage_data, CACHE_TIMEOUT_LONG)
-        
         # Return the requested page slice
         start_idx = (page - 1) * per_page
         end_idx = start_idx + per_page
-        page_items = all_wage_data[start_idx:end_idx]
+        page_items = dataset.rows[start_idx:end_idx]
         
-        logger.info(f"Successfully scraped {len(all_wage_data)} total items for {region}")
-        return page_items, len(all_wage_data)
+        return page_items, len(dataset)
             
     except Exception as e:
         logger.error(f"Error scraping government data for {region}: {str(e)}", exc_info=True)
         return [], 0
 
 
-def scrape_all_government_pages(region):
+def fetch_government_pages(region, budget=None):
     """
-    STANDALONE SCRAPER - Directly scrape all pages from government website
-    This bypasses the existing scraper and does everything here
+    Scrape every HSPK page of a region from the government website
+    
+    Raises on any request or page error and returns [] when the site lists
+    nothing, so callers can tell a failed scrape from real data and never
+    cache mock rows in its place. A
+    RequestBudget spaces the requests when several regions are scraped at once.
     """
-    try:
-        logger.info(f"STANDALONE SCRAPER: Starting full scrape for region: {region}")
-        
-        # Check if required packages are available
-        try:
-            import requests
-            from bs4 import BeautifulSoup
-        except ImportError as e:
-            logger.error(f"Missing required packages for standalone scraper: {str(e)}")
-            logger.info("Install with: pip install requests beautifulsoup4")
-            logger.info("FALLING BACK TO MOCK DATA")
-            return generate_mock_hspk_data(region)
-        
-        # Initialize scraping session
-        session = initialize_scraping_session()
-        
-        # Get initial page and form data
-        base_url = "https://maspetruk.dpubinmarcipka.jatengprov.go.id/harga_satuan/hspk"
-        response = session.get(base_url, timeout=30)
+    # Initialize scraping session
+    session = initialize_scraping_session()
+    
+    # Get initial page and form data
+    base_url = "https://maspetruk.dpubinmarcipka.jatengprov.go.id/harga_satuan/hspk"
+    _wait_for_budget(budget)
+    response = session.get(base_url, timeout=30)
+    response.raise_for_status()
+    
+    # Submit form for specific region
+    form_data = prepare_region_form_data(response.content, region)
+    if form_data:
+        _wait_for_budget(budget)
+        response = session.post(base_url, data=form_data, timeout=30)
         response.raise_for_status()
-        
-        # Submit form for specific region
-        form_data = prepare_region_form_data(response.content, region)
-        if form_data:
-            response = session.post(base_url, data=form_data, timeout=30)
-            response.raise_for_status()
-        
-        # Scrape all pages
-        all_items = scrape_pages_iteratively(session, base_url, response, form_data, region)
-        
-        if not all_items:
-            logger.warning("STANDALONE SCRAPER: No items scraped, falling back to mock data")
-            return generate_mock_hspk_data(region)
-            
-        logger.info(f"STANDALONE SCRAPER: Completed! Total items: {len(all_items)}")
-        return all_items
-        
-    except Exception as e:
-        logger.error(f"STANDALONE SCRAPER ERROR: {str(e)}", exc_info=True)
-        logger.info("STANDALONE SCRAPER: Exception occurred, generating mock data for testing...")
-        return generate_mock_hspk_data(region)
+    
+    # Scrape all pages
+    return scrape_pages_iteratively(session, base_url, response, form_data, region, budget, strict=True)
+
+
+def _wait_for_budget(budget):
+    if budget is not None:
+        budget.wait()
 
 
 def initialize_scraping_session():
@@ -365,8 +405,8 @@ def find_region_option(region_select, region):
     return None
 
 
-def scrape_pages_iteratively(session, base_url, initial_response, form_data, region):
-    """Scrape all pages iteratively"""
+def scrape_pages_iteratively(session, base_url, initial_response, form_data, region, budget=None, strict=False):
+    """Scrape all pages iteratively; ``strict`` raises on a page error instead of keeping the pages so far"""
     from bs4 import BeautifulSoup
     
     all_items = []
@@ -381,6 +421,7 @@ def scrape_pages_iteratively(session, base_url, initial_response, form_data, reg
             if page_num > 1:
                 # Get subsequent pages
                 page_url = build_page_url(base_url, page_num, form_data)
+                _wait_for_budget(budget)
                 response = session.get(page_url, timeout=30)
                 response.raise_for_status()
             
@@ -403,6 +444,8 @@ def scrape_pages_iteratively(session, base_url, initial_response, form_data, reg
             
         except Exception as e:
             logger.error(f"Error scraping page {page_num}: {str(e)}")
+            if strict:
+                raise
             break
     
     return all_items
@@ -557,49 +600,12 @@ def generate_mock_hspk_data(region, total_items=387):
 
 def get_page_data_filtered(region, search_query, category, price_range, page, per_page, sort_by, sort_order):
     try:
-        # Check cache for all region data
-        cache = get_cache()
-        cache_key = make_cache_key("region_full_v2", region)  # Changed cache key to force refresh
-        cached_data = cache.get(cache_key)
-        logger.info(f"FILTERED PAGINATION - Cache key: {cache_key}, Found cached: {cached_data is not None}")
-        
-        if not cached_data:
-            logger.info("FILTERED PAGINATION - Using standalone scraper for all data")
-            # Use standalone scraper to get all data for filtering
-            items = scrape_all_government_pages(region)
-            logger.info(f"FILTERED PAGINATION - Got {len(items)} total items for region: {region}")
-            
-            # Convert GovernmentWageItem objects to dictionaries
-            wage_data = [
-                {
-                    'item_number': item.item_number,
-                    'work_code': item.work_code,
-                    'work_description': item.work_description,
-                    'unit': item.unit,
-                    'unit_price_idr': item.unit_price_idr,
-                    'region': item.region,
-                    'edition': item.edition,
-                    'year': item.year,
-                    'sector': item.sector,
-                    'category': categorize_work_item(item.work_description)
-                }
-                for item in items
-            ]
-            
-            # Cache for 15 minutes
-            cache.set(cache_key, wage_data, CACHE_TIMEOUT_SHORT)
-        else:
-            wage_data = cached_data
-            # Add category if not present (for backward compatibility)
-            for item in wage_data:
-                if 'category' not in item:
-                    item['category'] = categorize_work_item(item.get('work_description', ''))
-        
-        # Apply filters
-        filtered_data = apply_filters(wage_data, search_query, category, price_range)
+        dataset, cached = get_region_dataset(region)
+        logger.info(f"FILTERED PAGINATION - Region dataset for {region}, Found cached: {cached}")
         
-        # Apply sorting
-        filtered_data = apply_sorting(filtered_data, sort_by, sort_order)
+        # Filters and sorting are index lookups on the cached dataset
+        positions = filter_positions(dataset, search_query, category, price_range)
+        filtered_data = dataset.ordered(positions, sort_by, sort_order)
         
         # Pagination
         paginator = Paginator(filtered_data, per_page)
@@ -622,7 +628,7 @@ def get_page_data_filtered(region, search_query, category, price_range, page, pe
                 'category': category,
                 'price_range': price_range,
             },
-            'cached': bool(cached_data)
+            'cached': cached
         }
         
         return JsonResponse(response_data)
@@ -803,6 +809,34 @@ def apply_filters(data, search_query, category, price_range):
     return filtered_data
 
 
+def filter_positions(dataset, search_query, category, price_range):
+    """
+    Positions of the dataset rows passing the filters, or None when none is set
+    
+    Same results as apply_filters, using the dataset's indexes.
+    """
+    positions = None
+    
+    if search_query:
+        positions = dataset.search(search_query)
+    
+    if category:
+        matching = dataset.category(category)
+        positions = matching if positions is None else positions & matching
+    
+    if price_range:
+        try:
+            min_price, max_price = parse_price_range(price_range)
+        except (ValueError, IndexError):
+            # Invalid price range format, leave data unfiltered
+            logger.warning(f"Invalid price range format: {price_range}")
+        else:
+            matching = dataset.price_between(min_price, max_price)
+            positions = matching if positions is None else positions & matching
+    
+    return positions
+
+
 def apply_search_filter(data, search_query):
     """Apply search query filter to data"""
     search_lower = search_query.lower()
@@ -859,16 +893,8 @@ def apply_sorting(data, sort_by, sort_order):
     """
     reverse_order = sort_order.lower() == 'desc'
     
-    # Define sort key function based on sort_by parameter
-    sort_key_map = {
-        'item_number': lambda x: int(x.get('item_number', 0)) if str(x.get('item_number', '')).isdigit() else 0,
-        'work_code': lambda x: x.get('work_code', ''),
-        'work_description': lambda x: x.get('work_description', ''),
-        'unit': lambda x: x.get('unit', ''),
-        'unit_price_idr': lambda x: x.get('unit_price_idr', 0),
-    }
-    
-    sort_key = sort_key_map.get(sort_by, sort_key_map['item_number'])
+    # Sort key function based on sort_by parameter
+    sort_key = SORT_KEYS.get(sort_by, SORT_KEYS[DEFAULT_SORT])
     
     try:
         return sorted(data, key=sort_key, reverse=reverse_order)
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from api.government_wage.parallel import RequestBudget
+from api.government_wage.scraper import GovernmentWageScraper
+from dashboard.gov_wage_views import refresh_region_datasets
+
+
+class Command(BaseCommand):
+    help = 'Scrape the HSPK datasets of several regions concurrently into the government wage cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--region', action='append', dest='regions',
+            help='Region to refresh (repeatable, default: all Central Java regions)',
+        )
+        parser.add_argument(
+            '--workers', type=int,
+            help='Regions scraped at once (default: GOV_WAGE_SCRAPE_WORKERS)',
+        )
+        parser.add_argument(
+            '--interval', type=float,
+            help='Minimum seconds between requests of all workers (default: GOV_WAGE_REQUEST_INTERVAL)',
+        )
+
+    def handle(self, *args, **options):
+        regions = options['regions'] or GovernmentWageScraper.CENTRAL_JAVA_REGIONS
+        self.stdout.write(f"Refreshing {len(regions)} regions...")
+
+        counts = refresh_region_datasets(regions, options['workers'], RequestBudget(options['interval']))
+
+        for region in regions:
+            if counts.get(region):
+                self.stdout.write(self.style.SUCCESS(f"{region}: {counts[region]} items cached"))
+            else:
+                self.stdout.write(self.style.WARNING(f"{region}: refresh failed, previous dataset kept"))
@@ -0,0 +1,145 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from django.contrib import messages
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.test import RequestFactory, TestCase, override_settings
+
+from dashboard import views
+from db_pricing.store_locations import StoreLocationRegistry
+
+
+def _fake_vendor(delays):
+    def run(request, keyword, maker, label, fallback=None, limit=None):
+        time.sleep(delays.get(label, 0))
+        return [{"item": f"{keyword} {label}", "value": 1000, "source": label, "url": f"https://x/{label}"}]
+    return run
+
+
+class ConcurrentVendorSearchTests(TestCase):
+
+    def test_vendors_run_in_parallel(self):
+        delays = {label: 0.3 for label, _, _, _ in views._vendor_searches()}
+
+        with patch('dashboard.views._run_vendor_to_prices', side_effect=_fake_vendor(delays)):
+            start = time.monotonic()
+            prices, partial = views._scrape_all_vendors(Mock(), "pasir")
+            elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 1.0)  # 5 x 0.3 s serially
+        self.assertEqual(partial, [])
+        self.assertEqual([p["source"] for p in prices], [label for label, _, _, _ in views._vendor_searches()])
+
+    @override_settings(DASHBOARD_VENDOR_DEADLINE=0.3)
+    @patch('dashboard.views.messages')
+    def test_slow_vendor_is_marked_partial(self, mock_messages):
+        release = threading.Event()
+
+        def run(request, keyword, maker, label, fallback=None, limit=None):
+            if label == views.MITRA10_SOURCE:
+                release.wait(5)
+            return [{"item": keyword, "value": 1000, "source": label}]
+
+        try:
+            with patch('dashboard.views._run_vendor_to_prices', side_effect=run):
+                prices, partial = views._scrape_all_vendors(Mock(), "pasir")
+        finally:
+            release.set()
+
+        self.assertEqual(partial, [views.MITRA10_SOURCE])
+        self.assertEqual(len(prices), 4)
+        self.assertNotIn(views.MITRA10_SOURCE, {p["source"] for p in prices})
+        self.assertIn("Partial results", mock_messages.warning.call_args[0][1])
+
+    def test_overall_budget_caps_wait(self):
+        release = threading.Event()
+
+        def run(request, keyword, maker, label, fallback=None, limit=None):
+            release.wait(5)
+            return []
+
+        try:
+            with patch('dashboard.views._run_vendor_to_prices', side_effect=run), patch('dashboard.views.messages'):
+                start = time.monotonic()
+                _, partial = views._scrape_all_vendors(Mock(), "pasir", budget_end=time.monotonic() + 0.2)
+                elapsed = time.monotonic() - start
+        finally:
+            release.set()
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(len(partial), 5)
+
+    def test_worker_messages_are_added_on_the_request_thread(self):
+        request = RequestFactory().get('/')
+        request._messages = CookieStorage(request)
+        seen = []
+
+        def run(request, keyword, maker, label, fallback=None, limit=None):
+            seen.append(request)
+            messages.info(request, f"[{label}] from worker")
+            return []
+
+        with patch('dashboard.views._run_vendor_to_prices', side_effect=run):
+            views._scrape_all_vendors(request, "pasir")
+
+        self.assertNotIn(request, seen)
+        self.assertEqual(
+            [str(m) for m in request._messages],
+            [f"[{label}] from worker" for label, _, _, _ in views._vendor_searches()],
+        )
+
+    @override_settings(DASHBOARD_VENDOR_DEADLINE=0.3)
+    def test_without_request_messages_are_logged(self):
+        release = threading.Event()
+
+        def run(request, keyword, maker, label, fallback=None, limit=None):
+            if label == views.MITRA10_SOURCE:
+                release.wait(5)
+            messages.info(request, f"[{label}] from worker")
+            return []
+
+        try:
+            with patch('dashboard.views._run_vendor_to_prices', side_effect=run), \
+                    self.assertLogs('dashboard.views', level='INFO') as logs:
+                _, partial = views._scrape_all_vendors(None, "pasir")
+        finally:
+            release.set()
+
+        self.assertEqual(partial, [views.MITRA10_SOURCE])
+        self.assertTrue(any(f"[{views.GEMILANG_SOURCE}] from worker" in line for line in logs.output))
+
+    def test_failing_task_does_not_break_others(self):
+        results, missed = views._run_concurrently(
+            {"ok": (lambda: 1, ()), "boom": (lambda: 1 / 0, ())}, deadline=2, budget_end=time.monotonic() + 2
+        )
+        self.assertEqual((results, missed), ({"ok": 1}, []))
+
+    def test_location_lookups_only_for_vendors_with_prices(self):
+        prices = [{"source": views.GEMILANG_SOURCE}, {"source": views.TOKOPEDIA_SOURCE, "location": "Jakarta"}]
+        gemilang_locations = [{"store_name": "GEMILANG - A", "address": "", "source": views.GEMILANG_SOURCE}]
+
+        with patch('dashboard.views._run_location_scraper', return_value=gemilang_locations) as mock_scraper, \
+                patch('dashboard.views._run_mitra10_location_scraper') as mock_mitra10:
+            locations = views._collect_vendor_locations(Mock(), prices)
+
+        mock_scraper.assert_called_once()
+        mock_mitra10.assert_not_called()
+        self.assertEqual(list(locations), [views.GEMILANG_SOURCE, views.TOKOPEDIA_SOURCE])
+
+    @patch('dashboard.views._collect_vendor_locations', return_value={})
+    def test_home_renders_partial_vendors(self, _mock_locations):
+        with patch('dashboard.views._scrape_all_vendors', return_value=([], [views.MITRA10_SOURCE])):
+            response = self.client.get('/?q=semen')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["partial_vendors"], [views.MITRA10_SOURCE])
+
+    def test_location_lookups_read_registry(self):
+        StoreLocationRegistry.refresh("mitra10", fetch=lambda: ["Kemang"])
+
+        with patch('dashboard.views.create_mitra10_location_scraper') as mock_factory:
+            locations = views._run_mitra10_location_scraper(Mock())
+
+        mock_factory.assert_not_called()
+        self.assertEqual(locations, [{"store_name": "Mitra10 Kemang", "address": "Kemang", "source": views.MITRA10_SOURCE}])
@@ -0,0 +1,40 @@
+from django.test import TestCase
+from unittest.mock import patch
+
+from dashboard import gov_wage_views as gvw
+from dashboard.gov_wage_index import WageIndex
+
+
+class WageIndexTests(TestCase):
+    def setUp(self):
+        with patch('dashboard.gov_wage_views.fetch_government_pages') as mock_scrape:
+            mock_scrape.side_effect = lambda region: gvw.generate_mock_hspk_data(region, total_items=60)
+            self.rows = gvw._scrape_region_wage_data('Kab. Test')
+        self.rows[5]['unit_price_idr'] = self.rows[6]['unit_price_idr']
+        self.index = WageIndex(self.rows)
+
+    def test_matches_linear_filter_and_sort(self):
+        searches = ['', 'pondasi', 'BATU bel', 'ata', 'A.4', '.', 'tidak ada']
+        categories = ['', 'pondasi', 'atap']
+        price_ranges = ['', '0-500000', '500000-1000000', '2000000-', 'abc']
+
+        for search in searches:
+            for category in categories:
+                for price_range in price_ranges:
+                    expected = gvw.apply_filters(self.rows, search, category, price_range)
+                    positions = gvw.filter_positions(self.index, search, category, price_range)
+                    for sort_by in ['item_number', 'work_description', 'unit_price_idr', 'unknown']:
+                        for sort_order in ['asc', 'desc']:
+                            with self.subTest(search=search, category=category, price=price_range,
+                                              sort_by=sort_by, sort_order=sort_order):
+                                self.assertEqual(
+                                    self.index.ordered(positions, sort_by, sort_order),
+                                    gvw.apply_sorting(expected, sort_by, sort_order),
+                                )
+
+    def test_unsortable_column_keeps_scraped_order(self):
+        rows = [{'item_number': '1', 'unit': 'm2'}, {'item_number': '2', 'unit': None}]
+        index = WageIndex(rows)
+
+        self.assertEqual(index.ordered(None, 'unit', 'asc'), rows)
+        self.assertEqual(index.ordered({1, 0}, 'unit', 'desc'), rows)
@@ -105,7 +105,7 @@ class GovWageViewsTests(TestCase):
         # fallback uses 387 total items by default
         self.assertEqual(data['pagination']['total_pages'], 39)
 
-    @patch('dashboard.gov_wage_views.scrape_all_government_pages')
+    @patch('dashboard.gov_wage_views.fetch_government_pages')
     @patch('dashboard.gov_wage_views.get_cache')
     def test_get_page_data_filtered_uses_scraper_when_no_cache(self, mock_get_cache, mock_scrape):
         # Mock cache to return empty
@@ -144,6 +144,98 @@ class GovWageViewsTests(TestCase):
         self.assertTrue(body.get('success'))
         self.assertEqual(body['pagination']['total_items'], 387)
 
+    @patch('dashboard.gov_wage_views.fetch_government_pages')
+    @patch('dashboard.gov_wage_views.get_cache')
+    def test_pages_and_filters_share_one_region_scrape(self, mock_get_cache, mock_scrape):
+        from api.government_wage.simple_cache import SimpleCache
+        mock_get_cache.return_value = SimpleCache()
+        mock_scrape.side_effect = lambda region: gvw.generate_mock_hspk_data(region, total_items=25)
+
+        page_data, total = gvw.scrape_government_page('Kab. Test', 3, 10)
+        resp = gvw.get_page_data_filtered('Kab. Test', '', '', '', 1, 10, 'item_number', 'asc')
+        gvw.get_page_data_smart('Kab. Test', 2, 10)
+
+        mock_scrape.assert_called_once_with('Kab. Test')
+        self.assertEqual((len(page_data), total), (5, 25))
+        import json as _json
+        self.assertTrue(_json.loads(resp.content).get('cached'))
+
+    @patch('dashboard.gov_wage_views.fetch_government_pages')
+    @patch('dashboard.gov_wage_views.get_cache')
+    def test_refresh_region_datasets_caches_each_region(self, mock_get_cache, mock_scrape):
+        from api.government_wage.parallel import RequestBudget
+        from api.government_wage.simple_cache import SimpleCache
+        mock_get_cache.return_value = SimpleCache()
+        mock_scrape.side_effect = lambda region, budget=None: gvw.generate_mock_hspk_data(region, total_items=12)
+
+        counts = gvw.refresh_region_datasets(['Kab. A', 'Kab. B'], max_workers=2, budget=RequestBudget(0))
+        dataset, cached = gvw.get_region_dataset('Kab. B')
+
+        self.assertEqual(counts, {'Kab. A': 12, 'Kab. B': 12})
+        self.assertEqual((len(dataset), cached), (12, True))
+        self.assertEqual(mock_scrape.call_count, 2)
+
+    @patch('dashboard.gov_wage_views.fetch_government_pages')
+    @patch('dashboard.gov_wage_views.get_cache')
+    def test_failed_region_refresh_keeps_previous_dataset(self, mock_get_cache, mock_scrape):
+        from api.government_wage.parallel import RequestBudget
+        from api.government_wage.simple_cache import SimpleCache
+        mock_get_cache.return_value = SimpleCache()
+        mock_scrape.side_effect = lambda region, budget=None: gvw.generate_mock_hspk_data(region, total_items=12)
+        gvw.refresh_region_datasets(['Kab. A', 'Kab. B'], max_workers=2, budget=RequestBudget(0))
+
+        def scrape(region, budget=None):
+            if region == 'Kab. A':
+                raise ConnectionError("site down")
+            return []
+        mock_scrape.side_effect = scrape
+
+        with patch('dashboard.gov_wage_views.generate_mock_hspk_data') as mock_data:
+            counts = gvw.refresh_region_datasets(['Kab. A', 'Kab. B'], max_workers=2, budget=RequestBudget(0))
+
+        self.assertEqual(counts, {})
+        mock_data.assert_not_called()
+        for region in ['Kab. A', 'Kab. B']:
+            dataset, cached = gvw.get_region_dataset(region)
+            self.assertEqual((len(dataset), cached), (12, True))
+
+    @patch('dashboard.gov_wage_views.fetch_government_pages')
+    @patch('dashboard.gov_wage_views.get_cache')
+    def test_failed_scrape_serves_mock_data_uncached(self, mock_get_cache, mock_scrape):
+        from api.government_wage.simple_cache import SimpleCache
+        cache = SimpleCache()
+        mock_get_cache.return_value = cache
+
+        for failure in [ConnectionError("site down"), None]:
+            mock_scrape.side_effect = failure
+            mock_scrape.return_value = []
+            dataset, cached = gvw.get_region_dataset('Kab. Test')
+
+            self.assertGreater(len(dataset), 0)
+            self.assertFalse(cached)
+            self.assertIsNone(cache.get(gvw._region_dataset_key('Kab. Test')))
+
+    @patch('dashboard.gov_wage_views.fetch_government_pages')
+    @patch('dashboard.gov_wage_views.get_cache')
+    def test_failed_early_refresh_keeps_cached_dataset(self, mock_get_cache, mock_scrape):
+        from api.government_wage.simple_cache import SimpleCache
+        mock_get_cache.return_value = SimpleCache()
+        mock_scrape.side_effect = lambda region: gvw.generate_mock_hspk_data(region, total_items=12)
+        gvw.get_region_dataset('Kab. Test')
+
+        mock_scrape.side_effect = ConnectionError("site down")
+        with patch('api.government_wage.single_flight.should_refresh_early', return_value=True), \
+                patch('api.government_wage.single_flight.threading.Thread') as mock_thread:
+            gvw.get_region_dataset('Kab. Test')
+            refresh = mock_thread.call_args.kwargs['target']
+        # Run the early refresh inline: once failing, once finding nothing
+        refresh()
+        mock_scrape.side_effect = lambda region: []
+        refresh()
+
+        dataset, cached = gvw.get_region_dataset('Kab. Test')
+        self.assertEqual((len(dataset), cached), (12, True))
+
     def test_categorize_work_item_categories(self):
         # Test various categories (order matters - first match wins)
         self.assertEqual(gvw.categorize_work_item('Pondasi batu belah'), 'pondasi')
@@ -160,7 +252,7 @@ class GovWageViewsTests(TestCase):
         self.assertEqual(gvw.categorize_work_item(''), 'lainnya')
         self.assertEqual(gvw.categorize_work_item(None), 'lainnya')
 
-    @patch('dashboard.gov_wage_views.scrape_all_government_pages')
+    @patch('dashboard.gov_wage_views.fetch_government_pages')
     @patch('dashboard.gov_wage_views.get_cache')
     def test_get_page_data_filtered_with_cached_data(self, mock_get_cache, mock_scrape):
         # Mock cache hit with data
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from dashboard import views
+
+PRICES = [{"item": "Semen", "value": 50000, "source": views.GEMILANG_SOURCE, "location": "", "all_locations": []}]
+
+
+@patch('dashboard.views._search_prices', return_value=(PRICES, []))
+class SearchCacheTests(TestCase):
+
+    def test_repeat_search_served_from_cache(self, mock_search):
+        self.client.get('/?q=semen')
+        response = self.client.get('/?q=semen')
+
+        mock_search.assert_called_once()
+        self.assertEqual(response.context["prices"], PRICES)
+
+    def test_keyword_is_normalized(self, mock_search):
+        self.client.get('/?q=Semen  Putih')
+        self.client.get('/?q=semen putih ')
+
+        mock_search.assert_called_once()
+
+    def test_refresh_parameter_bypasses_cache(self, mock_search):
+        self.client.get('/?q=semen')
+        self.client.get('/?q=semen&refresh=1')
+
+        self.assertEqual(mock_search.call_count, 2)
+
+    @override_settings(DASHBOARD_SEARCH_CACHE_TTL=0)
+    def test_zero_ttl_disables_cache(self, mock_search):
+        self.client.get('/?q=semen')
+        self.client.get('/?q=semen')
+
+        self.assertEqual(mock_search.call_count, 2)
+
+    @override_settings(DASHBOARD_SEARCH_CACHE_TTL=60)
+    def test_stale_entry_served_while_refreshing(self, mock_search):
+        with patch('dashboard.views.time.time', return_value=1000.0):
+            self.client.get('/?q=semen')
+
+        with patch('dashboard.views.time.time', return_value=1100.0), \
+                patch('dashboard.views._start_background_refresh') as mock_refresh:
+            response = self.client.get('/?q=semen')
+
+        mock_search.assert_called_once()
+        mock_refresh.assert_called_once()
+        self.assertEqual(response.context["prices"], PRICES)
+
+    def test_background_refresh_runs_once_per_keyword(self, mock_search):
+        with patch('dashboard.views.threading.Thread') as mock_thread:
+            self.assertTrue(views._start_background_refresh("semen"))
+            self.assertFalse(views._start_background_refresh("semen"))
+
+        mock_thread.return_value.start.assert_called_once()
+
+    def test_refresh_stores_results_and_releases_lock(self, mock_search):
+        lock_key = f"{views._search_cache_key('semen')}:refreshing"
+
+        views._refresh_search_results("semen", lock_key)
+
+        self.assertEqual(views._cached_search(None, "semen"), (PRICES, []))
+        mock_search.assert_called_once_with(None, "semen")
+        self.assertIsNone(views._search_cache().get(lock_key))
+
+    @patch('dashboard.views._run_vendor_to_count', return_value=0)
+    def test_trigger_scrape_invalidates_keyword(self, _mock_count, mock_search):
+        self.client.get('/?q=semen')
+        self.client.post('/scrape/gemilang/', {"q": "semen"})
+        self.client.get('/?q=semen')
+
+        self.assertEqual(mock_search.call_count, 2)
@@ -0,0 +1,147 @@
+import json
+import threading
+import time
+from unittest.mock import patch
+
+from django.contrib import messages
+from django.test import TestCase, override_settings
+
+from dashboard import views
+
+
+def _events(response):
+    """(event, payload) pairs of a text/event-stream response"""
+    body = b"".join(response.streaming_content).decode()
+    events = []
+    for block in body.split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if line and not line.startswith(":"))
+        if "event" in lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class SearchStreamTests(TestCase):
+
+    def setUp(self):
+        self.locations = patch('dashboard.views._collect_vendor_locations', return_value={})
+        self.locations.start()
+        self.addCleanup(self.locations.stop)
+
+    def test_stream_headers(self):
+        with patch('dashboard.views._run_vendor_to_prices', return_value=[]):
+            response = self.client.get('/search/stream/?q=semen')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(response["Cache-Control"], "no-cache")
+        _events(response)
+
+    def test_fast_vendor_emitted_first_then_done(self):
+        def run(request, keyword, maker, label, fallback=None, limit=None):
+            time.sleep(0 if label == views.TOKOPEDIA_SOURCE else 0.2)
+            return [
+                {"item": f"{keyword} {label}", "value": 5000, "source": label, "url": f"https://x/{label}"},
+                {"item": f"{keyword} {label}", "value": 5000, "source": label, "url": f"https://x/{label}"},
+            ]
+
+        with patch('dashboard.views._run_vendor_to_prices', side_effect=run):
+            events = _events(self.client.get('/search/stream/?q=semen'))
+
+        self.assertEqual([name for name, _ in events], ["vendor"] * 5 + ["done"])
+        self.assertEqual(events[0][1]["source"], views.TOKOPEDIA_SOURCE)
+        # Rows are cleaned and deduped per vendor before being sent
+        self.assertEqual(len(events[0][1]["prices"]), 1)
+        self.assertEqual(events[-1][1], {"keyword": "semen", "total": 5, "partial_vendors": []})
+
+    @override_settings(DASHBOARD_SEARCH_BUDGET=0.3)
+    def test_budget_expiry_reports_partial_vendors(self):
+        release = threading.Event()
+
+        def run(request, keyword, maker, label, fallback=None, limit=None):
+            if label == views.MITRA10_SOURCE:
+                release.wait(5)
+            return []
+
+        try:
+            with patch('dashboard.views._run_vendor_to_prices', side_effect=run):
+                events = _events(self.client.get('/search/stream/?q=semen'))
+        finally:
+            release.set()
+
+        self.assertEqual(len(events), 5)
+        self.assertNotIn(views.MITRA10_SOURCE, [payload.get("source") for _, payload in events])
+        self.assertEqual(events[-1][1]["partial_vendors"], [views.MITRA10_SOURCE])
+
+    def test_failing_vendor_still_emits_event(self):
+        def run(request, keyword, maker, label, fallback=None, limit=None):
+            if label == views.GEMILANG_SOURCE:
+                raise RuntimeError("boom")
+            return []
+
+        with patch('dashboard.views._run_vendor_to_prices', side_effect=run):
+            events = _events(self.client.get('/search/stream/?q=semen'))
+
+        gemilang = [payload for name, payload in events if payload.get("source") == views.GEMILANG_SOURCE]
+        self.assertEqual(gemilang, [{"source": views.GEMILANG_SOURCE, "prices": []}])
+
+    def test_vendor_messages_are_logged_not_added_to_the_request(self):
+        def run(request, keyword, maker, label, fallback=None, limit=None):
+            messages.warning(request, f"[{label}] using fallback")
+            return []
+
+        with patch('dashboard.views._run_vendor_to_prices', side_effect=run), \
+                self.assertLogs('dashboard.views', level='INFO') as logs:
+            response = self.client.get('/search/stream/?q=semen')
+            _events(response)
+
+        self.assertTrue(any(f"[{views.GEMILANG_SOURCE}] using fallback" in line for line in logs.output))
+        self.assertEqual(list(messages.get_messages(response.wsgi_request)), [])
+
+    def test_complete_stream_is_cached_and_replayed(self):
+        def run(request, keyword, maker, label, fallback=None, limit=None):
+            return [{"item": f"{keyword} {label}", "value": 5000, "source": label, "url": f"https://x/{label}"}]
+
+        with patch('dashboard.views._run_vendor_to_prices', side_effect=run):
+            live = _events(self.client.get('/search/stream/?q=semen'))
+        with patch('dashboard.views._run_vendor_to_prices') as mock_scrape:
+            replayed = _events(self.client.get('/search/stream/?q=Semen'))
+            prices, partial = views._cached_search(None, "semen")
+
+        mock_scrape.assert_not_called()
+        self.assertEqual(sorted(e[1]["source"] for e in replayed[:-1]), sorted(e[1]["source"] for e in live[:-1]))
+        self.assertEqual(replayed[-1][1]["total"], live[-1][1]["total"])
+        self.assertEqual((len(prices), partial), (5, []))
+
+    @override_settings(DASHBOARD_SEARCH_BUDGET=0.3)
+    def test_partial_stream_is_not_cached(self):
+        release = threading.Event()
+
+        def run(request, keyword, maker, label, fallback=None, limit=None):
+            if label == views.MITRA10_SOURCE:
+                release.wait(5)
+            return []
+
+        try:
+            with patch('dashboard.views._run_vendor_to_prices', side_effect=run):
+                _events(self.client.get('/search/stream/?q=semen'))
+        finally:
+            release.set()
+
+        self.assertIsNone(views._search_cache().get(views._search_cache_key("semen")))
+
+    @override_settings(DASHBOARD_SEARCH_CACHE_TTL=60)
+    def test_stale_entry_replayed_while_refreshing(self):
+        prices = [{"item": "semen", "value": 5000, "source": views.GEMILANG_SOURCE}]
+        with patch('dashboard.views.time.time', return_value=1000.0):
+            views._store_search_results("semen", prices, [views.MITRA10_SOURCE])
+
+        with patch('dashboard.views.time.time', return_value=1100.0), \
+                patch('dashboard.views._start_background_refresh') as mock_refresh, \
+                patch('dashboard.views._run_vendor_to_prices') as mock_scrape:
+            events = _events(self.client.get('/search/stream/?q=semen'))
+
+        mock_scrape.assert_not_called()
+        mock_refresh.assert_called_once_with("semen")
+        self.assertEqual(len(events), 5)
+        self.assertEqual(events[0][1], {"source": views.GEMILANG_SOURCE, "prices": prices})
+        self.assertEqual(events[-1][1], {"keyword": "semen", "total": 1, "partial_vendors": [views.MITRA10_SOURCE]})
@@ -51,7 +51,8 @@ class TokopediaDashboardIntegrationTests(TestCase):
         views._scrape_all_vendors(request, "semen")
         
         self.assertEqual(mock_run_vendor.call_count, 5)
-        tokopedia_call = mock_run_vendor.call_args_list[4]
+        # Vendors run concurrently, so find the Tokopedia call by its label
+        tokopedia_call = next(c for c in mock_run_vendor.call_args_list if c[0][3] == views.TOKOPEDIA_SOURCE)
         maker_func = tokopedia_call[0][2]
         _, url_builder = maker_func()
         self.assertIsInstance(url_builder, TokopediaUrlBuilderUlasan)
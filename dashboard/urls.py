@@ -10,6 +10,7 @@ app_name = 'dashboard'
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("", home, name="dashboard_home"),
+    path("search/stream/", views.search_stream, name="search_stream"),
     path("scrape/gemilang/", views.trigger_scrape, name="trigger_scrape"),
 
     # Curated prices (ItemPriceProvince)
@@ -1,5 +1,8 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import HttpResponseNotAllowed
+from django.http import HttpResponseNotAllowed, StreamingHttpResponse
 from django.views.decorators.http import require_POST, require_GET
 from django.views.decorators.csrf import csrf_protect
 from django.contrib import messages
@@ -7,10 +10,13 @@ from django.urls import reverse
 from .forms import ItemPriceProvinceForm
 from . import models
 
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed, wait
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 import re, json, os, time
+import hashlib
 import secrets
+import threading
 import logging
 
 # For diagnostics + plain HTML fetch
@@ -40,6 +46,7 @@ from api.tokopedia.unit_parser import TokopediaUnitParser
 
 # Import categorization service
 from db_pricing.categorization import ProductCategorizer
+from db_pricing.store_locations import LocationRefreshError, StoreLocationRegistry, scrape_result_locations
 
 # Playwright fallback (optional at runtime)
 HAS_PLAYWRIGHT = False
@@ -58,6 +65,13 @@ JURAGAN_MATERIAL_SOURCE = "Juragan Material"
 MITRA10_SOURCE = "Mitra10"
 TOKOPEDIA_SOURCE = "Tokopedia"
 DASHBOARD_FORM_TEMPLATE = "dashboard/form.html"
+
+# Store location registry vendor per dashboard label
+LOCATION_REGISTRY_VENDORS = {
+    GEMILANG_SOURCE: "gemilang",
+    DEPO_BANGUNAN_SOURCE: "depobangunan",
+    MITRA10_SOURCE: "mitra10",
+}
 JSON_LD_TYPE_KEY = "@type"
 HTML_PARSER = "html.parser"
 
@@ -1654,9 +1668,13 @@ def _run_vendor_to_count(request, keyword: str, maker, label: str, fallback=None
 
 
 def _run_location_scraper(request, scraper_func, label: str) -> list[dict]:
-    """Helper function to run location scraping and return formatted locations."""
+    """Formatted store locations from the registry; scraped live only while the registry is empty."""
     try:
-        return _execute_location_scraping(request, scraper_func, label)
+        stored = StoreLocationRegistry.locations(
+            LOCATION_REGISTRY_VENDORS[label],
+            fetch=lambda: _execute_location_scraping(request, scraper_func, label),
+        )
+        return [{"store_name": loc["name"], "address": loc["code"], "source": label} for loc in stored]
     except Exception as e:
         return _handle_location_scraping_exception(request, label, e)
 
@@ -1767,23 +1785,20 @@ def _get_depo_fallback_locations() -> list[dict]:
 
 
 def _run_mitra10_location_scraper(request) -> list[dict]:
-    """Helper function to run Mitra10 location scraping and return formatted locations."""
+    """Formatted Mitra10 store locations from the registry; the browser scrape only runs while it is empty."""
     try:
-        return _execute_mitra10_location_scraping(request)
+        stored = StoreLocationRegistry.locations("mitra10", fetch=_scrape_mitra10_location_names)
+    except LocationRefreshError as e:
+        return _handle_mitra10_scraping_failure(request, {"error_message": str(e)})
     except Exception as e:
         return _handle_mitra10_scraping_exception(request, e)
+    return _format_mitra10_locations([loc["name"] for loc in stored])
 
 
-def _execute_mitra10_location_scraping(request) -> list[dict]:
-    """Execute Mitra10 location scraping logic."""
+def _scrape_mitra10_location_names() -> list:
+    """Run the Mitra10 location scraper (a dict result); raises LocationRefreshError on failure."""
     scraper = create_mitra10_location_scraper()
-    result = scraper.scrape_locations()
-
-    # Handle dictionary response (Mitra10 returns a dict, not an object)
-    if isinstance(result, dict) and result.get("success", False) and result.get("locations"):
-        return _format_mitra10_locations(result["locations"])
-    else:
-        return _handle_mitra10_scraping_failure(request, result)
+    return scrape_result_locations(scraper.scrape_locations())
 
 
 def _format_mitra10_locations(location_names: list) -> list[dict]:
@@ -1865,57 +1880,168 @@ def _create_tokopedia_ulasan_scraper():
     return TokopediaPriceScraper(http_client, url_builder, html_parser), url_builder
 
 
-def _scrape_all_vendors(request, keyword: str) -> list[dict]:
-    """Scrape prices from all vendors."""
+def _run_in_worker(func, *args, **kwargs):
+    """Run a vendor task on a pool thread, releasing the thread's DB connections afterwards."""
+    try:
+        return func(*args, **kwargs)
+    finally:
+        connections.close_all()
+
+
+class _DeferredMessages:
+    """
+    Stand-in for the request in scrape helpers run off the request thread.
+
+    ``django.contrib.messages`` only needs ``request._messages.add()``, so the
+    helpers' ``messages.*(request, ...)`` calls are queued here and added to
+    the real request later by ``_replay_messages``.
+    """
+
+    def __init__(self):
+        self._messages = self
+        self.queued = []
+
+    def add(self, level, message, extra_tags=""):
+        self.queued.append((level, message, extra_tags))
+
+
+def _with_messages(func, *args):
+    """Call ``func(sink, *args)``; returns its result and the messages it added."""
+    sink = _DeferredMessages()
+    return func(sink, *args), sink.queued
+
+
+def _replay_messages(request, queued: list) -> None:
+    """Add messages collected by a worker to ``request``; only logged when there is none."""
+    for level, message, extra_tags in queued:
+        if request is None:
+            logger.info(f"Dashboard search: {message}")
+        else:
+            messages.add_message(request, level, message, extra_tags=extra_tags)
+
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _search_executor(pool: str) -> ThreadPoolExecutor:
+    """Shared pool ("vendors" or "locations") of DASHBOARD_SEARCH_WORKERS threads."""
+    with _executors_lock:
+        if pool not in _executors:
+            _executors[pool] = ThreadPoolExecutor(
+                max_workers=getattr(settings, "DASHBOARD_SEARCH_WORKERS", 10),
+                thread_name_prefix=f"dashboard-{pool}",
+            )
+        return _executors[pool]
+
+
+def _run_concurrently(tasks: dict, deadline: float, budget_end: float, pool: str = "vendors") -> tuple[dict, list[str]]:
+    """
+    Run ``{label: (func, args)}`` concurrently on a shared pool.
+
+    Waits at most ``deadline`` seconds and never past ``budget_end`` (a
+    ``time.monotonic()`` value). Tasks not started by then are cancelled;
+    running ones finish in the background on their pool thread. Returns the
+    results by label and the labels that missed the deadline.
+    """
+    if not tasks:
+        return {}, []
+
+    executor = _search_executor(pool)
+    futures = {
+        executor.submit(_run_in_worker, func, *args): label
+        for label, (func, args) in tasks.items()
+    }
+    done, not_done = wait(futures, timeout=max(0.0, min(deadline, budget_end - time.monotonic())))
+    for future in not_done:
+        future.cancel()
+
+    results = {}
+    for future in done:
+        try:
+            results[futures[future]] = future.result()
+        except Exception as e:
+            logger.error(f"{futures[future]}: dashboard search task failed: {e}")
+    late = {futures[future] for future in not_done}
+    return results, [label for label in tasks if label in late]
+
+
+def _vendor_deadline() -> float:
+    return getattr(settings, "DASHBOARD_VENDOR_DEADLINE", 60.0)
+
+
+def _search_budget_end() -> float:
+    return time.monotonic() + getattr(settings, "DASHBOARD_SEARCH_BUDGET", 90.0)
+
+
+def _vendor_searches() -> list[tuple]:
+    """(label, maker, fallback, limit) for every vendor searched by the dashboard."""
+    return [
+        (GEMILANG_SOURCE, (lambda: (create_gemilang_scraper(), GemilangUrlBuilder())), None, None),
+        (DEPO_BANGUNAN_SOURCE, (lambda: (create_depo_scraper(), DepoUrlBuilder())), _depo_fallback, None),
+        (JURAGAN_MATERIAL_SOURCE, (lambda: (create_juraganmaterial_scraper(), JuraganMaterialUrlBuilder())), _juragan_fallback, None),
+        (MITRA10_SOURCE, (lambda: (create_mitra10_scraper(), Mitra10UrlBuilder())), _mitra10_fallback, None),
+        (TOKOPEDIA_SOURCE, _create_tokopedia_ulasan_scraper, _tokopedia_fallback, 20),
+    ]
+
+
+def _scrape_all_vendors(request, keyword: str, budget_end: float | None = None) -> tuple[list[dict], list[str]]:
+    """
+    Scrape prices from all vendors concurrently.
+
+    Returns the prices (in vendor order) and the vendors that missed the
+    deadline; those are flagged to the user as partial.
+    """
+    budget_end = budget_end if budget_end is not None else _search_budget_end()
+    deadline = _vendor_deadline()
+    tasks = {
+        label: (_with_messages, (_run_vendor_to_prices, keyword, maker, label, fallback, limit))
+        for label, maker, fallback, limit in _vendor_searches()
+    }
+    results, missed = _run_concurrently(tasks, deadline, budget_end)
+
     prices = []
-    prices += _run_vendor_to_prices(request, keyword, (lambda: (create_gemilang_scraper(), GemilangUrlBuilder())), GEMILANG_SOURCE)
-    prices += _run_vendor_to_prices(request, keyword, (lambda: (create_depo_scraper(), DepoUrlBuilder())), DEPO_BANGUNAN_SOURCE, _depo_fallback)
-    prices += _run_vendor_to_prices(request, keyword, (lambda: (create_juraganmaterial_scraper(), JuraganMaterialUrlBuilder())), JURAGAN_MATERIAL_SOURCE, _juragan_fallback)
-    prices += _run_vendor_to_prices(request, keyword, (lambda: (create_mitra10_scraper(), Mitra10UrlBuilder())), MITRA10_SOURCE, _mitra10_fallback)
-    prices += _run_vendor_to_prices(request, keyword, _create_tokopedia_ulasan_scraper, TOKOPEDIA_SOURCE, _tokopedia_fallback, limit=20)
-    return prices
+    for label in tasks:
+        vendor_prices, queued = results.get(label) or ([], [])
+        _replay_messages(request, queued)
+        prices += vendor_prices or []
+
+    for label in missed:
+        logger.warning(f"{label}: no results within {deadline:.0f}s, rendering without it")
+        if request is not None:
+            messages.warning(request, f"[{label}] Partial results: vendor did not respond within {deadline:.0f}s")
+    return prices, missed
+
+
+def _collect_vendor_locations(request, prices: list[dict], budget_end: float | None = None) -> dict:
+    """Collect location data for vendors that have prices, running live lookups concurrently."""
+    budget_end = budget_end if budget_end is not None else _search_budget_end()
+    sources = {p.get("source") for p in prices}
+
+    # Live store-location scrapers; Juragan Material and Tokopedia are derived from the prices
+    live_lookups = {
+        GEMILANG_SOURCE: (_with_messages, (_run_location_scraper, create_gemilang_location_scraper, GEMILANG_SOURCE)),
+        DEPO_BANGUNAN_SOURCE: (_with_messages, (_run_location_scraper, create_depo_location_scraper, DEPO_BANGUNAN_SOURCE)),
+        MITRA10_SOURCE: (_with_messages, (_run_mitra10_location_scraper,)),
+    }
+    tasks = {label: task for label, task in live_lookups.items() if label in sources}
+    lookups, missed = _run_concurrently(tasks, _vendor_deadline(), budget_end, pool="locations")
+    for label in missed:
+        logger.warning(f"{label}: store locations not loaded within the deadline")
+
+    results = {}
+    for label, (locations, queued) in lookups.items():
+        _replay_messages(request, queued)
+        results[label] = locations
 
+    if JURAGAN_MATERIAL_SOURCE in sources:
+        results[JURAGAN_MATERIAL_SOURCE] = _get_juragan_material_locations(prices)
+    if TOKOPEDIA_SOURCE in sources:
+        results[TOKOPEDIA_SOURCE] = _get_tokopedia_locations(prices)
 
-def _collect_vendor_locations(request, prices: list[dict]) -> dict:
-    """Collect location data for vendors that have prices."""
-    locations_data = {}
-
-    # Gemilang locations
-    gemilang_has_prices = any(p.get("source") == GEMILANG_SOURCE for p in prices)
-    if gemilang_has_prices:
-        gemilang_locations = _run_location_scraper(request, create_gemilang_location_scraper, GEMILANG_SOURCE)
-        if gemilang_locations:
-            locations_data[GEMILANG_SOURCE] = gemilang_locations
-
-    # Depo Bangunan locations
-    depo_has_prices = any(p.get("source") == DEPO_BANGUNAN_SOURCE for p in prices)
-    if depo_has_prices:
-        depo_locations = _run_location_scraper(request, create_depo_location_scraper, DEPO_BANGUNAN_SOURCE)
-        if depo_locations:
-            locations_data[DEPO_BANGUNAN_SOURCE] = depo_locations
-
-    # Juragan Material locations
-    juragan_has_prices = any(p.get("source") == JURAGAN_MATERIAL_SOURCE for p in prices)
-    if juragan_has_prices:
-        juragan_locations = _get_juragan_material_locations(prices)
-        if juragan_locations:
-            locations_data[JURAGAN_MATERIAL_SOURCE] = juragan_locations
-
-    # Mitra10 locations
-    mitra10_has_prices = any(p.get("source") == MITRA10_SOURCE for p in prices)
-    if mitra10_has_prices:
-        mitra10_locations = _run_mitra10_location_scraper(request)
-        if mitra10_locations:
-            locations_data[MITRA10_SOURCE] = mitra10_locations
-
-    # Tokopedia locations
-    tokopedia_has_prices = any(p.get("source") == TOKOPEDIA_SOURCE for p in prices)
-    if tokopedia_has_prices:
-        tokopedia_locations = _get_tokopedia_locations(prices)
-        if tokopedia_locations:
-            locations_data[TOKOPEDIA_SOURCE] = tokopedia_locations
-
-    return locations_data
+    # Keep the vendor order of the original serial lookups
+    order = [label for label, _, _, _ in _vendor_searches()]
+    return {label: results[label] for label in order if results.get(label)}
 
 
 def _get_tokopedia_locations(prices: list[dict]) -> list[dict]:
@@ -2035,24 +2161,216 @@ def _clean_and_dedupe_prices(prices: list[dict]) -> list[dict]:
     return prices
 
 
-# ---------------- views ----------------
-@require_GET
-def home(request):
-    keyword = request.GET.get("q", "pasir")
+def _vendor_stream_rows(keyword: str, label: str, maker, fallback, limit, budget_end: float) -> list[dict]:
+    """
+    Cleaned, deduped and location-enriched price rows for one vendor.
+
+    The response headers are sent before this runs, so messages are only logged.
+    """
+    prices, queued = _with_messages(_run_vendor_to_prices, keyword, maker, label, fallback, limit)
+    _replay_messages(None, queued)
+    if prices:
+        locations_data = _collect_vendor_locations(None, prices, budget_end)
+        prices = _add_location_info_to_prices(prices, locations_data)
+    return _clean_and_dedupe_prices(prices)
+
+
+def _sse_event(event: str, payload: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
 
-    # Scrape prices from all vendors
-    prices = _scrape_all_vendors(request, keyword)
+def _stream_vendor_events(keyword: str, refresh: bool = False):
+    """
+    Yield one server-sent event per vendor as soon as its rows are ready.
+
+    Ends with a ``done`` event listing the vendors that did not finish within
+    the search budget. Cached results (see ``_cached_search``) are replayed
+    instead of scraping; a complete live search is cached for the next one.
+    """
+    entry = _cached_entry(keyword, refresh)
+    if entry is not None:
+        yield from _replay_cached_events(keyword, entry)
+        return
+
+    budget_end = _search_budget_end()
+    executor = _search_executor("vendors")
+    futures = {
+        executor.submit(_run_in_worker, _vendor_stream_rows, keyword, label, maker, fallback, limit, budget_end): label
+        for label, maker, fallback, limit in _vendor_searches()
+    }
+    pending = set(futures.values())
+    streamed = []
+
+    # Opening comment so proxies flush the headers before the first vendor returns
+    yield ": stream open\n\n"
+    try:
+        for future in as_completed(futures, timeout=max(0.0, budget_end - time.monotonic())):
+            label = futures[future]
+            pending.discard(label)
+            try:
+                rows = future.result()
+            except Exception as e:
+                logger.error(f"{label}: streaming search failed: {e}")
+                rows = []
+            streamed += rows
+            yield _sse_event("vendor", {"source": label, "prices": rows})
+    except FuturesTimeoutError:
+        logger.warning(f"Streaming search budget expired, partial vendors: {sorted(pending)}")
+    finally:
+        for future in futures:
+            future.cancel()
+
+    if not pending:
+        _store_search_results(keyword, _clean_and_dedupe_prices(streamed), [])
+    yield _sse_event("done", {
+        "keyword": keyword,
+        "total": len(streamed),
+        "partial_vendors": [label for label, _, _, _ in _vendor_searches() if label in pending],
+    })
+
+
+def _replay_cached_events(keyword: str, entry: dict):
+    """The events of a live stream, rebuilt from a cached search entry."""
+    for label, _, _, _ in _vendor_searches():
+        if label not in entry["partial_vendors"]:
+            rows = [p for p in entry["prices"] if p.get("source") == label]
+            yield _sse_event("vendor", {"source": label, "prices": rows})
+    yield _sse_event("done", {
+        "keyword": keyword,
+        "total": len(entry["prices"]),
+        "partial_vendors": entry["partial_vendors"],
+    })
+
+
+# ---------------- search result cache ----------------
+SEARCH_CACHE_PREFIX = "dashboard:search"
+SEARCH_CACHE_GENERATION_KEY = f"{SEARCH_CACHE_PREFIX}:generation"
 
-    # Collect location data for vendors with prices
-    locations_data = _collect_vendor_locations(request, prices)
 
-    # Add location info to prices
+def _search_cache():
+    """Cache holding dashboard search results, shared by all workers when configured."""
+    return caches[getattr(settings, "DASHBOARD_SEARCH_CACHE_ALIAS", "default")]
+
+
+def _search_prices(request, keyword: str) -> tuple[list[dict], list[str]]:
+    """
+    Full dashboard search: scrape, enrich with locations, clean and dedupe.
+
+    Messages go to ``request``; pass None when there is no live request.
+    """
+    budget_end = _search_budget_end()
+    prices, partial_vendors = _scrape_all_vendors(request, keyword, budget_end)
+    locations_data = _collect_vendor_locations(request, prices, budget_end)
     prices = _add_location_info_to_prices(prices, locations_data)
+    return _clean_and_dedupe_prices(prices), partial_vendors
+
+
+def _normalize_keyword(keyword: str) -> str:
+    return " ".join((keyword or "").lower().split())
+
+
+def _search_cache_key(keyword: str) -> str:
+    generation = _search_cache().get(SEARCH_CACHE_GENERATION_KEY, 0)
+    digest = hashlib.sha1(_normalize_keyword(keyword).encode("utf-8")).hexdigest()
+    return f"{SEARCH_CACHE_PREFIX}:{generation}:{digest}"
+
+
+def _search_cache_ttl() -> float:
+    return getattr(settings, "DASHBOARD_SEARCH_CACHE_TTL", 300.0)
+
+
+def _search_cache_stale() -> float:
+    return getattr(settings, "DASHBOARD_SEARCH_CACHE_STALE", 900.0)
+
 
-    # Clean and deduplicate prices
-    prices = _clean_and_dedupe_prices(prices)
+def _store_search_results(keyword: str, prices: list[dict], partial_vendors: list[str]) -> None:
+    ttl = _search_cache_ttl()
+    if ttl <= 0:
+        return
+    entry = {"prices": prices, "partial_vendors": partial_vendors, "stored_at": time.time()}
+    _search_cache().set(_search_cache_key(keyword), entry, timeout=ttl + _search_cache_stale())
+
+
+def invalidate_search_cache(keyword: str | None = None) -> None:
+    """Drop the cached results for one keyword, or for every keyword when none is given."""
+    if keyword is not None:
+        _search_cache().delete(_search_cache_key(keyword))
+        return
+    try:
+        _search_cache().incr(SEARCH_CACHE_GENERATION_KEY)
+    except ValueError:
+        _search_cache().set(SEARCH_CACHE_GENERATION_KEY, 1, timeout=None)
+
+
+def _refresh_search_results(keyword: str, lock_key: str) -> None:
+    try:
+        # No request: the response was sent already, so worker messages are only logged
+        prices, partial_vendors = _search_prices(None, keyword)
+        _store_search_results(keyword, prices, partial_vendors)
+    except Exception as e:
+        logger.error(f"Background refresh of dashboard search '{keyword}' failed: {e}")
+    finally:
+        _search_cache().delete(lock_key)
+
+
+def _start_background_refresh(keyword: str) -> bool:
+    """Refresh a stale entry in a daemon thread; at most one refresh per keyword runs at a time."""
+    lock_key = f"{_search_cache_key(keyword)}:refreshing"
+    timeout = int(getattr(settings, "DASHBOARD_SEARCH_BUDGET", 90.0)) + 30
+    if not _search_cache().add(lock_key, True, timeout=timeout):
+        return False
+    threading.Thread(
+        target=_run_in_worker,
+        args=(_refresh_search_results, keyword, lock_key),
+        name="dashboard-search-refresh",
+        daemon=True,
+    ).start()
+    return True
+
+
+def _cached_entry(keyword: str, refresh: bool = False) -> dict | None:
+    """
+    Cached search entry for a keyword, or None when it must be searched live.
 
-    return render(request, "dashboard/home.html", {"prices": prices})
+    Entries younger than DASHBOARD_SEARCH_CACHE_TTL are returned as is. Older
+    ones are still returned for up to DASHBOARD_SEARCH_CACHE_STALE more seconds
+    while a background refresh replaces them. ``refresh`` skips the cache.
+    """
+    entry = None if refresh or _search_cache_ttl() <= 0 else _search_cache().get(_search_cache_key(keyword))
+    if entry is not None and time.time() - entry["stored_at"] > _search_cache_ttl():
+        _start_background_refresh(keyword)
+    return entry
+
+
+def _cached_search(request, keyword: str, refresh: bool = False) -> tuple[list[dict], list[str]]:
+    """Search results for a keyword, served from the cache when possible (see ``_cached_entry``)."""
+    entry = _cached_entry(keyword, refresh)
+    if entry is not None:
+        return entry["prices"], entry["partial_vendors"]
+
+    prices, partial_vendors = _search_prices(request, keyword)
+    _store_search_results(keyword, prices, partial_vendors)
+    return prices, partial_vendors
+
+
+# ---------------- views ----------------
+@require_GET
+def home(request):
+    keyword = request.GET.get("q", "pasir")
+    prices, partial_vendors = _cached_search(request, keyword, refresh=request.GET.get("refresh") == "1")
+    return render(request, "dashboard/home.html", {"prices": prices, "partial_vendors": partial_vendors})
+
+
+@require_GET
+def search_stream(request):
+    """Dashboard search as server-sent events: one ``vendor`` event per vendor, then ``done``."""
+    keyword = request.GET.get("q", "pasir")
+    refresh = request.GET.get("refresh") == "1"
+    response = StreamingHttpResponse(_stream_vendor_events(keyword, refresh), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Disable proxy buffering (nginx) so each event is delivered immediately
+    response["X-Accel-Buffering"] = "no"
+    return response
 
 
 @require_POST
@@ -2065,6 +2383,8 @@ def trigger_scrape(request):
         "mitra10": _run_vendor_to_count(request, keyword, (lambda: (create_mitra10_scraper(), Mitra10UrlBuilder())), MITRA10_SOURCE, _mitra10_fallback),
         "tokopedia": _run_vendor_to_count(request, keyword, _create_tokopedia_ulasan_scraper, TOKOPEDIA_SOURCE, _tokopedia_fallback),
     }
+    # The dashboard must show this scrape, not results cached before it
+    invalidate_search_cache(keyword)
     messages.success(
         request,
         "Scrape completed. Gemilang={gemilang}, Depo={depo}, JuraganMaterial={juragan}, Mitra10={mitra}, Tokopedia={tokopedia}".format(
@@ -0,0 +1,186 @@
+# db_pricing/anomaly_engine.py
+"""
+Statistical price anomaly detection.
+
+A new price is compared with the product's recent history from
+``price_observations`` rather than only with the single stored price. For
+products with enough history the verdict uses the rolling median and the
+median absolute deviation (MAD): the price must move at least ``pct``
+percent away from the median *and* at least ``z`` robust standard
+deviations. Volatile products therefore need a larger move to be flagged,
+while a price that drifts away from its usual level is still caught.
+
+Products without enough history fall back to the old rule: a change of at
+least ``pct`` percent against the stored price.
+
+Thresholds can be set per category with the ``PRICE_ANOMALY_THRESHOLDS``
+setting, e.g. ``{"default": {"pct": 15}, "Alat Berat": {"pct": 25, "z": 4}}``.
+"""
+
+import logging
+import statistics
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from db_pricing.models import PriceObservation
+from db_pricing.price_history import PriceHistoryService, item_value
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is in requirements.txt
+    np = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLDS = {'pct': 15.0, 'z': 3.5}
+
+# Scale factor turning a MAD into a standard deviation estimate for normal data
+MAD_TO_SIGMA = 1.4826
+
+
+def get_category_thresholds(category: Optional[str] = None,
+                            overrides: Optional[Dict[str, Dict[str, float]]] = None) -> Dict[str, float]:
+    """Thresholds for a product category, layered over the configured and built-in defaults"""
+    configured = overrides if overrides is not None else getattr(settings, 'PRICE_ANOMALY_THRESHOLDS', {}) or {}
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    thresholds.update(configured.get('default', {}))
+    if category:
+        thresholds.update(configured.get(category, {}))
+    return thresholds
+
+
+def robust_verdicts(histories: List[List[int]], new_prices: List[int],
+                    pct_thresholds: List[float], z_thresholds: List[float]) -> List[bool]:
+    """
+    Flag new prices that deviate from their history's median
+
+    Evaluated for all products at once with NumPy (pure Python without it).
+    Every history must be non-empty.
+    """
+    if not histories:
+        return []
+    if np is None:
+        return [
+            _robust_verdict(history, new_price, pct, z)
+            for history, new_price, pct, z in zip(histories, new_prices, pct_thresholds, z_thresholds)
+        ]
+
+    counts = np.fromiter((len(history) for history in histories), dtype=np.intp, count=len(histories))
+    values = np.full((len(histories), int(counts.max())), np.nan)
+    for row, history in enumerate(histories):
+        values[row, :len(history)] = history
+
+    medians = _row_medians(values, counts)
+    sigmas = MAD_TO_SIGMA * _row_medians(np.abs(values - medians[:, None]), counts)
+    deviations = np.abs(np.asarray(new_prices, dtype=float) - medians)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pct = np.where(medians > 0, deviations / medians * 100, np.where(deviations > 0, np.inf, 0.0))
+        z = np.where(sigmas > 0, deviations / sigmas, np.where(deviations > 0, np.inf, 0.0))
+
+    flagged = (pct >= np.asarray(pct_thresholds)) & (z >= np.asarray(z_thresholds))
+    return flagged.tolist()
+
+
+def _row_medians(values, counts):
+    # Median of the first counts[i] entries of each row; NaN padding sorts last.
+    # Much faster than np.nanmedian on many short rows.
+    ordered = np.sort(values, axis=1)
+    rows = np.arange(len(counts))
+    return (ordered[rows, (counts - 1) // 2] + ordered[rows, counts // 2]) / 2
+
+
+def _robust_verdict(history: List[int], new_price: int, pct_threshold: float, z_threshold: float) -> bool:
+    median = statistics.median(history)
+    sigma = MAD_TO_SIGMA * statistics.median(abs(price - median) for price in history)
+    deviation = abs(new_price - median)
+    pct = deviation / median * 100 if median > 0 else (float('inf') if deviation else 0.0)
+    z = deviation / sigma if sigma > 0 else (float('inf') if deviation else 0.0)
+    return pct >= pct_threshold and z >= z_threshold
+
+
+class PriceAnomalyEngine:
+    """Per-vendor anomaly scorer; call ``prepare`` with a save batch, then ``is_anomaly`` per item"""
+
+    # History window and the minimum observations needed to trust it
+    WINDOW_DAYS = 30
+    MIN_HISTORY = 5
+    # Most recent observations considered per product
+    MAX_HISTORY = 60
+    # Product keys per history query
+    QUERY_CHUNK_SIZE = 1000
+
+    def __init__(self, vendor: str, thresholds: Optional[Dict[str, Dict[str, float]]] = None):
+        self.vendor = vendor
+        self.thresholds = thresholds
+        self._verdicts: Dict[str, bool] = {}
+
+    def prepare(self, items: List[Any]) -> int:
+        """
+        Score a batch of scraped items against their price history
+
+        Returns:
+            Number of items scored statistically (the rest use the percentage rule)
+        """
+        self._verdicts = {}
+        try:
+            return self._score(items)
+        except Exception as e:
+            # Never block a save; every item falls back to the percentage rule
+            logger.error(f"Statistical anomaly scoring failed for {self.vendor}: {str(e)}")
+            self._verdicts = {}
+            return 0
+
+    def _score(self, items: List[Any]) -> int:
+        candidates = {}
+        for item in items:
+            try:
+                candidates[PriceHistoryService.key_for(self.vendor, item)] = item
+            except (AttributeError, TypeError):
+                continue
+
+        histories = self._load_histories(list(candidates))
+        keys = [key for key, history in histories.items() if len(history) >= self.MIN_HISTORY]
+        if not keys:
+            return 0
+
+        thresholds = [self._thresholds_for(candidates[key]) for key in keys]
+        verdicts = robust_verdicts(
+            [histories[key] for key in keys],
+            [int(item_value(candidates[key], 'price', 0)) for key in keys],
+            [t['pct'] for t in thresholds],
+            [t['z'] for t in thresholds],
+        )
+        self._verdicts = dict(zip(keys, verdicts))
+        return len(keys)
+
+    def is_anomaly(self, item: Any, existing_price: float, new_price: float) -> bool:
+        """Whether moving from ``existing_price`` to ``new_price`` should be held for review"""
+        if existing_price == 0:
+            return False
+        verdict = self._verdicts.get(PriceHistoryService.key_for(self.vendor, item))
+        if verdict is not None:
+            return verdict
+        change_pct = ((new_price - existing_price) / existing_price) * 100
+        return abs(change_pct) >= self._thresholds_for(item)['pct']
+
+    def _thresholds_for(self, item: Any) -> Dict[str, float]:
+        return get_category_thresholds(item_value(item, 'category', ''), self.thresholds)
+
+    def _load_histories(self, keys: List[str]) -> Dict[str, List[int]]:
+        since = timezone.now() - timedelta(days=self.WINDOW_DAYS)
+        histories: Dict[str, List[int]] = {}
+        for start in range(0, len(keys), self.QUERY_CHUNK_SIZE):
+            rows = PriceObservation.objects.filter(
+                vendor=self.vendor,
+                product_key__in=keys[start:start + self.QUERY_CHUNK_SIZE],
+                observed_at__gte=since,
+            ).order_by('-observed_at').values_list('product_key', 'price')
+            for key, price in rows:
+                history = histories.setdefault(key, [])
+                if len(history) < self.MAX_HISTORY:
+                    history.append(price)
+        return histories
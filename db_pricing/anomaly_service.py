@@ -4,10 +4,16 @@ Service for handling price anomaly notifications.
 Saves detected price anomalies to the database for review.
 """
 
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
+from django.conf import settings
+from django.core.cache import caches
 from django.db import transaction, connection
+from django.db.models import Case, Count, F, IntegerField, Value, When
 from django.utils import timezone
-from db_pricing.models import PriceAnomaly
+from db_pricing.models import (
+    PriceAnomaly, GemilangProduct, Mitra10Product, TokopediaProduct, DepoBangunanProduct, JuraganMaterialProduct,
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,6 +22,9 @@ logger = logging.getLogger(__name__)
 class PriceAnomalyService:
     """Service to save and manage price anomalies detected during scraping"""
     
+    # Distinct products per lookup statement; SQLite allows at most 500 SELECTs in a UNION ALL
+    LOOKUP_CHUNK_SIZE = 500
+    
     VENDOR_MAP = {
         'gemilang': 'gemilang',
         'mitra10': 'mitra10',
@@ -24,11 +33,34 @@ class PriceAnomalyService:
         'juragan_material': 'juragan_material',
     }
     
+    # Product tables that approved prices are written back to
+    PRODUCT_MODEL_MAP = {
+        'gemilang': GemilangProduct,
+        'mitra10': Mitra10Product,
+        'tokopedia': TokopediaProduct,
+        'depobangunan': DepoBangunanProduct,
+        'juragan_material': JuraganMaterialProduct,
+    }
+    
+    # Rows per INSERT statement when saving anomalies in bulk
+    BULK_BATCH_SIZE = 500
+    
+    # Cached statistics snapshot, shared by every worker (and the scheduler) so
+    # a save or review anywhere drops it everywhere
+    STATISTICS_CACHE_KEY = 'db_pricing:anomaly_statistics'
+    STATISTICS_CACHE_TTL = 30
+    
     @classmethod
-    def save_anomalies(cls, vendor: str, anomalies: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def save_anomalies(cls, vendor: str, anomalies: List[Dict[str, Any]],
+                       batch_size: Optional[int] = None) -> Dict[str, Any]:
         """
         Save detected price anomalies to database
         
+        Rows are validated in memory and inserted with ``bulk_create`` in
+        batches of ``batch_size`` (default ``BULK_BATCH_SIZE``). If a batch is
+        rejected by the database, that batch is retried row by row so the
+        error is reported against the offending anomaly only.
+        
         Args:
             vendor: Vendor name (gemilang, mitra10, tokopedia, etc.)
             anomalies: List of anomaly dictionaries containing:
@@ -39,6 +71,7 @@ class PriceAnomalyService:
                 - old_price: Previous price
                 - new_price: Current price
                 - change_percent: Percentage change
+            batch_size: Optional number of rows per INSERT
         
         Returns:
             Dictionary with:
@@ -63,54 +96,20 @@ class PriceAnomalyService:
                 'errors': [error_msg]
             }
         
+        batch_size = batch_size or cls.BULK_BATCH_SIZE
+        records, errors = cls._build_anomaly_records(vendor, anomalies)
         saved_count = 0
-        errors = []
         
         try:
             with transaction.atomic():
-                for anomaly in anomalies:
-                    try:
-                        # Extract data from anomaly dictionary
-                        product_name = anomaly.get('name', '')
-                        product_url = anomaly.get('url', '')
-                        unit = anomaly.get('unit', '')
-                        location = anomaly.get('location', '')
-                        old_price = anomaly.get('old_price', 0)
-                        new_price = anomaly.get('new_price', 0)
-                        change_percent = anomaly.get('change_percent', 0)
-                        
-                        # Validate required fields
-                        if not product_name or not product_url:
-                            error_msg = f"Missing required fields for anomaly: {anomaly}"
-                            logger.warning(error_msg)
-                            errors.append(error_msg)
-                            continue
-                        
-                        # Create PriceAnomaly record
-                        PriceAnomaly.objects.create(
-                            vendor=cls.VENDOR_MAP[vendor],
-                            product_name=product_name,
-                            product_url=product_url,
-                            unit=unit,
-                            location=location,
-                            old_price=old_price,
-                            new_price=new_price,
-                            change_percent=change_percent,
-                            status='pending',
-                            detected_at=timezone.now()
-                        )
-                        
-                        saved_count += 1
-                        logger.info(
-                            f"Saved price anomaly for {vendor}: {product_name} "
-                            f"({old_price} -> {new_price}, {change_percent}%)"
-                        )
-                        
-                    except Exception as e:
-                        error_msg = f"Error saving anomaly {anomaly.get('name', 'unknown')}: {str(e)}"
-                        logger.error(error_msg)
-                        errors.append(error_msg)
+                for start in range(0, len(records), batch_size):
+                    batch = records[start:start + batch_size]
+                    saved, batch_errors = cls._insert_anomaly_batch(batch)
+                    saved_count += saved
+                    errors.extend(batch_errors)
                         
+            if saved_count:
+                cls.invalidate_statistics()
             logger.info(f"Successfully saved {saved_count} anomalies for {vendor}")
             return {
                 'success': True,
@@ -127,6 +126,128 @@ class PriceAnomalyService:
                 'errors': [error_msg]
             }
     
+    @classmethod
+    def _build_anomaly_records(cls, vendor: str, anomalies: List[Dict[str, Any]]):
+        """Build unsaved PriceAnomaly objects, collecting per-row validation errors."""
+        records = []
+        errors = []
+        detected_at = timezone.now()
+        
+        for anomaly in anomalies:
+            try:
+                product_name = anomaly.get('name', '')
+                product_url = anomaly.get('url', '')
+                
+                # Validate required fields
+                if not product_name or not product_url:
+                    error_msg = f"Missing required fields for anomaly: {anomaly}"
+                    logger.warning(error_msg)
+                    errors.append(error_msg)
+                    continue
+                
+                records.append(PriceAnomaly(
+                    vendor=cls.VENDOR_MAP[vendor],
+                    product_name=product_name,
+                    product_url=product_url,
+                    unit=anomaly.get('unit', ''),
+                    location=anomaly.get('location', ''),
+                    old_price=anomaly.get('old_price', 0),
+                    new_price=anomaly.get('new_price', 0),
+                    change_percent=anomaly.get('change_percent', 0),
+                    status='pending',
+                    detected_at=detected_at
+                ))
+                
+            except Exception as e:
+                error_msg = f"Error saving anomaly {anomaly.get('name', 'unknown')}: {str(e)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+        
+        return records, errors
+    
+    @classmethod
+    def _insert_anomaly_batch(cls, batch: List[PriceAnomaly]):
+        """Insert one batch; on failure fall back to row-by-row inserts to isolate bad rows."""
+        try:
+            with transaction.atomic():
+                PriceAnomaly.objects.bulk_create(batch)
+            return len(batch), []
+        except Exception as e:
+            logger.warning(f"Bulk insert of {len(batch)} anomalies failed, retrying row by row: {e}")
+        
+        saved = 0
+        errors = []
+        for record in batch:
+            try:
+                with transaction.atomic():
+                    PriceAnomaly.objects.create(
+                        vendor=record.vendor,
+                        product_name=record.product_name,
+                        product_url=record.product_url,
+                        unit=record.unit,
+                        location=record.location,
+                        old_price=record.old_price,
+                        new_price=record.new_price,
+                        change_percent=record.change_percent,
+                        status=record.status,
+                        detected_at=record.detected_at
+                    )
+                saved += 1
+            except Exception as e:
+                error_msg = f"Error saving anomaly {record.product_name}: {str(e)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+        return saved, errors
+    
+    @classmethod
+    def _statistics_cache(cls):
+        return caches[getattr(settings, 'PRICE_ANOMALY_STATISTICS_CACHE_ALIAS', 'default')]
+    
+    @classmethod
+    def get_statistics(cls) -> Dict[str, Any]:
+        """
+        Get anomaly counts by status and vendor
+        
+        Computed with one grouped ``COUNT`` over ``(status, vendor)`` and
+        cached for ``STATISTICS_CACHE_TTL`` seconds in the cache named by
+        ``PRICE_ANOMALY_STATISTICS_CACHE_ALIAS``. The snapshot is dropped
+        whenever anomalies are saved or reviewed through this service; with a
+        per-process alias that only reaches the process that made the change.
+        
+        Returns:
+            Dictionary with total_count, pending_count, by_status and by_vendor
+        """
+        statistics = cls._statistics_cache().get(cls.STATISTICS_CACHE_KEY)
+        if statistics is not None:
+            return statistics
+        
+        status_counts = {status_code: 0 for status_code, _ in PriceAnomaly.STATUS_CHOICES}
+        vendor_counts = {vendor_code: 0 for vendor_code, _ in PriceAnomaly.VENDOR_CHOICES}
+        total_count = 0
+        
+        rows = PriceAnomaly.objects.values('status', 'vendor').annotate(count=Count('id')).order_by()
+        for row in rows:
+            total_count += row['count']
+            if row['status'] in status_counts:
+                status_counts[row['status']] += row['count']
+            if row['vendor'] in vendor_counts:
+                vendor_counts[row['vendor']] += row['count']
+        
+        statistics = {
+            'total_count': total_count,
+            'pending_count': status_counts['pending'],
+            'by_status': status_counts,
+            'by_vendor': vendor_counts,
+        }
+        cls._statistics_cache().set(cls.STATISTICS_CACHE_KEY, statistics, cls.STATISTICS_CACHE_TTL)
+        return statistics
+    
+    @classmethod
+    def invalidate_statistics(cls) -> None:
+        """Drop the cached statistics snapshot, now and again once the current transaction commits"""
+        cls._statistics_cache().delete(cls.STATISTICS_CACHE_KEY)
+        transaction.on_commit(lambda: cls._statistics_cache().delete(cls.STATISTICS_CACHE_KEY))
+    
     @classmethod
     def get_pending_anomalies(cls, vendor: str = None) -> List[PriceAnomaly]:
         """
@@ -164,6 +285,7 @@ class PriceAnomalyService:
             anomaly.notes = notes
             anomaly.reviewed_at = timezone.now()
             anomaly.save()
+            cls.invalidate_statistics()
             
             logger.info(f"Marked anomaly {anomaly_id} as {status}")
             return True
@@ -261,6 +383,7 @@ class PriceAnomalyService:
                         # Mark anomaly as applied
                         anomaly.status = 'applied'
                         anomaly.save()
+                        cls.invalidate_statistics()
                         
                         logger.info(
                             f"Applied approved price for {anomaly.vendor}: {anomaly.product_name} "
@@ -323,6 +446,7 @@ class PriceAnomalyService:
             anomaly.notes = notes
             anomaly.reviewed_at = timezone.now()
             anomaly.save()
+            cls.invalidate_statistics()
             
             logger.info(f"Rejected anomaly {anomaly_id}: {notes}")
             
@@ -349,6 +473,12 @@ class PriceAnomalyService:
         """
         Apply multiple approved anomalies at once
         
+        All anomalies are loaded in one query and grouped by vendor. Each
+        vendor table receives a single ``UPDATE ... SET price = CASE id ...``
+        for its matching products, and the applied anomalies are flipped to
+        ``applied`` with one bulk update, all inside one transaction. Per-id
+        results and messages match ``apply_approved_price``.
+        
         Args:
             anomaly_ids: List of anomaly IDs to apply
             
@@ -359,19 +489,31 @@ class PriceAnomalyService:
                 - failed_count: Number that failed
                 - results: List of individual results
         """
+        try:
+            with transaction.atomic():
+                messages = cls._apply_anomalies_in_bulk(anomaly_ids)
+        except Exception as e:
+            logger.error(f"Error applying anomalies in batch: {str(e)}")
+            messages = {anomaly_id: (False, f'Error applying price: {str(e)}') for anomaly_id in anomaly_ids}
+        
         results = []
         applied_count = 0
         failed_count = 0
+        reported = set()
         
         for anomaly_id in anomaly_ids:
-            result = cls.apply_approved_price(anomaly_id)
+            success, message = messages[anomaly_id]
+            if anomaly_id in reported and success:
+                # A repeated id fails the second time, as it would when applied in order
+                success, message = False, 'Anomaly must be approved before applying. Current status: applied'
+            reported.add(anomaly_id)
             results.append({
                 'anomaly_id': anomaly_id,
-                'success': result['success'],
-                'message': result['message']
+                'success': success,
+                'message': message
             })
             
-            if result['success']:
+            if success:
                 applied_count += 1
             else:
                 failed_count += 1
@@ -386,3 +528,99 @@ class PriceAnomalyService:
             'failed_count': failed_count,
             'results': results
         }
+    
+    @classmethod
+    def _apply_anomalies_in_bulk(cls, anomaly_ids: List[int]) -> Dict[int, tuple]:
+        """Apply anomalies set-wise. Returns ``(success, message)`` keyed by anomaly id."""
+        pks = {}
+        for anomaly_id in anomaly_ids:
+            try:
+                pks[anomaly_id] = int(anomaly_id)
+            except (TypeError, ValueError):
+                pks[anomaly_id] = None
+        
+        anomalies = PriceAnomaly.objects.in_bulk({pk for pk in pks.values() if pk is not None})
+        messages = {}
+        by_vendor = defaultdict(list)
+        
+        for anomaly_id, pk in pks.items():
+            anomaly = anomalies.get(pk)
+            if anomaly is None:
+                messages[anomaly_id] = (False, 'Anomaly not found')
+            elif anomaly.status != 'approved':
+                messages[anomaly_id] = (
+                    False, f'Anomaly must be approved before applying. Current status: {anomaly.status}'
+                )
+            elif anomaly.vendor not in cls.PRODUCT_MODEL_MAP:
+                messages[anomaly_id] = (False, f'Unknown vendor: {anomaly.vendor}')
+            else:
+                by_vendor[anomaly.vendor].append((anomaly_id, anomaly))
+        
+        applied_ids = []
+        now = timezone.now()
+        for vendor, entries in by_vendor.items():
+            counts = cls._update_vendor_prices(vendor, [anomaly for _, anomaly in entries], now)
+            for (anomaly_id, anomaly), updated_count in zip(entries, counts):
+                if updated_count > 0:
+                    applied_ids.append(anomaly.id)
+                    messages[anomaly_id] = (True, f'Price updated successfully for {updated_count} product(s)')
+                else:
+                    logger.warning(
+                        f"No matching product found for anomaly {anomaly.id}: "
+                        f"{anomaly.product_name}"
+                    )
+                    messages[anomaly_id] = (False, 'No matching product found to update')
+        
+        if applied_ids:
+            PriceAnomaly.objects.filter(id__in=applied_ids).update(status='applied')
+            cls.invalidate_statistics()
+        
+        return messages
+    
+    @classmethod
+    def _update_vendor_prices(cls, vendor: str, anomalies: List[PriceAnomaly], now):
+        """
+        Update one vendor table for a group of anomalies with a single statement.
+        Returns the number of matched products for each anomaly, in order.
+        """
+        model_class = cls.PRODUCT_MODEL_MAP[vendor]
+        
+        # Later anomalies for the same product win, as they would when applied in order
+        keys = {(a.product_name, a.product_url, a.unit): a for a in anomalies}
+        key_list = list(keys)
+        
+        # Each key is matched with = on every column, one UNION ALL branch per key,
+        # so the column collation decides equality (case and trailing spaces on MySQL)
+        product_ids = defaultdict(list)
+        for start in range(0, len(key_list), cls.LOOKUP_CHUNK_SIZE):
+            chunk = key_list[start:start + cls.LOOKUP_CHUNK_SIZE]
+            lookups = [
+                model_class.objects.filter(name=name, url=url, unit=unit)
+                .order_by()
+                .annotate(key_index=Value(index, output_field=IntegerField()))
+                .values_list('key_index', 'id')
+                for index, (name, url, unit) in enumerate(chunk)
+            ]
+            for index, product_id in lookups[0].union(*lookups[1:], all=True):
+                product_ids[chunk[index]].append(product_id)
+        
+        new_prices = {
+            product_id: keys[key].new_price
+            for key, ids in product_ids.items()
+            for product_id in ids
+        }
+        if new_prices:
+            model_class.objects.filter(id__in=new_prices).update(
+                price=Case(
+                    *[When(id=product_id, then=Value(price)) for product_id, price in new_prices.items()],
+                    default=F('price'),
+                    output_field=IntegerField()
+                ),
+                updated_at=now
+            )
+            logger.info(f"Applied {len(product_ids)} approved price(s) to {vendor}")
+        
+        return [
+            len(product_ids.get((a.product_name, a.product_url, a.unit), []))
+            for a in anomalies
+        ]
@@ -1,9 +1,34 @@
-from db_pricing.models import GemilangProduct, Mitra10Product, DepoBangunanProduct, JuraganMaterialProduct, TokopediaProduct
+import logging
+from collections import defaultdict
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from db_pricing.models import (
+    GemilangProduct, Mitra10Product, DepoBangunanProduct, JuraganMaterialProduct, TokopediaProduct,
+    CategorizationWatermark,
+)
 from db_pricing.categorization import ProductCategorizer
 
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[dict], None]
+
+
+def _chunked(rows: Iterable, size: int) -> Iterator[list]:
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
 
 class AutoCategorizationService:
-    
+
     MODEL_MAP = {
         'gemilang': GemilangProduct,
         'mitra10': Mitra10Product,
@@ -11,49 +36,133 @@ class AutoCategorizationService:
         'juragan_material': JuraganMaterialProduct,
         'tokopedia': TokopediaProduct,
     }
-    
+
+    DEFAULT_CHUNK_SIZE = 2000
+
     def __init__(self):
         self.categorizer = ProductCategorizer()
-    
-    def categorize_products(self, vendor: str, product_ids: list[int]) -> dict:
+
+    def _get_model(self, vendor: str):
         model_class = self.MODEL_MAP.get(vendor)
         if not model_class:
             raise ValueError(f"Unknown vendor: {vendor}")
-        
-        products = model_class.objects.filter(id__in=product_ids)
-        
+        return model_class
+
+    def categorize_products(self, vendor: str, product_ids: list[int]) -> dict:
+        model_class = self._get_model(vendor)
+
         categorized_count = 0
-        for product in products:
-            category = self.categorizer.categorize(product.name)
-            if category:
-                product.category = category
-                product.save(update_fields=['category'])
-                categorized_count += 1
-        
+        for id_chunk in _chunked(product_ids, self.DEFAULT_CHUNK_SIZE):
+            rows = model_class.objects.filter(id__in=id_chunk).values_list('id', 'name')
+            categorized_count += self._categorize_rows(model_class, list(rows))
+
         return {
             'total': len(product_ids),
             'categorized': categorized_count,
             'uncategorized': len(product_ids) - categorized_count
         }
-    
-    def categorize_all_products(self, vendor: str) -> dict:
-        model_class = self.MODEL_MAP.get(vendor)
-        if not model_class:
-            raise ValueError(f"Unknown vendor: {vendor}")
-        
-        products = model_class.objects.all()
-        
+
+    def categorize_all_products(self, vendor: str, chunk_size: Optional[int] = None,
+                                progress_callback: Optional[ProgressCallback] = None) -> dict:
+        """
+        Recategorize every product of a vendor.
+
+        Only ``(id, name)`` is read, streamed in chunks of ``chunk_size``. Each
+        chunk is categorized in one batch and written back with one
+        ``UPDATE ... WHERE id IN (...)`` per category. ``progress_callback``
+        receives a dict with ``vendor``, ``processed`` and ``categorized``
+        after every chunk.
+        """
+        model_class = self._get_model(vendor)
+        return self._categorize_queryset(vendor, model_class.objects.all(), chunk_size, progress_callback)
+
+    def categorize_incremental(self, vendor: str, chunk_size: Optional[int] = None,
+                               progress_callback: Optional[ProgressCallback] = None) -> dict:
+        """
+        Categorize only what changed since the vendor's last run.
+
+        Selects rows with an empty category or whose ``name`` differs from the
+        ``categorized_name`` recorded when they were last categorized, i.e.
+        new and renamed products. Price updates bump ``updated_at`` on every
+        re-scrape, so it is not used here. The first run, and any run after the
+        categorizer rules change, falls back to a full recategorization.
+        """
+        model_class = self._get_model(vendor)
+        started_at = timezone.now()
+        rules_version = self.categorizer.rules_version()
+        watermark, _ = CategorizationWatermark.objects.get_or_create(vendor=vendor)
+
+        if watermark.last_run_at is None or watermark.rules_version != rules_version:
+            mode = 'full'
+            queryset = model_class.objects.all()
+        else:
+            mode = 'incremental'
+            queryset = model_class.objects.filter(
+                Q(category='') | Q(category__isnull=True) | ~Q(categorized_name=F('name'))
+            )
+
+        result = self._categorize_queryset(vendor, queryset, chunk_size, progress_callback)
+
+        watermark.last_run_at = started_at
+        watermark.rules_version = rules_version
+        watermark.save(update_fields=['last_run_at', 'rules_version', 'updated_at'])
+
+        result['mode'] = mode
+        result['watermark'] = started_at.isoformat()
+        return result
+
+    def _categorize_queryset(self, vendor: str, queryset, chunk_size: Optional[int],
+                             progress_callback: Optional[ProgressCallback]) -> dict:
+        chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+
+        total = 0
         categorized_count = 0
-        for product in products:
-            category = self.categorizer.categorize(product.name)
-            if category:
-                product.category = category
-                product.save(update_fields=['category'])
-                categorized_count += 1
-        
-        total = products.count()
+        for chunk in self._iter_chunks(queryset, chunk_size):
+            categorized_count += self._categorize_rows(queryset.model, chunk)
+            total += len(chunk)
+
+            progress = {'vendor': vendor, 'processed': total, 'categorized': categorized_count}
+            logger.info(f"Categorized {categorized_count}/{total} {vendor} products")
+            if progress_callback:
+                progress_callback(progress)
+
         return {
             'total': total,
             'categorized': categorized_count,
             'uncategorized': total - categorized_count
         }
+
+    @staticmethod
+    def _iter_chunks(queryset, chunk_size: int) -> Iterator[list]:
+        # Keyset pages on id rather than one long-lived cursor: the loop writes
+        # to the same table, which the incremental filter also depends on
+        last_id = 0
+        while True:
+            chunk = list(
+                queryset.filter(id__gt=last_id).order_by('id').values_list('id', 'name')[:chunk_size]
+            )
+            if not chunk:
+                return
+            yield chunk
+            if len(chunk) < chunk_size:
+                return
+            last_id = chunk[-1][0]
+
+    def _categorize_rows(self, model_class, rows: list[tuple[int, str]]) -> int:
+        """Categorize ``(id, name)`` rows and write categories grouped by value. Returns matched count."""
+        categories = self.categorizer.categorize_batch([name for _, name in rows])
+
+        ids_by_category = defaultdict(list)
+        for (product_id, _), category in zip(rows, categories):
+            if category:
+                ids_by_category[category].append(product_id)
+
+        # The name as read, not F('name'): a rename during the run must still look changed
+        categorized = [model_class(id=product_id, categorized_name=name) for product_id, name in rows]
+
+        with transaction.atomic():
+            for category, ids in ids_by_category.items():
+                model_class.objects.filter(id__in=ids).exclude(category=category).update(category=category)
+            model_class.objects.bulk_update(categorized, ['categorized_name'], batch_size=500)
+
+        return sum(len(ids) for ids in ids_by_category.values())
@@ -1,5 +1,9 @@
 import re
 
+from api.utils.name_memo import NameMemo, get_name_memo, normalize_name, rules_fingerprint
+
+from .keyword_matcher import KeywordAutomaton
+
 
 class ProductCategorizer:
     
@@ -268,164 +272,205 @@ class ProductCategorizer:
     ]
     
     CATEGORY_ALAT_BERAT = "Alat Berat"
-    
-    def _check_alat_berat(self, normalized: str) -> bool:
+
+    # Context terms used by the rules below (kept here so the keyword
+    # automaton and the rules fingerprint cover them)
+    SANITAIR_PIPE_TERMS = {'pipa', 'pipe', 'conduit'}
+    PERALATAN_KERJA_PIPE_INDICATORS = {'pipa', 'pipe', 'pvc', 'ppr', 'hdpe', 'pralon', 'saddle'}
+    TANAH_PASIR_BATU_SEMEN_STANDALONE = {'semen', 'kerikil', 'sirtu', 'agregat'}
+    STEEL_TOOL_INDICATORS = {
+        'palu', 'obeng', 'tang', 'gergaji', 'sekop', 'linggis', 'siku tukang', 'kikir', 'bor', 'gerinda', 'kunci'
+    }
+    STEEL_TERMS = {'besi', 'baja', 'wire', 'metal', 'logam'}
+    INTERIOR_GLUE_TERMS = {'lem', 'glue'}
+    PIPE_CONTEXT_TERMS = {'pvc', 'pipa', 'pralon'}
+    LISTRIK_INDICATORS = {
+        'kabel', 'cable', 'saklar', 'switch', 'mcb', 'listrik',
+        'electric', 'elektrik', 'lampu', 'lamp', 'volt', 'watt',
+        'ampere', 'stop kontak', 'outlet', 'colokan'
+    }
+    CONTEXT_TERMS = {
+        'conduit', 'elektrik', 'listrik', 'kabel', 'isolasi', 'fitting',
+        'lampu', 'e27', 'e14', 'saddle',
+    }
+
+    @classmethod
+    def _rules(cls) -> dict:
+        """Keyword automaton and combined regexes, compiled once per class."""
+        rules = cls.__dict__.get('_compiled_rules')
+        if rules is None:
+            keywords = set()
+            for attr in dir(cls):
+                value = getattr(cls, attr)
+                if attr.isupper() and isinstance(value, (set, frozenset)):
+                    keywords |= value
+            rules = {'automaton': KeywordAutomaton(keywords)}
+            for attr in dir(cls):
+                if attr.isupper() and attr.endswith('_PATTERNS'):
+                    patterns = getattr(cls, attr)
+                    rules[attr] = re.compile('|'.join(f'(?:{p})' for p in patterns)) if patterns else None
+            cls._compiled_rules = rules
+        return rules
+
+    def _keyword_hits(self, normalized: str) -> frozenset:
+        return self._rules()['automaton'].find_all(normalized)
+
+    def _matches_patterns(self, name: str, normalized: str) -> bool:
+        pattern = self._rules()[name]
+        return pattern is not None and pattern.search(normalized) is not None
+
+    def _check_alat_berat(self, normalized: str, hits: frozenset = None) -> bool:
         """Check if product matches Alat Berat (Heavy Equipment) category."""
-        if any(re.search(pattern, normalized) for pattern in self.ALAT_BERAT_PATTERNS):
+        hits = self._keyword_hits(normalized) if hits is None else hits
+        if self._matches_patterns('ALAT_BERAT_PATTERNS', normalized):
             return True
 
-        if any(keyword in normalized for keyword in self.ALAT_BERAT_KEYWORDS):
+        if not hits.isdisjoint(self.ALAT_BERAT_KEYWORDS):
             return True
         
         return False
     
-    def _check_sanitair(self, normalized: str) -> bool:
+    def _check_sanitair(self, normalized: str, hits: frozenset = None) -> bool:
         """Check if product matches Sanitair category."""
+        hits = self._keyword_hits(normalized) if hits is None else hits
         # Sanitair has priority over Interior for bathroom fixtures
-        if any(keyword in normalized for keyword in self.SANITAIR_KEYWORDS):
+        if not hits.isdisjoint(self.SANITAIR_KEYWORDS):
             return True
-        if any(re.search(pattern, normalized) for pattern in self.SANITAIR_PATTERNS):
+        if self._matches_patterns('SANITAIR_PATTERNS', normalized):
             # Avoid misclassifying construction pipes as sanitair
-            if not any(term in normalized for term in ('pipa', 'pipe', 'conduit')):
+            if hits.isdisjoint(self.SANITAIR_PIPE_TERMS):
                 return True
         return False
     
-    def _check_peralatan_kerja(self, normalized: str) -> bool:
+    def _check_peralatan_kerja(self, normalized: str, hits: frozenset = None) -> bool:
         """Check if product matches Peralatan Kerja category."""
-        if any(exclusion in normalized for exclusion in self.PERALATAN_KERJA_EXCLUSIONS):
+        hits = self._keyword_hits(normalized) if hits is None else hits
+        if not hits.isdisjoint(self.PERALATAN_KERJA_EXCLUSIONS):
             return False
         
         # Exclude pipe-related products (e.g., "saddle clamp" is a pipe fitting, not a tool)
-        pipe_indicators = {'pipa', 'pipe', 'pvc', 'ppr', 'hdpe', 'pralon', 'saddle'}
-        if any(indicator in normalized for indicator in pipe_indicators):
+        if not hits.isdisjoint(self.PERALATAN_KERJA_PIPE_INDICATORS):
             return False
         
-        if any(re.search(pattern, normalized) for pattern in self.PERALATAN_KERJA_PATTERNS):
+        if self._matches_patterns('PERALATAN_KERJA_PATTERNS', normalized):
             return True
         
-        if any(keyword in normalized for keyword in self.PERALATAN_KERJA_KEYWORDS):
+        if not hits.isdisjoint(self.PERALATAN_KERJA_KEYWORDS):
             return True
         
         return False
     
-    def _check_tanah_pasir_batu_semen(self, normalized: str) -> bool:
+    def _check_tanah_pasir_batu_semen(self, normalized: str, hits: frozenset = None) -> bool:
         """Check if product matches Tanah, Pasir, Batu, dan Semen category.
         
         This category requires specific pattern matches (not just bare keywords)
         to avoid false positives.
         """
-        if any(exclusion in normalized for exclusion in self.TANAH_PASIR_BATU_SEMEN_EXCLUSIONS):
+        hits = self._keyword_hits(normalized) if hits is None else hits
+        if not hits.isdisjoint(self.TANAH_PASIR_BATU_SEMEN_EXCLUSIONS):
             return False
         
-        if any(re.search(pattern, normalized) for pattern in self.TANAH_PASIR_BATU_SEMEN_PATTERNS):
+        if self._matches_patterns('TANAH_PASIR_BATU_SEMEN_PATTERNS', normalized):
             return True
         
         # Also accept standalone specific terms that are unambiguous
-        standalone_terms = {'semen', 'kerikil', 'sirtu', 'agregat'}
-        if any(term in normalized for term in standalone_terms):
+        if not hits.isdisjoint(self.TANAH_PASIR_BATU_SEMEN_STANDALONE):
             return True
         
         return False
     
-    def _check_steel(self, normalized: str) -> bool:
+    def _check_steel(self, normalized: str, hits: frozenset = None) -> bool:
         """Check if product matches Steel category."""
-        if any(exclusion in normalized for exclusion in self.STEEL_EXCLUSIONS):
+        hits = self._keyword_hits(normalized) if hits is None else hits
+        if not hits.isdisjoint(self.STEEL_EXCLUSIONS):
             return False
         
         # If this product has Peralatan Kerja keywords, don't match as steel
         # This prevents "Palu Besi" from being categorized as steel
-        tool_indicators = {'palu', 'obeng', 'tang', 'gergaji', 'sekop', 'linggis', 'siku tukang', 'kikir', 'bor', 'gerinda', 'kunci'}
-        if any(tool in normalized for tool in tool_indicators):
+        if not hits.isdisjoint(self.STEEL_TOOL_INDICATORS):
             return False
         
-        if any(keyword in normalized for keyword in self.STEEL_KEYWORDS):
+        if not hits.isdisjoint(self.STEEL_KEYWORDS):
             return True
         
-        steel_terms = ('besi', 'baja', 'wire', 'metal', 'logam')
-        if any(re.search(pattern, normalized) for pattern in self.STEEL_PATTERNS):
-            if any(term in normalized for term in steel_terms):
+        if self._matches_patterns('STEEL_PATTERNS', normalized):
+            if not hits.isdisjoint(self.STEEL_TERMS):
                 return True
         
         return False
     
-    def _check_interior(self, normalized: str) -> bool:
+    def _check_interior(self, normalized: str, hits: frozenset = None) -> bool:
         """Check if product matches Interior category."""
+        hits = self._keyword_hits(normalized) if hits is None else hits
         # Special handling for "lem"/"glue": only Interior if NOT pipe-related
         # Check this BEFORE general keyword matching to avoid false positives
-        if 'lem' in normalized or 'glue' in normalized:
+        if not hits.isdisjoint(self.INTERIOR_GLUE_TERMS):
             # If it has pipe context (pvc, pipa, pralon), NOT Interior
-            if any(pipe_term in normalized for pipe_term in ('pvc', 'pipa', 'pralon')):
+            if not hits.isdisjoint(self.PIPE_CONTEXT_TERMS):
                 return False
             # Otherwise, it's an interior glue
             return True
         
-        interior_keywords_excluding_glue = self.INTERIOR_KEYWORDS - {'lem', 'glue'}
-        if any(keyword in normalized for keyword in interior_keywords_excluding_glue):
+        if not hits.isdisjoint(self.INTERIOR_KEYWORDS - self.INTERIOR_GLUE_TERMS):
             return True
         
-        if any(re.search(pattern, normalized) for pattern in self.INTERIOR_PATTERNS):
+        if self._matches_patterns('INTERIOR_PATTERNS', normalized):
             return True
         
         return False
     
-    def _check_pipa_air(self, normalized: str) -> bool:
+    def _check_pipa_air(self, normalized: str, hits: frozenset = None) -> bool:
         """Check if product matches Pipa Air category."""
+        hits = self._keyword_hits(normalized) if hits is None else hits
         # Special handling for "fitting": electrical fitting vs pipe fitting
         # Check this BEFORE general keyword matching
-        if 'fitting' in normalized:
+        if 'fitting' in hits:
             # If it has electrical context (lampu, listrik), NOT Pipa Air
-            if 'lampu' in normalized or 'listrik' in normalized:
+            if 'lampu' in hits or 'listrik' in hits:
                 return False
             # Otherwise, it's a pipe fitting
             return True
         
-        if any(re.search(pattern, normalized) for pattern in self.PIPA_AIR_PATTERNS):
+        if self._matches_patterns('PIPA_AIR_PATTERNS', normalized):
             return True
         
         # Check keywords (excluding fitting which we already handled)
-        pipa_keywords_excluding_fitting = self.PIPA_AIR_KEYWORDS - {'fitting'}
-        if any(keyword in normalized for keyword in pipa_keywords_excluding_fitting):
+        if not hits.isdisjoint(self.PIPA_AIR_KEYWORDS - {'fitting'}):
             return True
         
         # "saddle" in pipe context (or standalone)
-        if 'saddle' in normalized:
+        if 'saddle' in hits:
             return True
         
         # "lem" with pipe context (lem pvc, lem pipa)
-        if 'lem' in normalized and ('pvc' in normalized or 'pipa' in normalized or 'pralon' in normalized):
+        if 'lem' in hits and not hits.isdisjoint(self.PIPE_CONTEXT_TERMS):
             return True
         
         return False
     
 
-    def _check_listrik(self, normalized: str) -> bool:
+    def _check_listrik(self, normalized: str, hits: frozenset = None) -> bool:
         """Check if product matches Material Listrik category."""
+        hits = self._keyword_hits(normalized) if hits is None else hits
         
-        if any(re.search(pattern, normalized) for pattern in self.LISTRIK_PATTERNS):
+        if self._matches_patterns('LISTRIK_PATTERNS', normalized):
             return True
         
-        
-        electrical_indicators = {
-            'kabel', 'cable', 'saklar', 'switch', 'mcb', 'listrik', 
-            'electric', 'elektrik', 'lampu', 'lamp', 'volt', 'watt', 
-            'ampere', 'stop kontak', 'outlet', 'colokan'
-        }
-        
         # "pipa conduit" or "conduit elektrik" -> Listrik
-        if 'conduit' in normalized and ('elektrik' in normalized or 'listrik' in normalized or 'kabel' in normalized):
+        if 'conduit' in hits and ('elektrik' in hits or 'listrik' in hits or 'kabel' in hits):
             return True
         
         # "fitting lampu" -> Listrik
-        if 'fitting' in normalized and ('lampu' in normalized or 'listrik' in normalized or 'e27' in normalized or 'e14' in normalized):
+        if 'fitting' in hits and ('lampu' in hits or 'listrik' in hits or 'e27' in hits or 'e14' in hits):
             return True
         
         # "isolasi listrik" -> Listrik
-        if 'isolasi' in normalized and 'listrik' in normalized:
+        if 'isolasi' in hits and 'listrik' in hits:
             return True
         
         # Check keywords with indicators
-        if any(keyword in normalized for keyword in self.LISTRIK_KEYWORDS):
-            if any(indicator in normalized for indicator in electrical_indicators):
+        if not hits.isdisjoint(self.LISTRIK_KEYWORDS):
+            if not hits.isdisjoint(self.LISTRIK_INDICATORS):
                 return True
         
         return False
@@ -446,40 +491,60 @@ class ProductCategorizer:
         Special override: Electrical conduit/isolasi with explicit electrical context
         overrides Pipa Air/Interior even though they have "pipa"/"isolasi" keywords.
 
-        Returns the first matching category or None.
+        Returns the first matching category or None. Results are memoized per
+        normalized name (see ``api.utils.name_memo``).
         """
         if not product_name:
             return None
 
-        normalized = product_name.lower().strip()
+        normalized = normalize_name(product_name)
+        return self._get_memo().resolve(normalized, lambda: self._categorize_normalized(normalized))
+
+    @classmethod
+    def rules_version(cls) -> str:
+        """Fingerprint of the keyword/pattern tables, used to invalidate memoized results."""
+        version = cls.__dict__.get('_rules_version')
+        if version is None:
+            tables = [getattr(cls, attr) for attr in sorted(dir(cls)) if attr.isupper()]
+            version = rules_fingerprint(*tables)
+            cls._rules_version = version
+        return version
+
+    def _get_memo(self) -> NameMemo:
+        return get_name_memo(f"categorizer.{type(self).__name__}", self.rules_version())
+
+    def _categorize_normalized(self, normalized: str) -> str | None:
+        # Every keyword, exclusion and context term is found in one automaton
+        # pass; the rules below only test membership in this set
+        hits = self._keyword_hits(normalized)
 
         # Override check: Electrical conduit/isolasi with explicit electrical context
         # should be categorized as Listrik, not Pipa Air or Interior
         electrical_override = (
-            ('conduit' in normalized and ('elektrik' in normalized or 'listrik' in normalized)) or
-            ('isolasi' in normalized and 'listrik' in normalized)
+            ('conduit' in hits and ('elektrik' in hits or 'listrik' in hits)) or
+            ('isolasi' in hits and 'listrik' in hits)
         )
 
         # Return first match (strict priority)
         # But check electrical override first
-        if electrical_override and self._check_listrik(normalized):
+        if electrical_override and self._check_listrik(normalized, hits):
             return self.CATEGORY_LISTRIK
         
-        if self._check_sanitair(normalized):
+        if self._check_sanitair(normalized, hits):
             return self.CATEGORY_SANITAIR
-        if self._check_alat_berat(normalized):
+        if self._check_alat_berat(normalized, hits):
             return self.CATEGORY_ALAT_BERAT
-        if self._check_peralatan_kerja(normalized):
+        if self._check_peralatan_kerja(normalized, hits):
             return self.CATEGORY_PERALATAN_KERJA
-        if self._check_tanah_pasir_batu_semen(normalized):
+        if self._check_tanah_pasir_batu_semen(normalized, hits):
             return self.CATEGORY_TANAH_PASIR_BATU_SEMEN
-        if self._check_steel(normalized):
+        if self._check_steel(normalized, hits):
             return self.CATEGORY_STEEL
-        if self._check_interior(normalized):
+        if self._check_interior(normalized, hits):
             return self.CATEGORY_INTERIOR
-        if self._check_pipa_air(normalized):
+        if self._check_pipa_air(normalized, hits):
             return self.CATEGORY_PIPA_AIR
-        if self._check_listrik(normalized):
+        if self._check_listrik(normalized, hits):
             return self.CATEGORY_LISTRIK
         
         return None
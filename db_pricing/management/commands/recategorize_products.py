@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from db_pricing.auto_categorization_service import AutoCategorizationService
+
+
+class Command(BaseCommand):
+    help = 'Recategorize all products of one or more vendors in streaming chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--vendor', action='append', dest='vendors',
+            choices=sorted(AutoCategorizationService.MODEL_MAP),
+            help='Vendor to recategorize (repeatable, default: all vendors)',
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=AutoCategorizationService.DEFAULT_CHUNK_SIZE,
+            help='Rows read and written per batch',
+        )
+        parser.add_argument(
+            '--incremental', action='store_true',
+            help='Only products changed since the last run (full run when the rules changed)',
+        )
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be at least 1')
+
+        service = AutoCategorizationService()
+        vendors = options['vendors'] or list(AutoCategorizationService.MODEL_MAP)
+
+        def report(progress):
+            self.stdout.write(
+                f"  {progress['vendor']}: {progress['processed']} processed, "
+                f"{progress['categorized']} categorized"
+            )
+
+        for vendor in vendors:
+            self.stdout.write(f"Recategorizing {vendor}...")
+            categorize = service.categorize_incremental if options['incremental'] else service.categorize_all_products
+            result = categorize(vendor, chunk_size=options['chunk_size'], progress_callback=report)
+            self.stdout.write(self.style.SUCCESS(
+                f"{vendor}: {result['categorized']}/{result['total']} categorized, "
+                f"{result['uncategorized']} uncategorized"
+            ))
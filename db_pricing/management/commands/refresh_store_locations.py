@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from db_pricing.store_locations import StoreLocationRegistry
+
+
+class Command(BaseCommand):
+    help = 'Scrape vendor store locations into the store location registry'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--vendor', action='append', dest='vendors',
+            choices=sorted(StoreLocationRegistry.LOCATION_SCRAPERS),
+            help='Vendor to refresh (repeatable, default: all vendors)',
+        )
+        parser.add_argument(
+            '--stale-only', action='store_true',
+            help='Skip vendors refreshed within STORE_LOCATION_TTL',
+        )
+
+    def handle(self, *args, **options):
+        vendors = options['vendors'] or list(StoreLocationRegistry.LOCATION_SCRAPERS)
+
+        for vendor in vendors:
+            last_refreshed = StoreLocationRegistry.last_refreshed(vendor)
+            if options['stale_only'] and last_refreshed and not StoreLocationRegistry.is_stale(last_refreshed):
+                self.stdout.write(f"{vendor}: fresh since {last_refreshed:%Y-%m-%d %H:%M}, skipped")
+                continue
+
+            self.stdout.write(f"Refreshing {vendor} store locations...")
+            stored = StoreLocationRegistry.refresh(vendor)
+            if stored:
+                self.stdout.write(self.style.SUCCESS(f"{vendor}: {stored} locations stored"))
+            else:
+                self.stdout.write(self.style.WARNING(f"{vendor}: refresh failed, previous locations kept"))
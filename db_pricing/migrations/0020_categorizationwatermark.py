@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_pricing', '0019_merge_20251112_2248'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategorizationWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vendor', models.CharField(max_length=50, unique=True)),
+                ('last_run_at', models.DateTimeField(blank=True, null=True)),
+                ('rules_version', models.CharField(blank=True, default='', max_length=40)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'categorization_watermarks',
+            },
+        ),
+    ]
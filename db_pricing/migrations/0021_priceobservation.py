@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 22:26
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_pricing', '0020_categorizationwatermark'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PriceObservation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vendor', models.CharField(choices=[('gemilang', 'Gemilang'), ('mitra10', 'Mitra10'), ('tokopedia', 'Tokopedia'), ('depobangunan', 'Depo Bangunan'), ('juragan_material', 'Juragan Material')], max_length=50)),
+                ('product_key', models.CharField(max_length=40)),
+                ('price', models.IntegerField(validators=[django.core.validators.MinValueValidator(0)])),
+                ('observed_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'db_table': 'price_observations',
+                'indexes': [models.Index(fields=['vendor', 'product_key', 'observed_at'], name='price_obs_product_time_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-18 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_pricing', '0021_priceobservation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoreLocation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vendor', models.CharField(choices=[('gemilang', 'Gemilang'), ('mitra10', 'Mitra10'), ('tokopedia', 'Tokopedia'), ('depobangunan', 'Depo Bangunan'), ('juragan_material', 'Juragan Material')], max_length=50)),
+                ('name', models.CharField(max_length=255)),
+                ('code', models.CharField(blank=True, default='', max_length=500)),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'store_locations',
+                'ordering': ['vendor', 'position'],
+                'constraints': [models.UniqueConstraint(fields=('vendor', 'name'), name='store_location_vendor_name_uniq')],
+            },
+        ),
+    ]
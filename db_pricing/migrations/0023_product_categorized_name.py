@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db_pricing', '0022_storelocation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='depobangunanproduct',
+            name='categorized_name',
+            field=models.CharField(blank=True, db_default='', default='', max_length=500),
+        ),
+        migrations.AddField(
+            model_name='gemilangproduct',
+            name='categorized_name',
+            field=models.CharField(blank=True, db_default='', default='', max_length=500),
+        ),
+        migrations.AddField(
+            model_name='juraganmaterialproduct',
+            name='categorized_name',
+            field=models.CharField(blank=True, db_default='', default='', max_length=500),
+        ),
+        migrations.AddField(
+            model_name='mitra10product',
+            name='categorized_name',
+            field=models.CharField(blank=True, db_default='', default='', max_length=500),
+        ),
+        migrations.AddField(
+            model_name='tokopediaproduct',
+            name='categorized_name',
+            field=models.CharField(blank=True, db_default='', default='', max_length=500),
+        ),
+    ]
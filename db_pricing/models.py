@@ -56,6 +56,8 @@ class GemilangProduct(models.Model):
     url = models.URLField(max_length=1000)
     unit = models.CharField(max_length=50, blank=True, default='')
     category = models.CharField(max_length=100, blank=True, default='', db_default='')
+    # Name the category was last computed from; differs from name once renamed
+    categorized_name = models.CharField(max_length=500, blank=True, default='', db_default='')
     location = models.TextField(max_length=200,default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -78,6 +80,8 @@ class Mitra10Product(models.Model):
     url = models.URLField(max_length=1000)
     unit = models.CharField(max_length=50, blank=True, default='')
     category = models.CharField(max_length=100, blank=True, default='', db_default='')
+    # Name the category was last computed from; differs from name once renamed
+    categorized_name = models.CharField(max_length=500, blank=True, default='', db_default='')
     location = models.TextField(max_length=200,default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -100,6 +104,8 @@ class DepoBangunanProduct(models.Model):
     url = models.URLField(max_length=1000)
     unit = models.CharField(max_length=50, blank=True, default='')
     category = models.CharField(max_length=100, blank=True, default='', db_default='')
+    # Name the category was last computed from; differs from name once renamed
+    categorized_name = models.CharField(max_length=500, blank=True, default='', db_default='')
     location = models.TextField(max_length=200, blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -123,6 +129,8 @@ class JuraganMaterialProduct(models.Model):
     unit = models.CharField(max_length=50, blank=True, default='')
     location = models.CharField(max_length=200,default='')
     category = models.CharField(max_length=100, blank=True, default='', db_default='')
+    # Name the category was last computed from; differs from name once renamed
+    categorized_name = models.CharField(max_length=500, blank=True, default='', db_default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -145,6 +153,8 @@ class TokopediaProduct(models.Model):
     unit = models.CharField(max_length=50, blank=True, default='')
     location = models.CharField(max_length=200, blank=True, default='')
     category = models.CharField(max_length=100, blank=True, default='', db_default='')
+    # Name the category was last computed from; differs from name once renamed
+    categorized_name = models.CharField(max_length=500, blank=True, default='', db_default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -217,4 +227,55 @@ class PriceAnomaly(models.Model):
     @property
     def price_difference(self):
         """Get absolute price difference"""
-        return abs(self.new_price - self.old_price)
\ No newline at end of file
+        return abs(self.new_price - self.old_price)
+
+class CategorizationWatermark(models.Model):
+    """Per-vendor high-water mark of the incremental categorization job."""
+    vendor = models.CharField(max_length=50, unique=True)
+    last_run_at = models.DateTimeField(null=True, blank=True)
+    rules_version = models.CharField(max_length=40, blank=True, default='')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'categorization_watermarks'
+
+    def __str__(self):
+        return f"{self.vendor} @ {self.last_run_at} (rules {self.rules_version})"
+
+
+class PriceObservation(models.Model):
+    """Append-only record of a price seen for a vendor product at scrape time."""
+    vendor = models.CharField(max_length=50, choices=PriceAnomaly.VENDOR_CHOICES)
+    # sha1 of name/url/unit, see db_pricing.price_history.product_key
+    product_key = models.CharField(max_length=40)
+    price = models.IntegerField(validators=[MinValueValidator(0)])
+    observed_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = 'price_observations'
+        indexes = [
+            models.Index(fields=['vendor', 'product_key', 'observed_at'], name='price_obs_product_time_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.vendor} {self.product_key[:8]}: {self.price} @ {self.observed_at}"
+
+
+class StoreLocation(models.Model):
+    """Physical store of a vendor, kept by db_pricing.store_locations.StoreLocationRegistry."""
+    vendor = models.CharField(max_length=50, choices=PriceAnomaly.VENDOR_CHOICES)
+    name = models.CharField(max_length=255)
+    code = models.CharField(max_length=500, blank=True, default='')
+    # Scrape order within the vendor, so listings keep the upstream order
+    position = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'store_locations'
+        ordering = ['vendor', 'position']
+        constraints = [
+            models.UniqueConstraint(fields=['vendor', 'name'], name='store_location_vendor_name_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.vendor}: {self.name}"
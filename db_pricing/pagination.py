@@ -0,0 +1,79 @@
+"""
+Keyset (cursor) pagination for newest-first listings.
+
+Pages are addressed by the ``(detected_at, id)`` of the last row already
+returned instead of an offset, so fetching any page costs one indexed range
+scan of ``page_size + 1`` rows regardless of how deep it is.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db.models import Q, QuerySet
+
+
+def encode_cursor(detected_at: datetime, pk: int) -> str:
+    """Build an opaque cursor token pointing just after the given row"""
+    raw = json.dumps([detected_at.isoformat(), pk], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor token produced by ``encode_cursor``
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        detected_at, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(detected_at), int(pk)
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f'invalid cursor: {token}') from e
+
+
+def keyset_page(queryset: QuerySet, page_size: int, cursor: Optional[str] = None,
+                field: str = 'detected_at') -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch one newest-first page of ``queryset`` ordered by ``(field, id)``
+
+    Args:
+        queryset: Filtered queryset to page through
+        page_size: Number of rows per page
+        cursor: Token from the previous page's ``next_cursor``, or None for the first page
+        field: Timestamp field to order by
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+    """
+    queryset = queryset.order_by(f'-{field}', '-id')
+
+    if cursor:
+        value, pk = decode_cursor(cursor)
+        queryset = queryset.filter(Q(**{f'{field}__lt': value}) | Q(**{field: value, 'id__lt': pk}))
+
+    rows = list(queryset[:page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, field), last.pk)
+
+
+def pagination_info(page_size: int, next_cursor: Optional[str], cursor: Optional[str],
+                    total_count: Optional[int] = None) -> Dict[str, Any]:
+    """Pagination block for a keyset page response"""
+    info = {
+        'mode': 'cursor',
+        'page_size': page_size,
+        'next_cursor': next_cursor,
+        'has_next': next_cursor is not None,
+        'has_previous': bool(cursor),
+    }
+    if total_count is not None:
+        info['total_count'] = total_count
+    return info
@@ -0,0 +1,149 @@
+# db_pricing/price_history.py
+"""
+Append-only price history.
+
+Every price a vendor save path sees is appended to ``price_observations``
+so trends can be read without touching the live product tables, which only
+keep the latest price.
+"""
+
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Avg, Count, Max, Min
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from db_pricing.models import PriceObservation
+
+logger = logging.getLogger(__name__)
+
+
+def product_key(name: str, url: str, unit: str, location: str = '') -> str:
+    """Stable key for a vendor product, matching the lookup columns used by the save paths"""
+    parts = [name or '', url or '', unit or '']
+    if location:
+        parts.append(location)
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+def item_value(item: Any, name: str, default: Any = '') -> Any:
+    """Read a field from a scraped item"""
+    # Save paths receive dicts, except Juragan Material which also accepts objects
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
+
+
+class PriceHistoryService:
+    """Write and query the append-only price observation store"""
+
+    # Rows per INSERT statement when recording observations
+    BULK_BATCH_SIZE = 1000
+
+    # Vendors whose product rows are also keyed by location
+    LOCATION_KEYED_VENDORS = {'tokopedia'}
+
+    @classmethod
+    def key_for(cls, vendor: str, item: Any) -> str:
+        """Product key of a scraped item (dict or object) for the given vendor"""
+        location = item_value(item, 'location') if vendor in cls.LOCATION_KEYED_VENDORS else ''
+        return product_key(item_value(item, 'name'), item_value(item, 'url'), item_value(item, 'unit'), location)
+
+    @classmethod
+    def record_observations(cls, vendor: str, items: Iterable[Any],
+                            observed_at: Optional[datetime] = None) -> int:
+        """
+        Append one observation per scraped item
+
+        Failures are logged and swallowed so history never blocks a product save.
+
+        Args:
+            vendor: Vendor name
+            items: Scraped products with name, url, unit and price
+            observed_at: Observation time (default: now)
+
+        Returns:
+            Number of observations written
+        """
+        observed_at = observed_at or timezone.now()
+        rows = []
+        for item in items:
+            try:
+                rows.append(PriceObservation(
+                    vendor=vendor,
+                    product_key=cls.key_for(vendor, item),
+                    price=int(item_value(item, 'price', 0)),
+                    observed_at=observed_at,
+                ))
+            except (TypeError, ValueError):
+                logger.debug(f"Skipping price observation with invalid price for {vendor}")
+
+        if not rows:
+            return 0
+
+        try:
+            with transaction.atomic():
+                PriceObservation.objects.bulk_create(rows, batch_size=cls.BULK_BATCH_SIZE)
+            return len(rows)
+        except Exception as e:
+            logger.error(f"Failed to record {len(rows)} price observations for {vendor}: {str(e)}")
+            return 0
+
+    @classmethod
+    def price_series(cls, vendor: str, name: str, url: str, unit: str,
+                     days: int = 30, location: str = '') -> List[Tuple[datetime, int]]:
+        """
+        Prices observed for one product over the last ``days`` days
+
+        Returns:
+            List of (observed_at, price), oldest first
+        """
+        since = timezone.now() - timedelta(days=days)
+        return list(
+            PriceObservation.objects.filter(
+                vendor=vendor,
+                product_key=cls.key_for(vendor, {'name': name, 'url': url, 'unit': unit, 'location': location}),
+                observed_at__gte=since,
+            ).order_by('observed_at').values_list('observed_at', 'price')
+        )
+
+    @classmethod
+    def daily_summary(cls, vendor: str, name: str, url: str, unit: str,
+                      days: int = 30, location: str = '') -> List[Dict[str, Any]]:
+        """
+        One row per day with min/max/avg price for one product over the last ``days`` days
+
+        Returns:
+            List of dicts with day, min_price, max_price, avg_price and samples, oldest first
+        """
+        since = timezone.now() - timedelta(days=days)
+        rows = (
+            PriceObservation.objects.filter(
+                vendor=vendor,
+                product_key=cls.key_for(vendor, {'name': name, 'url': url, 'unit': unit, 'location': location}),
+                observed_at__gte=since,
+            )
+            .annotate(day=TruncDate('observed_at'))
+            .values('day')
+            .annotate(
+                min_price=Min('price'),
+                max_price=Max('price'),
+                avg_price=Avg('price'),
+                samples=Count('id'),
+            )
+            .order_by('day')
+        )
+        return [
+            {
+                'day': row['day'],
+                'min_price': row['min_price'],
+                'max_price': row['max_price'],
+                'avg_price': round(float(row['avg_price']), 2),
+                'samples': row['samples'],
+            }
+            for row in rows
+        ]
@@ -0,0 +1,190 @@
+# db_pricing/store_locations.py
+"""
+Persistent store-location registry.
+
+Vendor store lists rarely change, but scraping them costs an upstream round
+trip (Gemilang, Depo Bangunan) or a whole browser session (Mitra10). The
+registry keeps the last successful scrape in ``store_locations`` and serves
+reads from there:
+
+- a vendor that was never scraped is fetched inline, once;
+- entries older than ``STORE_LOCATION_TTL`` seconds are still served while a
+  background thread refreshes them;
+- a failed or empty scrape never replaces the stored list.
+
+``python manage.py refresh_store_locations`` refreshes every vendor, e.g.
+from cron, so no user request waits on a cold registry.
+"""
+
+import logging
+import threading
+from datetime import timedelta
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from db_pricing.models import StoreLocation
+
+logger = logging.getLogger(__name__)
+
+# Returns the scraped locations: strings, dicts or Location-like objects
+Fetcher = Callable[[], Iterable[Any]]
+
+
+class LocationRefreshError(Exception):
+    """A vendor location scrape did not succeed"""
+
+
+def location_entry(location: Any) -> Tuple[str, str]:
+    """(name, code) of a scraped location given as a string, dict or Location-like object"""
+    if isinstance(location, str):
+        return location.strip(), ''
+    if isinstance(location, dict):
+        name = location.get('name') or location.get('store_name') or ''
+        code = location.get('code') or location.get('address') or ''
+    else:
+        name = getattr(location, 'name', None) or getattr(location, 'store_name', '') or ''
+        code = getattr(location, 'code', None) or getattr(location, 'address', '') or ''
+    return str(name).strip(), str(code).strip()
+
+
+def scrape_result_locations(result: Any) -> List[Any]:
+    """Locations of a scrape result (LocationScrapingResult or Mitra10's dict); raises on failure"""
+    if isinstance(result, dict):
+        success, locations, error = result.get('success'), result.get('locations'), result.get('error_message')
+    else:
+        success = getattr(result, 'success', False)
+        locations = getattr(result, 'locations', None)
+        error = getattr(result, 'error_message', None)
+    if not success:
+        raise LocationRefreshError(error or 'location scrape failed')
+    return list(locations or [])
+
+
+class StoreLocationRegistry:
+    """Read store locations from the registry; refresh them from the vendor scrapers"""
+
+    # Vendor -> (factory module, factory function, scrape_locations kwargs)
+    LOCATION_SCRAPERS = {
+        'gemilang': ('api.gemilang.factory', 'create_gemilang_location_scraper', {'timeout': 30}),
+        'depobangunan': ('api.depobangunan.factory', 'create_depo_location_scraper', {'timeout': 30}),
+        'mitra10': ('api.mitra10.factory', 'create_mitra10_location_scraper', {}),
+    }
+
+    DEFAULT_TTL = 24 * 60 * 60
+    # A failed background refresh is retried after this many seconds
+    RETRY_AFTER = 10 * 60
+    LOCK_KEY = 'store_locations:{vendor}:refreshing'
+
+    @classmethod
+    def lock_cache(cls):
+        """Cache holding the refresh locks, shared by every worker when configured"""
+        return caches[getattr(settings, 'STORE_LOCATION_LOCK_CACHE_ALIAS', 'default')]
+
+    @classmethod
+    def ttl(cls) -> float:
+        return getattr(settings, 'STORE_LOCATION_TTL', cls.DEFAULT_TTL)
+
+    @classmethod
+    def default_fetcher(cls, vendor: str) -> Fetcher:
+        """Fetcher running the vendor's own location scraper"""
+        module, factory, kwargs = cls.LOCATION_SCRAPERS[vendor]
+
+        def fetch():
+            scraper = getattr(import_module(module), factory)()
+            return scrape_result_locations(scraper.scrape_locations(**kwargs))
+        return fetch
+
+    @classmethod
+    def locations(cls, vendor: str, fetch: Optional[Fetcher] = None) -> List[Dict[str, str]]:
+        """
+        Stored locations of a vendor as ``{"name", "code"}`` dicts, in scrape order
+
+        A vendor without stored locations is fetched inline with ``fetch`` (the
+        vendor's scraper by default); its errors propagate like an inline scrape.
+        Stale entries are returned as is and refreshed in the background.
+        """
+        rows = list(StoreLocation.objects.filter(vendor=vendor).values('name', 'code', 'refreshed_at'))
+        if not rows:
+            cls.refresh(vendor, fetch, raise_errors=True)
+            rows = list(StoreLocation.objects.filter(vendor=vendor).values('name', 'code', 'refreshed_at'))
+        elif cls.is_stale(max(row['refreshed_at'] for row in rows)):
+            cls.refresh_async(vendor)
+        return [{'name': row['name'], 'code': row['code']} for row in rows]
+
+    @classmethod
+    def names(cls, vendor: str, fetch: Optional[Fetcher] = None) -> List[str]:
+        return [location['name'] for location in cls.locations(vendor, fetch)]
+
+    @classmethod
+    def is_stale(cls, refreshed_at) -> bool:
+        return refreshed_at < timezone.now() - timedelta(seconds=cls.ttl())
+
+    @classmethod
+    def last_refreshed(cls, vendor: str):
+        return StoreLocation.objects.filter(vendor=vendor).aggregate(latest=Max('refreshed_at'))['latest']
+
+    @classmethod
+    def refresh(cls, vendor: str, fetch: Optional[Fetcher] = None, raise_errors: bool = False) -> int:
+        """
+        Scrape a vendor's locations and replace the stored list
+
+        Returns:
+            Number of locations stored; 0 when the scrape failed or found none,
+            in which case the previous list is kept
+        """
+        fetch = fetch or cls.default_fetcher(vendor)
+        try:
+            scraped = fetch()
+        except Exception as e:
+            if raise_errors:
+                raise
+            logger.error(f"Store location refresh failed for {vendor}: {e}")
+            return 0
+
+        # Keyed like the (vendor, name) unique constraint compares under MySQL's
+        # case-insensitive collation; the first spelling scraped is kept
+        entries: Dict[str, Tuple[str, str]] = {}
+        for location in scraped or []:
+            name, code = location_entry(location)
+            if name and name.casefold() not in entries:
+                entries[name.casefold()] = (name, code)
+        if not entries:
+            logger.warning(f"Store location refresh for {vendor} found no locations; keeping the stored list")
+            return 0
+
+        now = timezone.now()
+        with transaction.atomic():
+            StoreLocation.objects.filter(vendor=vendor).delete()
+            StoreLocation.objects.bulk_create([
+                StoreLocation(vendor=vendor, name=name, code=code, position=position, refreshed_at=now)
+                for position, (name, code) in enumerate(entries.values())
+            ])
+        logger.info(f"Stored {len(entries)} {vendor} store locations")
+        return len(entries)
+
+    @classmethod
+    def refresh_async(cls, vendor: str) -> bool:
+        """Refresh a vendor in a daemon thread; False when a refresh already runs or failed recently"""
+        lock_key = cls.LOCK_KEY.format(vendor=vendor)
+        if not cls.lock_cache().add(lock_key, True, timeout=cls.RETRY_AFTER):
+            return False
+        threading.Thread(
+            target=cls._refresh_in_background, args=(vendor, lock_key),
+            name=f'store-locations-{vendor}', daemon=True,
+        ).start()
+        return True
+
+    @classmethod
+    def _refresh_in_background(cls, vendor: str, lock_key: str) -> None:
+        try:
+            if cls.refresh(vendor):
+                cls.lock_cache().delete(lock_key)
+            # On failure the lock is left to expire, spacing out retries
+        finally:
+            connections.close_all()
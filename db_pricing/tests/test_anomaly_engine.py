@@ -0,0 +1,117 @@
+import random
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from api.mitra10.database_service import Mitra10DatabaseService
+from db_pricing import anomaly_engine
+from db_pricing.anomaly_engine import PriceAnomalyEngine, get_category_thresholds, robust_verdicts
+from db_pricing.models import PriceAnomaly
+from db_pricing.price_history import PriceHistoryService
+
+
+class RobustVerdictsTest(SimpleTestCase):
+
+    def test_volatile_history_tolerates_large_moves(self):
+        volatile = [100, 140, 90, 130, 80, 120, 150]
+        self.assertEqual(robust_verdicts([volatile], [135], [15.0], [3.5]), [False])
+
+    def test_stable_history_flags_jump(self):
+        stable = [100, 100, 101, 99, 100]
+        self.assertEqual(robust_verdicts([stable], [130], [15.0], [3.5]), [True])
+
+    def test_small_move_on_flat_history_needs_pct(self):
+        flat = [100] * 6
+        self.assertEqual(robust_verdicts([flat, flat], [110, 120], [15.0, 15.0], [3.5, 3.5]), [False, True])
+
+    def test_pure_python_fallback_matches_numpy(self):
+        rng = random.Random(5)
+        histories = [[rng.randint(50, 150) for _ in range(rng.randint(1, 20))] for _ in range(300)]
+        new_prices = [rng.randint(0, 300) for _ in histories]
+        pct = [15.0] * len(histories)
+        z = [3.5] * len(histories)
+
+        expected = robust_verdicts(histories, new_prices, pct, z)
+        with patch.object(anomaly_engine, 'np', None):
+            self.assertEqual(robust_verdicts(histories, new_prices, pct, z), expected)
+
+    def test_scores_ten_thousand_products_quickly(self):
+        rng = random.Random(1)
+        histories = [[rng.randint(9000, 11000) for _ in range(30)] for _ in range(10000)]
+        new_prices = [rng.randint(8000, 13000) for _ in histories]
+
+        start = time.perf_counter()
+        robust_verdicts(histories, new_prices, [15.0] * 10000, [3.5] * 10000)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+
+class CategoryThresholdsTest(SimpleTestCase):
+
+    def test_defaults(self):
+        self.assertEqual(get_category_thresholds(None, {}), {'pct': 15.0, 'z': 3.5})
+
+    def test_category_overrides_default(self):
+        overrides = {'default': {'pct': 20}, 'Alat Berat': {'z': 5}}
+        self.assertEqual(get_category_thresholds('Alat Berat', overrides), {'pct': 20, 'z': 5})
+        self.assertEqual(get_category_thresholds('Other', overrides), {'pct': 20, 'z': 3.5})
+
+    @override_settings(PRICE_ANOMALY_THRESHOLDS={'Listrik': {'pct': 30}})
+    def test_reads_settings(self):
+        self.assertEqual(get_category_thresholds('Listrik')['pct'], 30)
+
+
+class PriceAnomalyEngineTest(TestCase):
+
+    ITEM = {"name": "Kabel NYM", "url": "https://test.com/kabel", "unit": "ROLL"}
+
+    def _seed(self, prices, vendor='mitra10'):
+        now = timezone.now()
+        for days_ago, price in enumerate(reversed(prices)):
+            PriceHistoryService.record_observations(vendor, [dict(self.ITEM, price=price)], now - timedelta(days=days_ago + 1))
+
+    def test_without_history_uses_percentage_rule(self):
+        engine = PriceAnomalyEngine('mitra10')
+        self.assertEqual(engine.prepare([dict(self.ITEM, price=120)]), 0)
+        self.assertTrue(engine.is_anomaly(self.ITEM, 100, 120))
+        self.assertFalse(engine.is_anomaly(self.ITEM, 100, 110))
+
+    def test_category_threshold_applies_to_percentage_rule(self):
+        engine = PriceAnomalyEngine('mitra10', thresholds={'Listrik': {'pct': 30}})
+        self.assertFalse(engine.is_anomaly(dict(self.ITEM, category='Listrik'), 100, 120))
+
+    def test_volatile_history_suppresses_false_positive(self):
+        self._seed([100000, 140000, 90000, 130000, 80000, 120000])
+        engine = PriceAnomalyEngine('mitra10')
+        item = dict(self.ITEM, price=135000)
+
+        self.assertEqual(engine.prepare([item]), 1)
+        self.assertFalse(engine.is_anomaly(item, 100000, 135000))
+
+    def test_drift_away_from_usual_level_is_flagged(self):
+        self._seed([100000, 100000, 101000, 100000, 99000, 112000])
+        engine = PriceAnomalyEngine('mitra10')
+        item = dict(self.ITEM, price=125000)
+
+        engine.prepare([item])
+        # Only ~12% above the stored price, but 25% above the usual level
+        self.assertTrue(engine.is_anomaly(item, 112000, 125000))
+
+    def test_history_failure_falls_back(self):
+        engine = PriceAnomalyEngine('mitra10')
+        with patch.object(engine, '_load_histories', side_effect=Exception("db down")):
+            self.assertEqual(engine.prepare([dict(self.ITEM, price=1)]), 0)
+        self.assertTrue(engine.is_anomaly(self.ITEM, 100, 200))
+
+    def test_vendor_save_uses_history(self):
+        service = Mitra10DatabaseService()
+        service.save_with_price_update([dict(self.ITEM, price=100000)])
+        self._seed([100000, 140000, 90000, 130000, 80000, 120000])
+
+        result = service.save_with_price_update([dict(self.ITEM, price=135000)])
+
+        self.assertEqual(result['anomalies'], [])
+        self.assertEqual(result['updated'], 1)
+        self.assertFalse(PriceAnomaly.objects.exists())
@@ -0,0 +1,91 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from db_pricing.models import PriceAnomaly
+from db_pricing.pagination import decode_cursor, encode_cursor
+
+
+class CursorTokenTest(SimpleTestCase):
+
+    def test_round_trip(self):
+        detected_at = timezone.now()
+        self.assertEqual(decode_cursor(encode_cursor(detected_at, 42)), (detected_at, 42))
+
+    def test_malformed_token(self):
+        for token in ('not-a-cursor', 'W10', encode_cursor(timezone.now(), 1)[:-3]):
+            with self.assertRaises(ValueError):
+                decode_cursor(token)
+
+
+class KeysetAnomalyListTest(TestCase):
+
+    URL = '/api/pricing/anomalies/'
+
+    def setUp(self):
+        now = timezone.now()
+        for i in range(7):
+            anomaly = PriceAnomaly.objects.create(
+                vendor='gemilang' if i % 2 else 'mitra10',
+                product_name=f'Semen {i}' if i < 4 else f'Besi {i}',
+                product_url=f'https://example.com/{i}',
+                unit='pcs',
+                old_price=10000,
+                new_price=12000,
+                change_percent=Decimal('20.00'),
+            )
+            # Two rows share a timestamp to exercise the id tie-breaker
+            PriceAnomaly.objects.filter(pk=anomaly.pk).update(detected_at=now - timedelta(minutes=min(i, 5)))
+
+    def _walk(self, query=''):
+        ids, cursor, pages = [], '', 0
+        while True:
+            data = self.client.get(f'{self.URL}?page_size=3&cursor={cursor}{query}').json()
+            ids += [row['id'] for row in data['data']]
+            pages += 1
+            if not data['pagination']['has_next']:
+                return ids, pages
+            cursor = data['pagination']['next_cursor']
+
+    def test_pages_cover_all_rows_once_in_order(self):
+        ids, pages = self._walk()
+
+        expected = list(PriceAnomaly.objects.order_by('-detected_at', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 3)
+
+    def test_filters_and_prefix_search(self):
+        ids, _ = self._walk('&vendor=mitra10&search=semen')
+
+        self.assertEqual(
+            set(ids),
+            set(PriceAnomaly.objects.filter(vendor='mitra10', product_name__startswith='Semen').values_list('id', flat=True)),
+        )
+
+    def test_total_is_optional(self):
+        data = self.client.get(f'{self.URL}?cursor=').json()
+        self.assertNotIn('total_count', data['pagination'])
+        self.assertEqual(data['pagination']['mode'], 'cursor')
+
+        data = self.client.get(f'{self.URL}?cursor=&include_total=true').json()
+        self.assertEqual(data['pagination']['total_count'], 7)
+
+    def test_page_costs_one_query_without_total(self):
+        with self.assertNumQueries(1):
+            self.client.get(f'{self.URL}?cursor=&page_size=3')
+
+    def test_invalid_cursor(self):
+        response = self.client.get(f'{self.URL}?cursor=garbage')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+
+    def test_page_size_is_clamped_to_at_least_one(self):
+        for page_size in ('0', '-5'):
+            response = self.client.get(f'{self.URL}?cursor=&page_size={page_size}')
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.json()['data']), 1)
+            self.assertEqual(response.json()['pagination']['page_size'], 1)
@@ -422,7 +422,8 @@ class TestPriceAnomalyService(TestCase):
             }
         ]
         
-        # Mock PriceAnomaly.objects.create to raise exception on second call
+        # Reject the bulk insert so the batch is retried row by row, then
+        # mock PriceAnomaly.objects.create to raise exception on second call
         create_count = [0]
         original_create = PriceAnomaly.objects.create
         
@@ -432,7 +433,8 @@ class TestPriceAnomalyService(TestCase):
                 raise DatabaseError("Database error")
             return original_create(*args, **kwargs)
         
-        with patch.object(PriceAnomaly.objects, 'create', side_effect=mock_create):
+        with patch.object(PriceAnomaly.objects, 'bulk_create', side_effect=DatabaseError("Batch rejected")), \
+             patch.object(PriceAnomaly.objects, 'create', side_effect=mock_create):
             result = PriceAnomalyService.save_anomalies('mitra10', anomalies)
         
         # Should still succeed but with errors
@@ -627,3 +629,70 @@ class TestPriceAnomalyService(TestCase):
         # Should have at least one failure (unknown vendor)
         self.assertGreater(result['failed_count'], 0)
         self.assertEqual(result['applied_count'] + result['failed_count'], 2)
+    
+    def _make_anomalies(self, count):
+        return [
+            {
+                "name": f"Product {i}",
+                "url": f"https://test.com/{i}",
+                "unit": "PCS",
+                "old_price": 10000,
+                "new_price": 12000,
+                "change_percent": 20.0
+            }
+            for i in range(count)
+        ]
+    
+    def test_save_anomalies_uses_one_insert_per_batch(self):
+        """Test anomalies are written with bulk inserts rather than one query per row"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        with CaptureQueriesContext(connection) as ctx:
+            result = PriceAnomalyService.save_anomalies('mitra10', self._make_anomalies(25), batch_size=10)
+        
+        inserts = [q for q in ctx.captured_queries if q['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 3)
+        self.assertEqual(result['saved_count'], 25)
+        self.assertEqual(PriceAnomaly.objects.filter(status='pending').count(), 25)
+    
+    def test_save_anomalies_default_batch_size(self):
+        """Test the class default batch size is passed to bulk_create"""
+        from unittest.mock import patch
+        
+        with patch.object(PriceAnomalyService, 'BULK_BATCH_SIZE', 2), \
+             patch.object(PriceAnomaly.objects, 'bulk_create') as mock_bulk:
+            result = PriceAnomalyService.save_anomalies('gemilang', self._make_anomalies(5))
+        
+        self.assertEqual([len(call.args[0]) for call in mock_bulk.call_args_list], [2, 2, 1])
+        self.assertEqual(result['saved_count'], 5)
+    
+    def test_save_anomalies_failed_batch_does_not_affect_other_batches(self):
+        """Test only the rejected batch falls back to per-row inserts"""
+        from unittest.mock import patch
+        
+        original_bulk_create = PriceAnomaly.objects.bulk_create
+        
+        def mock_bulk_create(objs, *args, **kwargs):
+            if objs[0].product_name == 'Product 0':
+                raise DatabaseError("Batch rejected")
+            return original_bulk_create(objs, *args, **kwargs)
+        
+        with patch.object(PriceAnomaly.objects, 'bulk_create', side_effect=mock_bulk_create):
+            result = PriceAnomalyService.save_anomalies('mitra10', self._make_anomalies(4), batch_size=2)
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['saved_count'], 4)
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(PriceAnomaly.objects.count(), 4)
+    
+    def test_statistics_refreshed_after_save(self):
+        """Test saving anomalies invalidates the cached statistics"""
+        self.assertEqual(PriceAnomalyService.get_statistics()['total_count'], 0)
+        
+        PriceAnomalyService.save_anomalies('gemilang', self._make_anomalies(3))
+        statistics = PriceAnomalyService.get_statistics()
+        
+        self.assertEqual(statistics['total_count'], 3)
+        self.assertEqual(statistics['by_vendor']['gemilang'], 3)
+        self.assertEqual(statistics['by_status']['pending'], 3)
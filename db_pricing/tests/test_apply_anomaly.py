@@ -304,6 +304,110 @@ class TestBatchApplyAnomalies(TestCase):
         self.assertEqual(data['data']['failed_count'], 0)
 
 
+    def test_batch_apply_reports_each_failure_reason(self):
+        """Test per-id results match the single-apply messages"""
+        pending = PriceAnomaly.objects.create(
+            vendor='depobangunan', product_name="Product 1", product_url="https://depo.com/product1",
+            unit="PCS", old_price=10000, new_price=9000, change_percent=-10.0, status='pending'
+        )
+        unmatched = PriceAnomaly.objects.create(
+            vendor='depobangunan', product_name="Missing", product_url="https://depo.com/missing",
+            unit="PCS", old_price=10000, new_price=9000, change_percent=-10.0, status='approved'
+        )
+        
+        result = PriceAnomalyService.batch_apply_approved([
+            self.anomaly1.id, pending.id, unmatched.id, 99999, self.anomaly1.id
+        ])
+        
+        messages = [r['message'] for r in result['results']]
+        self.assertEqual(result['applied_count'], 1)
+        self.assertEqual(result['failed_count'], 4)
+        self.assertIn('Price updated successfully for 1 product(s)', messages[0])
+        self.assertIn('Current status: pending', messages[1])
+        self.assertEqual(messages[2], 'No matching product found to update')
+        self.assertEqual(messages[3], 'Anomaly not found')
+        self.assertIn('Current status: applied', messages[4])
+        
+        self.anomaly1.refresh_from_db()
+        unmatched.refresh_from_db()
+        self.assertEqual(self.anomaly1.status, 'applied')
+        self.assertEqual(unmatched.status, 'approved')
+    
+    def test_batch_apply_uses_one_update_per_vendor(self):
+        """Test product prices and statuses are written set-wise across vendors"""
+        gemilang = GemilangProduct.objects.create(
+            name="Semen", price=50000, url="https://gemilang.com/semen", unit="SAK"
+        )
+        gemilang_anomaly = PriceAnomaly.objects.create(
+            vendor='gemilang', product_name="Semen", product_url="https://gemilang.com/semen",
+            unit="SAK", old_price=50000, new_price=55000, change_percent=10.0, status='approved'
+        )
+        ids = [self.anomaly1.id, self.anomaly2.id, gemilang_anomaly.id]
+        
+        # Savepoint, load anomalies, per vendor one lookup and one UPDATE,
+        # one status update, release
+        with self.assertNumQueries(8):
+            result = PriceAnomalyService.batch_apply_approved(ids)
+        
+        self.assertEqual(result['applied_count'], 3)
+        gemilang.refresh_from_db()
+        self.product2.refresh_from_db()
+        self.assertEqual(gemilang.price, 55000)
+        self.assertEqual(self.product2.price, 24000)
+        self.assertEqual(PriceAnomaly.objects.filter(id__in=ids, status='applied').count(), 3)
+    
+    def test_batch_apply_matches_products_with_sql_equality(self):
+        """Test every product key is compared with = in SQL, so the column collation applies"""
+        from unittest.mock import patch
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        products = [
+            GemilangProduct.objects.create(name=f"Semen {i}", price=50000, url=f"https://gemilang.com/{i}", unit="SAK")
+            for i in range(3)
+        ]
+        ids = [
+            PriceAnomaly.objects.create(
+                vendor='gemilang', product_name=p.name, product_url=p.url, unit=p.unit,
+                old_price=50000, new_price=60000 + i, change_percent=20.0, status='approved'
+            ).id
+            for i, p in enumerate(products)
+        ]
+        
+        with patch.object(PriceAnomalyService, 'LOOKUP_CHUNK_SIZE', 2), \
+                CaptureQueriesContext(connection) as queries:
+            result = PriceAnomalyService.batch_apply_approved(ids)
+        
+        self.assertEqual(result['applied_count'], 3)
+        table = GemilangProduct._meta.db_table
+        lookups = [q['sql'] for q in queries if q['sql'].startswith('SELECT') and table in q['sql']]
+        self.assertEqual(len(lookups), 2)
+        self.assertIn('"name" = ', lookups[0])
+        self.assertIn('"unit" = ', lookups[0])
+        for i, product in enumerate(products):
+            product.refresh_from_db()
+            self.assertEqual(product.price, 60000 + i)
+    
+    def test_batch_apply_rolls_back_on_error(self):
+        """Test a database error leaves prices and statuses untouched"""
+        from unittest.mock import patch
+        
+        with patch.object(PriceAnomalyService, '_update_vendor_prices', side_effect=Exception("boom")):
+            result = PriceAnomalyService.batch_apply_approved([self.anomaly1.id, self.anomaly2.id])
+        
+        self.assertEqual(result['applied_count'], 0)
+        self.assertEqual(result['failed_count'], 2)
+        self.assertIn('Error applying price: boom', result['results'][0]['message'])
+        self.product1.refresh_from_db()
+        self.assertEqual(self.product1.price, 10000)
+    
+    def test_batch_apply_accepts_string_ids(self):
+        """Test ids posted as strings are still resolved"""
+        result = PriceAnomalyService.batch_apply_approved([str(self.anomaly1.id)])
+        
+        self.assertEqual(result['applied_count'], 1)
+
+
 class TestApproveAndApply(TestCase):
     """Test approve and apply in one step"""
     
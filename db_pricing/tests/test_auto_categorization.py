@@ -465,3 +465,48 @@ class AutoCategorizationServiceTest(TestCase):
         self.assertEqual(result['total'], 0)
         self.assertEqual(result['categorized'], 0)
         self.assertEqual(result['uncategorized'], 0)
+
+    def test_categorize_all_products_streams_in_chunks_with_progress(self):
+        for i in range(5):
+            GemilangProduct.objects.create(name=f"Besi Beton {i}mm", price=95000, url=f"https://test.com/{i}", unit="batang")
+        GemilangProduct.objects.create(name="Produk Tanpa Kategori", price=1000, url="https://test.com/x", unit="pcs")
+        progress = []
+
+        result = self.service.categorize_all_products('gemilang', chunk_size=2, progress_callback=progress.append)
+
+        self.assertEqual(result, {'total': 6, 'categorized': 5, 'uncategorized': 1})
+        self.assertEqual([p['processed'] for p in progress], [2, 4, 6])
+        self.assertEqual(progress[-1]['categorized'], 5)
+        self.assertEqual(
+            GemilangProduct.objects.filter(category=ProductCategorizer.CATEGORY_STEEL).count(), 5
+        )
+
+    def test_categorize_all_products_groups_updates_by_category(self):
+        GemilangProduct.objects.create(name="Besi Beton 10mm", price=95000, url="https://test.com/1", unit="batang")
+        GemilangProduct.objects.create(name="Besi Beton 12mm", price=95000, url="https://test.com/2", unit="batang")
+        GemilangProduct.objects.create(name="Semen Portland", price=65000, url="https://test.com/3", unit="sak")
+
+        # 1 SELECT, savepoint pair, 1 UPDATE per category, 1 UPDATE of categorized_name
+        with self.assertNumQueries(6):
+            self.service.categorize_all_products('gemilang')
+
+    def test_categorize_products_keeps_existing_category_when_unmatched(self):
+        product = GemilangProduct.objects.create(name="Produk Tanpa Kategori", price=1000,
+                                                 url="https://test.com/1", unit="pcs", category="Manual")
+
+        result = self.service.categorize_products('gemilang', [product.id])
+
+        product.refresh_from_db()
+        self.assertEqual(product.category, "Manual")
+        self.assertEqual(result['uncategorized'], 1)
+
+    def test_recategorize_products_command(self):
+        from io import StringIO
+        from django.core.management import call_command
+        GemilangProduct.objects.create(name="Besi Beton 10mm", price=95000, url="https://test.com/1", unit="batang")
+        out = StringIO()
+
+        call_command('recategorize_products', '--vendor', 'gemilang', '--chunk-size', '1', stdout=out)
+
+        self.assertIn("gemilang: 1/1 categorized", out.getvalue())
+        self.assertEqual(GemilangProduct.objects.get().category, ProductCategorizer.CATEGORY_STEEL)
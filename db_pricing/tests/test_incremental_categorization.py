@@ -0,0 +1,98 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from db_pricing.auto_categorization_service import AutoCategorizationService
+from db_pricing.categorization import ProductCategorizer
+from db_pricing.models import CategorizationWatermark, GemilangProduct
+
+
+class IncrementalCategorizationTest(TestCase):
+
+    def setUp(self):
+        self.service = AutoCategorizationService()
+        self.besi = GemilangProduct.objects.create(name="Besi Beton 10mm", price=95000, url="https://test.com/1", unit="batang")
+        self.semen = GemilangProduct.objects.create(name="Semen Portland", price=65000, url="https://test.com/2", unit="sak")
+
+    def _age_products(self):
+        # Pretend existing rows were last written well before the previous run
+        GemilangProduct.objects.update(updated_at=timezone.now() - timedelta(days=1))
+
+    def test_first_run_is_full_and_stores_watermark(self):
+        result = self.service.categorize_incremental('gemilang')
+
+        self.assertEqual(result['mode'], 'full')
+        self.assertEqual(result['total'], 2)
+        watermark = CategorizationWatermark.objects.get(vendor='gemilang')
+        self.assertIsNotNone(watermark.last_run_at)
+        self.assertEqual(watermark.rules_version, ProductCategorizer.rules_version())
+
+    def test_second_run_only_touches_new_and_changed_rows(self):
+        self._age_products()
+        self.service.categorize_incremental('gemilang')
+
+        new_product = GemilangProduct.objects.create(name="Keramik Lantai", price=45000, url="https://test.com/3", unit="dus")
+        self.semen.name = "Kabel NYM 3x2.5"
+        self.semen.save()
+
+        result = self.service.categorize_incremental('gemilang')
+
+        self.assertEqual(result['mode'], 'incremental')
+        self.assertEqual(result['total'], 2)
+        new_product.refresh_from_db()
+        self.semen.refresh_from_db()
+        self.assertEqual(new_product.category, ProductCategorizer.CATEGORY_INTERIOR)
+        self.assertEqual(self.semen.category, ProductCategorizer.CATEGORY_LISTRIK)
+
+    def test_unchanged_table_selects_nothing(self):
+        self._age_products()
+        self.service.categorize_incremental('gemilang')
+
+        result = self.service.categorize_incremental('gemilang')
+
+        self.assertEqual(result['mode'], 'incremental')
+        self.assertEqual(result['total'], 0)
+
+    def test_price_updates_do_not_reselect_rows(self):
+        self.service.categorize_incremental('gemilang')
+        # As the vendor database services write a re-scraped price
+        GemilangProduct.objects.filter(pk=self.besi.pk).update(price=99000, updated_at=timezone.now())
+
+        result = self.service.categorize_incremental('gemilang')
+
+        self.assertEqual(result['total'], 0)
+
+    def test_empty_category_rows_are_always_selected(self):
+        self._age_products()
+        self.service.categorize_incremental('gemilang')
+        GemilangProduct.objects.filter(pk=self.besi.pk).update(category='')
+
+        result = self.service.categorize_incremental('gemilang')
+
+        self.assertEqual(result['total'], 1)
+        self.besi.refresh_from_db()
+        self.assertEqual(self.besi.category, ProductCategorizer.CATEGORY_STEEL)
+
+    def test_rules_version_change_forces_full_run(self):
+        self._age_products()
+        self.service.categorize_incremental('gemilang')
+        CategorizationWatermark.objects.filter(vendor='gemilang').update(rules_version='outdated')
+
+        result = self.service.categorize_incremental('gemilang')
+
+        self.assertEqual(result['mode'], 'full')
+        self.assertEqual(result['total'], 2)
+
+    def test_unknown_vendor(self):
+        with self.assertRaises(ValueError):
+            self.service.categorize_incremental('unknown')
+
+    def test_command_incremental_flag(self):
+        out = StringIO()
+        call_command('recategorize_products', '--vendor', 'gemilang', '--incremental', stdout=out)
+
+        self.assertIn("gemilang: 2/2 categorized", out.getvalue())
+        self.assertTrue(CategorizationWatermark.objects.filter(vendor='gemilang').exists())
@@ -0,0 +1,64 @@
+import random
+
+from django.test import SimpleTestCase
+
+from db_pricing.categorization import ProductCategorizer
+from db_pricing.keyword_matcher import KeywordAutomaton
+
+
+class KeywordAutomatonTest(SimpleTestCase):
+
+    def test_finds_overlapping_and_nested_keywords(self):
+        automaton = KeywordAutomaton({'wire', 'wire mesh', 'mesh', 'ire'})
+        self.assertEqual(automaton.find_all('wire mesh m8'), {'wire', 'wire mesh', 'mesh', 'ire'})
+
+    def test_no_match(self):
+        self.assertEqual(KeywordAutomaton({'semen'}).find_all('pasir beton'), frozenset())
+
+    def test_empty_keyword_and_text(self):
+        automaton = KeywordAutomaton({'', 'kg'})
+        self.assertEqual(automaton.find_all(''), frozenset())
+        self.assertEqual(automaton.find_all('5kg'), {'kg'})
+
+    def test_matches_substring_containment(self):
+        rng = random.Random(11)
+        for _ in range(100):
+            keywords = {''.join(rng.choice('ab c') for _ in range(rng.randint(1, 5))) for _ in range(15)}
+            automaton = KeywordAutomaton(keywords)
+            for _ in range(20):
+                text = ''.join(rng.choice('ab c') for _ in range(rng.randint(0, 30)))
+                self.assertEqual(automaton.find_all(text), {k for k in keywords if k in text})
+
+
+class CategorizerKeywordRulesTest(SimpleTestCase):
+
+    def setUp(self):
+        self.categorizer = ProductCategorizer()
+
+    def test_rules_are_compiled_once_per_class(self):
+        self.assertIs(ProductCategorizer._rules(), ProductCategorizer._rules())
+
+    def test_automaton_covers_context_terms(self):
+        hits = self.categorizer._keyword_hits('pipa conduit elektrik')
+        self.assertTrue({'pipa', 'conduit', 'elektrik'} <= hits)
+
+    def test_checks_accept_precomputed_hits(self):
+        normalized = 'fitting lampu e27'
+        hits = self.categorizer._keyword_hits(normalized)
+        self.assertTrue(self.categorizer._check_listrik(normalized, hits))
+        self.assertFalse(self.categorizer._check_pipa_air(normalized, hits))
+        self.assertEqual(self.categorizer._check_listrik(normalized), self.categorizer._check_listrik(normalized, hits))
+
+    def test_subclass_keywords_get_own_automaton(self):
+        class CustomCategorizer(ProductCategorizer):
+            ALAT_BERAT_KEYWORDS = ProductCategorizer.ALAT_BERAT_KEYWORDS | {'forklift'}
+
+        self.assertEqual(CustomCategorizer().categorize('Forklift 3 Ton'), ProductCategorizer.CATEGORY_ALAT_BERAT)
+        self.assertIsNone(ProductCategorizer().categorize('Forklift 3 Ton'))
+
+    def test_batch_matches_single(self):
+        names = ['Besi Beton 10mm', 'Lem PVC Rucika', 'Kabel NYM 3x2.5', 'Semen Gresik 40kg', 'Closet Duduk', None]
+        self.assertEqual(
+            self.categorizer.categorize_batch(names),
+            [self.categorizer.categorize(name) for name in names],
+        )
@@ -0,0 +1,74 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from api.mitra10.database_service import Mitra10DatabaseService
+from db_pricing.models import PriceObservation
+from db_pricing.price_history import PriceHistoryService, product_key
+
+
+class PriceHistoryServiceTest(TestCase):
+
+    ITEM = {"name": "Semen Gresik", "url": "https://test.com/semen", "unit": "SAK"}
+
+    def _observe(self, price, days_ago, hours=0):
+        # Anchor at noon so hour offsets never cross a day boundary
+        noon = timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        observed_at = noon - timedelta(days=days_ago, hours=hours)
+        PriceHistoryService.record_observations('gemilang', [dict(self.ITEM, price=price)], observed_at)
+
+    def test_record_observations_in_bulk(self):
+        items = [{"name": f"P{i}", "url": f"https://test.com/{i}", "unit": "PCS", "price": i * 100} for i in range(5)]
+
+        with self.assertNumQueries(3):  # savepoint, one INSERT, release
+            self.assertEqual(PriceHistoryService.record_observations('mitra10', items), 5)
+
+        self.assertEqual(PriceObservation.objects.filter(vendor='mitra10').count(), 5)
+
+    def test_invalid_price_is_skipped(self):
+        items = [dict(self.ITEM, price="n/a"), dict(self.ITEM, price=5000)]
+        self.assertEqual(PriceHistoryService.record_observations('gemilang', items), 1)
+
+    def test_write_failure_is_swallowed(self):
+        with patch.object(PriceObservation.objects, 'bulk_create', side_effect=Exception("db down")):
+            self.assertEqual(PriceHistoryService.record_observations('gemilang', [dict(self.ITEM, price=1)]), 0)
+
+    def test_price_series_window(self):
+        self._observe(60000, days_ago=40)
+        self._observe(62000, days_ago=5)
+        self._observe(65000, days_ago=1)
+
+        series = PriceHistoryService.price_series('gemilang', self.ITEM['name'], self.ITEM['url'], self.ITEM['unit'], days=30)
+
+        self.assertEqual([price for _, price in series], [62000, 65000])
+
+    def test_daily_summary(self):
+        self._observe(60000, days_ago=2, hours=1)
+        self._observe(64000, days_ago=2, hours=2)
+        self._observe(70000, days_ago=0)
+
+        summary = PriceHistoryService.daily_summary('gemilang', self.ITEM['name'], self.ITEM['url'], self.ITEM['unit'], days=7)
+
+        self.assertEqual(len(summary), 2)
+        self.assertEqual(
+            (summary[0]['min_price'], summary[0]['max_price'], summary[0]['avg_price'], summary[0]['samples']),
+            (60000, 64000, 62000.0, 2),
+        )
+        self.assertEqual(summary[1]['max_price'], 70000)
+
+    def test_location_is_part_of_tokopedia_key(self):
+        jakarta = dict(self.ITEM, location="Jakarta")
+        self.assertNotEqual(PriceHistoryService.key_for('tokopedia', jakarta), PriceHistoryService.key_for('tokopedia', self.ITEM))
+        self.assertEqual(PriceHistoryService.key_for('gemilang', jakarta), product_key(**self.ITEM))
+
+    def test_vendor_save_path_records_every_scraped_price(self):
+        service = Mitra10DatabaseService()
+        item = dict(self.ITEM, price=60000)
+        service.save_with_price_update([item])
+        # A jump large enough to be held back as an anomaly is still observed
+        service.save_with_price_update([dict(item, price=90000)])
+
+        series = PriceHistoryService.price_series('mitra10', item['name'], item['url'], item['unit'])
+        self.assertEqual([price for _, price in series], [60000, 90000])
@@ -0,0 +1,132 @@
+import json
+from datetime import timedelta
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from api.interfaces import Location, LocationScrapingResult
+from db_pricing.models import StoreLocation
+from db_pricing.store_locations import LocationRefreshError, StoreLocationRegistry, scrape_result_locations
+
+
+class StoreLocationRegistryTest(TestCase):
+
+    def setUp(self):
+        StoreLocationRegistry.lock_cache().delete(StoreLocationRegistry.LOCK_KEY.format(vendor='gemilang'))
+
+    def _store(self, names, age=timedelta(0)):
+        StoreLocationRegistry.refresh('gemilang', fetch=lambda: names)
+        StoreLocation.objects.update(refreshed_at=timezone.now() - age)
+
+    def test_cold_registry_is_fetched_once(self):
+        fetch = Mock(return_value=[Location(name="GEMILANG - A", code="A1"), "B", {"store_name": "C"}])
+
+        first = StoreLocationRegistry.locations('gemilang', fetch=fetch)
+        second = StoreLocationRegistry.locations('gemilang', fetch=fetch)
+
+        fetch.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertEqual(first, [
+            {"name": "GEMILANG - A", "code": "A1"}, {"name": "B", "code": ""}, {"name": "C", "code": ""},
+        ])
+
+    def test_cold_fetch_errors_propagate(self):
+        with self.assertRaises(RuntimeError):
+            StoreLocationRegistry.locations('gemilang', fetch=Mock(side_effect=RuntimeError("down")))
+
+    def test_failed_or_empty_refresh_keeps_stored_list(self):
+        self._store(["A", "B"])
+
+        self.assertEqual(StoreLocationRegistry.refresh('gemilang', fetch=Mock(side_effect=RuntimeError)), 0)
+        self.assertEqual(StoreLocationRegistry.refresh('gemilang', fetch=lambda: []), 0)
+
+        self.assertEqual(StoreLocationRegistry.names('gemilang', fetch=Mock()), ["A", "B"])
+
+    def test_refresh_replaces_list_and_dedupes(self):
+        self._store(["A", "B"])
+
+        self.assertEqual(StoreLocationRegistry.refresh('gemilang', fetch=lambda: ["C", "C", "A"]), 2)
+        self.assertEqual(StoreLocationRegistry.names('gemilang'), ["C", "A"])
+
+    @override_settings(STORE_LOCATION_TTL=60)
+    def test_stale_list_served_while_refreshing_in_background(self):
+        self._store(["A"], age=timedelta(minutes=5))
+        fetch = Mock()
+
+        with patch('db_pricing.store_locations.threading.Thread') as mock_thread:
+            names = StoreLocationRegistry.names('gemilang', fetch=fetch)
+            StoreLocationRegistry.names('gemilang', fetch=fetch)
+
+        self.assertEqual(names, ["A"])
+        fetch.assert_not_called()
+        # The second read finds the refresh already running
+        mock_thread.return_value.start.assert_called_once()
+
+    def test_background_refresh_releases_lock_only_on_success(self):
+        lock_key = StoreLocationRegistry.LOCK_KEY.format(vendor='gemilang')
+        cache = StoreLocationRegistry.lock_cache()
+
+        with patch.object(StoreLocationRegistry, 'refresh', return_value=0), patch('db_pricing.store_locations.connections'):
+            cache.add(lock_key, True)
+            StoreLocationRegistry._refresh_in_background('gemilang', lock_key)
+        self.assertTrue(cache.get(lock_key))
+
+        with patch.object(StoreLocationRegistry, 'refresh', return_value=3), patch('db_pricing.store_locations.connections'):
+            StoreLocationRegistry._refresh_in_background('gemilang', lock_key)
+        self.assertIsNone(cache.get(lock_key))
+
+    def test_refresh_dedupes_names_case_insensitively(self):
+        stored = StoreLocationRegistry.refresh('gemilang', fetch=lambda: ["Toko A", "toko a ", "TOKO B", "Toko B"])
+
+        self.assertEqual(stored, 2)
+        self.assertEqual(StoreLocationRegistry.names('gemilang'), ["Toko A", "TOKO B"])
+
+    def test_refresh_lock_is_taken_on_the_shared_cache(self):
+        from django.core.cache import caches
+
+        with patch('db_pricing.store_locations.threading.Thread'):
+            self.assertTrue(StoreLocationRegistry.refresh_async('gemilang'))
+        self.assertTrue(caches['shared'].get(StoreLocationRegistry.LOCK_KEY.format(vendor='gemilang')))
+
+    def test_scrape_result_locations(self):
+        self.assertEqual(scrape_result_locations({"success": True, "locations": ["A"]}), ["A"])
+        with self.assertRaises(LocationRefreshError):
+            scrape_result_locations(LocationScrapingResult(locations=[], success=False, error_message="blocked"))
+
+    @patch('api.gemilang.factory.create_gemilang_location_scraper')
+    def test_refresh_command(self, mock_factory):
+        mock_factory.return_value.scrape_locations.return_value = LocationScrapingResult(
+            locations=[Location(name="GEMILANG - A")], success=True
+        )
+        out = StringIO()
+
+        call_command('refresh_store_locations', vendor=['gemilang'], stdout=out)
+        call_command('refresh_store_locations', vendor=['gemilang'], stale_only=True, stdout=out)
+
+        mock_factory.return_value.scrape_locations.assert_called_once_with(timeout=30)
+        self.assertEqual(StoreLocationRegistry.names('gemilang'), ["GEMILANG - A"])
+        self.assertIn("skipped", out.getvalue())
+
+    @patch('api.depobangunan.views.create_depo_location_scraper')
+    @patch('api.depobangunan.views.create_depo_scraper')
+    @patch('api.mitra10.views.create_mitra10_location_scraper')
+    def test_product_scrapes_read_registry(self, mock_mitra10_factory, mock_depo_scraper, mock_depo_factory):
+        from api.depobangunan.views import scrape_products
+        from api.mitra10.views import _scrape_location_data
+
+        StoreLocationRegistry.refresh('mitra10', fetch=lambda: ["Kemang", "Cibubur"])
+        StoreLocationRegistry.refresh('depobangunan', fetch=lambda: ["Depo Bangunan - Kalimalang"])
+        mock_depo_scraper.return_value.scrape_products.return_value = Mock(
+            success=True, products=[SimpleNamespace(name="p", price=1000, url="https://x/p", unit="sak")], error_message=None, url="https://x",
+        )
+
+        response = scrape_products(RequestFactory().get('/api/depobangunan/scrape/', {'keyword': 'semen'}))
+
+        self.assertEqual(_scrape_location_data(), "Kemang, Cibubur")
+        self.assertEqual(json.loads(response.content)['products'][0]['location'], "Depo Bangunan - Kalimalang")
+        mock_mitra10_factory.assert_not_called()
+        mock_depo_factory.assert_not_called()
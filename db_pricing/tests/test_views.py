@@ -295,6 +295,41 @@ class TestPriceAnomalyViews(TestCase):
         self.assertEqual(data['data']['by_vendor']['mitra10'], 1)
         self.assertEqual(data['data']['by_vendor']['tokopedia'], 1)
     
+    def test_get_statistics_single_query_then_cached(self):
+        """Test statistics come from one grouped query and are then served from cache"""
+        with self.assertNumQueries(1):
+            first = self.client.get('/api/pricing/anomalies/statistics/').json()
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/pricing/anomalies/statistics/').json()
+        
+        self.assertEqual(first, second)
+        self.assertEqual(first['data']['by_vendor']['depobangunan'], 0)
+    
+    def test_get_statistics_snapshot_lives_in_shared_cache(self):
+        """Test the snapshot is kept in the cross-worker cache so every process sees invalidations"""
+        from django.core.cache import caches
+        from db_pricing.anomaly_service import PriceAnomalyService
+        
+        self.client.get('/api/pricing/anomalies/statistics/')
+        self.assertIsNotNone(caches['shared'].get(PriceAnomalyService.STATISTICS_CACHE_KEY))
+        
+        PriceAnomalyService.invalidate_statistics()
+        self.assertIsNone(caches['shared'].get(PriceAnomalyService.STATISTICS_CACHE_KEY))
+    
+    def test_get_statistics_refreshed_after_review(self):
+        """Test reviewing an anomaly invalidates the cached statistics"""
+        self.client.get('/api/pricing/anomalies/statistics/')
+        
+        self.client.post(
+            f'/api/pricing/anomalies/{self.anomaly1.id}/review/',
+            data=json.dumps({'status': 'approved'}),
+            content_type='application/json'
+        )
+        data = self.client.get('/api/pricing/anomalies/statistics/').json()
+        
+        self.assertEqual(data['data']['pending_count'], 0)
+        self.assertEqual(data['data']['by_status']['approved'], 2)
+    
     def test_list_anomalies_response_structure(self):
         """Test that response includes all required fields"""
         response = self.client.get('/api/pricing/anomalies/')
@@ -517,8 +552,8 @@ class TestErrorHandling(TestCase):
         """Test handling database error in statistics endpoint"""
         from unittest.mock import patch
         
-        with patch('db_pricing.views.PriceAnomaly.objects.count') as mock_count:
-            mock_count.side_effect = Exception("Database error")
+        with patch('db_pricing.anomaly_service.PriceAnomaly.objects.values') as mock_values:
+            mock_values.side_effect = Exception("Database error")
             response = self.client.get('/api/pricing/anomalies/statistics/')
         
         self.assertEqual(response.status_code, 500)
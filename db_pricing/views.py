@@ -7,6 +7,7 @@ from django.db.models import Q
 from db_pricing.utils import check_database_connection, check_gemilang_table_exists
 from db_pricing.models import PriceAnomaly
 from db_pricing.anomaly_service import PriceAnomalyService
+from db_pricing.pagination import keyset_page, pagination_info
 import json
 import logging
 
@@ -45,6 +46,26 @@ def check_database_status(request):
 
 # ==================== PRICE ANOMALY VIEWS ====================
 
+def _serialize_anomaly(anomaly):
+    return {
+        'id': anomaly.id,
+        'vendor': anomaly.vendor,
+        'product_name': anomaly.product_name,
+        'product_url': anomaly.product_url,
+        'unit': anomaly.unit,
+        'location': anomaly.location,
+        'old_price': anomaly.old_price,
+        'new_price': anomaly.new_price,
+        'change_percent': float(anomaly.change_percent),
+        'price_difference': anomaly.price_difference,
+        'is_price_increase': anomaly.is_price_increase,
+        'status': anomaly.status,
+        'detected_at': anomaly.detected_at.isoformat(),
+        'reviewed_at': anomaly.reviewed_at.isoformat() if anomaly.reviewed_at else None,
+        'notes': anomaly.notes,
+    }
+
+
 @ensure_csrf_cookie
 @require_http_methods(["GET"])
 def list_price_anomalies(request):
@@ -55,16 +76,23 @@ def list_price_anomalies(request):
     - status: Filter by status (pending, reviewed, approved, rejected)
     - vendor: Filter by vendor (gemilang, mitra10, tokopedia, depobangunan, juragan_material)
     - page: Page number (default: 1)
-    - page_size: Items per page (default: 20, max: 100)
+    - page_size: Items per page (default: 20, min: 1, max: 100)
     - search: Search in product name
+    
+    Cursor mode (used when ``cursor`` is present, empty for the first page):
+    - cursor: ``next_cursor`` from the previous response
+    - include_total: ``true`` to also return total_count (one extra COUNT)
+    In cursor mode pages are fetched by ``(detected_at, id)`` instead of
+    OFFSET and ``search`` matches a product-name prefix, so both can use
+    indexes and every page costs the same.
     """
     try:
         # Get query parameters
         status = request.GET.get('status', None)
         vendor = request.GET.get('vendor', None)
-        page_num = int(request.GET.get('page', 1))
-        page_size = min(int(request.GET.get('page_size', 20)), 100)
+        page_size = max(1, min(int(request.GET.get('page_size', 20)), 100))
         search = request.GET.get('search', '').strip()
+        cursor_mode = 'cursor' in request.GET
         
         # Build queryset
         queryset = PriceAnomaly.objects.all()
@@ -76,9 +104,24 @@ def list_price_anomalies(request):
         if vendor:
             queryset = queryset.filter(vendor=vendor)
         
-        if search:
+        if search and cursor_mode:
+            queryset = queryset.filter(product_name__istartswith=search)
+        elif search:
             queryset = queryset.filter(product_name__icontains=search)
         
+        if cursor_mode:
+            cursor = request.GET.get('cursor', '').strip() or None
+            include_total = request.GET.get('include_total', '').lower() == 'true'
+            total_count = queryset.count() if include_total else None
+            rows, next_cursor = keyset_page(queryset, page_size, cursor)
+            return JsonResponse({
+                'success': True,
+                'data': [_serialize_anomaly(anomaly) for anomaly in rows],
+                'pagination': pagination_info(page_size, next_cursor, cursor, total_count),
+            })
+        
+        page_num = int(request.GET.get('page', 1))
+        
         # Order by newest first
         queryset = queryset.order_by('-detected_at')
         
@@ -87,26 +130,7 @@ def list_price_anomalies(request):
         page = paginator.get_page(page_num)
         
         # Serialize anomalies
-        anomalies = [
-            {
-                'id': anomaly.id,
-                'vendor': anomaly.vendor,
-                'product_name': anomaly.product_name,
-                'product_url': anomaly.product_url,
-                'unit': anomaly.unit,
-                'location': anomaly.location,
-                'old_price': anomaly.old_price,
-                'new_price': anomaly.new_price,
-                'change_percent': float(anomaly.change_percent),
-                'price_difference': anomaly.price_difference,
-                'is_price_increase': anomaly.is_price_increase,
-                'status': anomaly.status,
-                'detected_at': anomaly.detected_at.isoformat(),
-                'reviewed_at': anomaly.reviewed_at.isoformat() if anomaly.reviewed_at else None,
-                'notes': anomaly.notes,
-            }
-            for anomaly in page
-        ]
+        anomalies = [_serialize_anomaly(anomaly) for anomaly in page]
         
         return JsonResponse({
             'success': True,
@@ -242,30 +266,9 @@ def get_anomaly_statistics(request):
     Returns counts by status and vendor
     """
     try:
-        # Get counts by status
-        status_counts = {}
-        for status_code, status_name in PriceAnomaly.STATUS_CHOICES:
-            status_counts[status_code] = PriceAnomaly.objects.filter(status=status_code).count()
-        
-        # Get counts by vendor
-        vendor_counts = {}
-        for vendor_code, vendor_name in PriceAnomaly.VENDOR_CHOICES:
-            vendor_counts[vendor_code] = PriceAnomaly.objects.filter(vendor=vendor_code).count()
-        
-        # Get total count
-        total_count = PriceAnomaly.objects.count()
-        
-        # Get pending count
-        pending_count = PriceAnomaly.objects.filter(status='pending').count()
-        
         return JsonResponse({
             'success': True,
-            'data': {
-                'total_count': total_count,
-                'pending_count': pending_count,
-                'by_status': status_counts,
-                'by_vendor': vendor_counts,
-            }
+            'data': PriceAnomalyService.get_statistics()
         })
         
     except Exception as e:
@@ -198,6 +198,59 @@ CSRF_COOKIE_SAMESITE = 'Lax'
 CSRF_COOKIE_SECURE = env.bool('CSRF_COOKIE_SECURE', default=not DEBUG)  # True in production (HTTPS)
 CSRF_TRUSTED_ORIGINS = env.list('CSRF_TRUSTED_ORIGINS', default=[])
 
+# Price anomaly thresholds per product category (see db_pricing/anomaly_engine.py)
+# e.g. PRICE_ANOMALY_THRESHOLDS='{"default": {"pct": 15, "z": 3.5}, "Alat Berat": {"pct": 25}}'
+PRICE_ANOMALY_THRESHOLDS = env.json('PRICE_ANOMALY_THRESHOLDS', default={})
+
+# Dashboard search: vendors are scraped concurrently. Each vendor (and each
+# store-location lookup) gets DASHBOARD_VENDOR_DEADLINE seconds; the page is
+# rendered with whatever arrived once DASHBOARD_SEARCH_BUDGET seconds have
+# passed. Keep the budget below the gunicorn --timeout (120 s).
+DASHBOARD_VENDOR_DEADLINE = env.float('DASHBOARD_VENDOR_DEADLINE', default=60.0)
+DASHBOARD_SEARCH_BUDGET = env.float('DASHBOARD_SEARCH_BUDGET', default=90.0)
+# Vendor scrapes and location lookups run on two shared pools of this many
+# threads per process. Scrapes that miss the deadline keep their thread until
+# they finish, so this caps the scrapers (and browsers) alive at once; tasks
+# still queued when a search gives up are cancelled.
+DASHBOARD_SEARCH_WORKERS = env.int('DASHBOARD_SEARCH_WORKERS', default=10)
+
+# Dashboard search results are cached per normalized keyword for
+# DASHBOARD_SEARCH_CACHE_TTL seconds (0 disables the cache). Expired entries
+# are served for up to DASHBOARD_SEARCH_CACHE_STALE more seconds while a
+# background refresh replaces them.
+DASHBOARD_SEARCH_CACHE_TTL = env.float('DASHBOARD_SEARCH_CACHE_TTL', default=300.0)
+DASHBOARD_SEARCH_CACHE_STALE = env.float('DASHBOARD_SEARCH_CACHE_STALE', default=900.0)
+
+# Vendor store locations are read from the store_locations registry and
+# refreshed in the background once older than STORE_LOCATION_TTL seconds
+# (see db_pricing.store_locations and the refresh_store_locations command).
+STORE_LOCATION_TTL = env.float('STORE_LOCATION_TTL', default=86400.0)
+# Cache alias holding the per-vendor refresh lock, so one worker scrapes a
+# stale vendor instead of every worker at once
+STORE_LOCATION_LOCK_CACHE_ALIAS = env.str('STORE_LOCATION_LOCK_CACHE_ALIAS', default='shared')
+
+# Caches. "shared" is visible to every worker process on the host (file based
+# by default; point it at Redis or memcached to share across hosts) and holds
+# government wage data and dashboard search results. The file based backend's
+# add() is not atomic, so two workers can still fill the same government wage
+# region at once; use Redis or memcached where that matters.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'shared': {
+        'BACKEND': env.str('SHARED_CACHE_BACKEND', default='django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': env.str('SHARED_CACHE_LOCATION', default=str(BASE_DIR / '.cache' / 'shared')),
+        'TIMEOUT': 900,
+        'OPTIONS': {'MAX_ENTRIES': env.int('SHARED_CACHE_MAX_ENTRIES', default=1000)},
+    },
+}
+# Cache alias for government wage data ('' keeps it per process), dashboard
+# search results and the price anomaly statistics snapshot
+GOV_WAGE_CACHE_ALIAS = env.str('GOV_WAGE_CACHE_ALIAS', default='shared')
+DASHBOARD_SEARCH_CACHE_ALIAS = env.str('DASHBOARD_SEARCH_CACHE_ALIAS', default='shared')
+PRICE_ANOMALY_STATISTICS_CACHE_ALIAS = env.str('PRICE_ANOMALY_STATISTICS_CACHE_ALIAS', default='shared')
+
 # Test Configuration
 # Test IP addresses from .env (RFC 1918 private addresses for testing only)
 TEST_IP_ALLOWED = env.str('TEST_IP_ALLOWED')